@@ -25,6 +25,13 @@ frappe.ui.form.on("AhmadCSS Settings", {
                 }
             );
         }, __('Actions'));
+        
+        // Add performance stats button (System Managers only)
+        if (frappe.user.has_role('System Manager')) {
+            frm.add_custom_button(__('Performance Stats'), function() {
+                showPerformanceStats();
+            }, __('Actions'));
+        }
     },
     
     after_save: function(frm) {
@@ -106,5 +113,62 @@ function applyThemeChanges(frm) {
         document.body.classList.remove('ahmadcss-dark');
     }
     
-    // Cache will be cleared on next page load automatically
+    // Pick up the regenerated theme stylesheet
+    if (window.AhmadCSS && AhmadCSS.colorTheme) {
+        AhmadCSS.colorTheme.loadThemeFromAPI();
+    }
+}
+
+function showPerformanceStats() {
+    frappe.call({
+        method: 'ahmadcss.perf.get_stats',
+        callback: function(r) {
+            if (!r.message) return;
+            
+            const stats = r.message;
+            const format = (value, unit) => value === null || value === undefined ? '-' : `${value} ${unit}`;
+            const rows = Object.entries(stats.metrics).map(([metric, data]) => `
+                <tr>
+                    <td>${metric}</td>
+                    <td>${data.calls || 0}</td>
+                    <td>${format(data.latency_ms.p50, 'ms')}</td>
+                    <td>${format(data.latency_ms.p95, 'ms')}</td>
+                    <td>${format(data.latency_ms.p99, 'ms')}</td>
+                    <td>${data.local_cache_hit || 0} / ${data.redis_cache_hit || 0} / ${data.cache_miss || 0}</td>
+                    <td>${format(data.payload_bytes.p50, 'B')}</td>
+                </tr>
+            `).join('');
+            
+            const dialog = new frappe.ui.Dialog({
+                title: __('AhmadCSS Performance'),
+                size: 'extra-large',
+                fields: [{ fieldtype: 'HTML', fieldname: 'stats' }],
+                primary_action_label: __('Reset'),
+                primary_action: function() {
+                    frappe.call({ method: 'ahmadcss.perf.reset_stats', type: 'POST' }).then(() => dialog.hide());
+                }
+            });
+            dialog.fields_dict.stats.$wrapper.html(`
+                <p class="text-muted">
+                    ${__('Sample rate')}: ${stats.sample_rate * 100}% ·
+                    ${__('Cache invalidations')}: ${stats.events.invalidate_theme_cache}
+                </p>
+                <table class="table table-bordered">
+                    <thead>
+                        <tr>
+                            <th>${__('Method')}</th>
+                            <th>${__('Calls (est.)')}</th>
+                            <th>p50</th>
+                            <th>p95</th>
+                            <th>p99</th>
+                            <th>${__('Cache local / Redis / miss')}</th>
+                            <th>${__('Payload p50')}</th>
+                        </tr>
+                    </thead>
+                    <tbody>${rows}</tbody>
+                </table>
+            `);
+            dialog.show();
+        }
+    });
 }
@@ -1,9 +1,20 @@
 # Copyright (c) 2026, ahmaddev and contributors
 # For license information, please see license.txt
 
+from functools import partial
+
 import frappe
 from frappe.model.document import Document
 
+from ahmadcss import preferences
+from ahmadcss import settings as settings_reader
+from ahmadcss.api import publish_theme_change
+from ahmadcss.cache import invalidate_theme_cache
+from ahmadcss.compiler import enqueue_compile
+from ahmadcss.custom_code import CODE_FIELDS, check, get_custom_code_urls, publish
+from ahmadcss.logo import check_logo, get_logo_variants
+from ahmadcss.theme_css import get_theme_css_url
+
 
 class AhmadCSSSettings(Document):
     def validate(self):
@@ -16,77 +27,49 @@ class AhmadCSSSettings(Document):
         
         if self.sidebar_width and (self.sidebar_width < 200 or self.sidebar_width > 400):
             frappe.throw("Sidebar Width must be between 200 and 400")
+        
+        # Minify Custom CSS / JS in memory, so a snippet that does not parse is rejected;
+        # nothing is written until the save is committed (see publish_files)
+        self.flags.minified_code = {}
+        for fieldname in CODE_FIELDS:
+            if (self.get(fieldname) or "").strip():
+                self.flags.minified_code[fieldname] = check(fieldname, self.get(fieldname))
+        
+        # Likewise, an unreadable logo upload is rejected before anything is resized
+        if self.show_custom_logo and self.custom_logo:
+            check_logo(self.custom_logo)
     
     def on_update(self):
-        """Clear cache when settings are updated"""
-        frappe.clear_cache()
+        """Clear theme caches when settings are updated"""
+        # Files first, so the stylesheet and payloads built below find them
+        frappe.db.after_commit.add(self.publish_files)
+        # Only drop what depends on these settings, once the write is visible
+        frappe.db.after_commit.add(invalidate_theme_cache)
+        # Regenerate the theme stylesheet now rather than on the next page view
+        frappe.db.after_commit.add(get_theme_css_url)
+        frappe.db.after_commit.add(enqueue_compile)
+        # Open pages refresh their theme from this instead of polling on every load
+        frappe.db.after_commit.add(partial(publish_theme_change, settings_reader.get_version(self.modified)))
         
+    def publish_files(self):
+        """Write the Custom CSS / JS files and logo variants of a committed save"""
+        # Empty when validate() was skipped; payload builds then publish what is missing
+        for fieldname, minified in (self.flags.get("minified_code") or {}).items():
+            try:
+                publish(fieldname, self.get(fieldname), minified)
+            except Exception:
+                frappe.log_error(title=f"AhmadCSS {fieldname} Error")
+        get_logo_variants(self)
+    
     @staticmethod
     def get_settings():
-        """Get AhmadCSS settings as dict"""
+        """Get AhmadCSS settings as dict, with the URLs of the published custom CSS / JS instead of their code"""
         try:
-            settings = frappe.get_single("AhmadCSS Settings")
+            values = settings_reader.get_settings_values()
             return {
-                # General
-                "enable_theme": settings.enable_theme,
-                "color_theme": getattr(settings, 'color_theme', 'Silver'),
-                "dark_mode": settings.dark_mode,
-                "enable_animations": settings.enable_animations,
-                "animation_speed": settings.animation_speed or "Normal",
-                
-                # Header
-                "header_style": getattr(settings, 'header_style', 'Gradient'),
-                "header_gradient_start": getattr(settings, 'header_gradient_start', '#0f3b4a'),
-                "header_gradient_end": getattr(settings, 'header_gradient_end', '#0f766e'),
-                "header_blur": getattr(settings, 'header_blur', 30),
-                "show_custom_logo": settings.show_custom_logo,
-                "custom_logo": settings.custom_logo,
-                
-                # Body
-                "body_gradient_start": getattr(settings, 'body_gradient_start', '#dceef0'),
-                "body_gradient_middle": getattr(settings, 'body_gradient_middle', '#edf5f3'),
-                "body_gradient_end": getattr(settings, 'body_gradient_end', '#efe1cd'),
-                "enable_glassmorphism": settings.enable_glassmorphism,
-                "glass_blur": settings.glass_blur or 20,
-                "glass_opacity": settings.glass_opacity or 72,
-                
-                # Sidebar
-                "sidebar_style": settings.sidebar_style or "Glass",
-                "sidebar_gradient_start": getattr(settings, 'sidebar_gradient_start', '#1e1e2e'),
-                "sidebar_gradient_end": getattr(settings, 'sidebar_gradient_end', '#2d2d3f'),
-                "sidebar_width": settings.sidebar_width or 260,
-                "sidebar_blur": settings.sidebar_blur or 20,
-                "sidebar_position": settings.sidebar_position or "Left",
-                
-                # Footer
-                "footer_style": getattr(settings, 'footer_style', 'Gradient'),
-                "footer_gradient_start": getattr(settings, 'footer_gradient_start', '#1e1e2e'),
-                "footer_gradient_end": getattr(settings, 'footer_gradient_end', '#2d2d3f'),
-                "footer_blur": getattr(settings, 'footer_blur', 10),
-                "show_footer": getattr(settings, 'show_footer', 1),
-                
-                # Typography
-                "font_family": settings.font_family or "Cairo",
-                "font_size_base": settings.font_size_base or 14,
-                "arabic_font": settings.arabic_font or "Cairo",
-                "enable_custom_fonts": settings.enable_custom_fonts,
-                
-                # Colors
-                "primary_color": settings.primary_color or "#0f766e",
-                "secondary_color": settings.secondary_color or "#d97706",
-                "success_color": getattr(settings, 'success_color', '#10b981'),
-                "warning_color": getattr(settings, 'warning_color', '#f59e0b'),
-                "error_color": getattr(settings, 'error_color', '#ef4444'),
-                
-                # Advanced
-                "custom_css": settings.custom_css or "",
-                "custom_js": settings.custom_js or "",
-                
-                # Legacy support (for backward compatibility)
-                "navbar_style": getattr(settings, 'header_style', 'Gradient'),
-                "navbar_blur": getattr(settings, 'header_blur', 30),
-                "gradient_start": getattr(settings, 'body_gradient_start', '#dceef0'),
-                "gradient_end": getattr(settings, 'body_gradient_end', '#efe1cd'),
+                **settings_reader.get_public_settings(values),
+                **get_custom_code_urls(values),
+                **get_logo_variants(values),
             }
         except Exception:
             return get_default_settings()
@@ -94,68 +77,7 @@ class AhmadCSSSettings(Document):
 
 def get_default_settings():
     """Return default settings"""
-    return {
-        # General
-        "enable_theme": 1,
-        "color_theme": "Silver",
-        "dark_mode": 0,
-        "enable_animations": 1,
-        "animation_speed": "Normal",
-        
-        # Header
-        "header_style": "Gradient",
-        "header_gradient_start": "#0f3b4a",
-        "header_gradient_end": "#0f766e",
-        "header_blur": 30,
-        "show_custom_logo": 0,
-        "custom_logo": None,
-        
-        # Body
-        "body_gradient_start": "#dceef0",
-        "body_gradient_middle": "#edf5f3",
-        "body_gradient_end": "#efe1cd",
-        "enable_glassmorphism": 1,
-        "glass_blur": 20,
-        "glass_opacity": 72,
-        
-        # Sidebar
-        "sidebar_style": "Glass",
-        "sidebar_gradient_start": "#1e1e2e",
-        "sidebar_gradient_end": "#2d2d3f",
-        "sidebar_width": 260,
-        "sidebar_blur": 20,
-        "sidebar_position": "Left",
-        
-        # Footer
-        "footer_style": "Gradient",
-        "footer_gradient_start": "#1e1e2e",
-        "footer_gradient_end": "#2d2d3f",
-        "footer_blur": 10,
-        "show_footer": 1,
-        
-        # Typography
-        "font_family": "Cairo",
-        "font_size_base": 14,
-        "arabic_font": "Cairo",
-        "enable_custom_fonts": 1,
-        
-        # Colors
-        "primary_color": "#0f766e",
-        "secondary_color": "#d97706",
-        "success_color": "#10b981",
-        "warning_color": "#f59e0b",
-        "error_color": "#ef4444",
-        
-        # Advanced
-        "custom_css": "",
-        "custom_js": "",
-        
-        # Legacy
-        "navbar_style": "Gradient",
-        "navbar_blur": 30,
-        "gradient_start": "#dceef0",
-        "gradient_end": "#efe1cd",
-    }
+    return settings_reader.get_default_public_settings()
 
 
 @frappe.whitelist()
@@ -166,15 +88,13 @@ def get_ahmadcss_settings():
 
 @frappe.whitelist()
 def toggle_dark_mode(dark_mode=None):
-    """Toggle dark mode setting"""
-    settings = frappe.get_single("AhmadCSS Settings")
-    if dark_mode is not None:
-        settings.dark_mode = int(dark_mode)
-    else:
-        settings.dark_mode = not settings.dark_mode
-    settings.save()
-    frappe.clear_cache()
-    return {"dark_mode": settings.dark_mode}
+    """Toggle dark mode for the current user; the site-wide setting stays the default"""
+    if dark_mode is None:
+        current = preferences.get_preferences().get("dark_mode")
+        if current is None:
+            current = settings_reader.get_settings_values()["dark_mode"]
+        dark_mode = not current
+    return preferences.set_preference("dark_mode", dark_mode)
 
 
 # قائمة الحقول المسموح بتعديلها
@@ -204,14 +124,13 @@ def update_setting(field, value):
         frappe.log_error(f"Attempted to update invalid field: {field}")
         return {"success": False, "message": "Invalid field"}
     
-    try:
-        settings = frappe.get_single("AhmadCSS Settings")
-        if hasattr(settings, field):
-            setattr(settings, field, value)
-            settings.save()
-            frappe.clear_cache()
-            return {"success": True, "field": field, "value": value}
+    if settings_reader.LEGACY_ALIASES.get(field, field) not in settings_reader.FIELDTYPES:
         return {"success": False, "message": "Field not found"}
+
+    try:
+        # Unchanged values are not saved again
+        settings_reader.update_settings({field: value}, ALLOWED_SETTINGS_FIELDS)
+        return {"success": True, "field": field, "value": value}
     except Exception as e:
         frappe.log_error(f"Error updating setting {field}: {str(e)}")
         return {"success": False, "message": str(e)}
@@ -3,123 +3,132 @@
 
 import frappe
 from frappe import _
+from werkzeug.wrappers import Response
+
+from ahmadcss import perf
+from ahmadcss.artifacts import get_artifact_urls, register_site_artifacts
+from ahmadcss.assets import get_css_manifest
+from ahmadcss.cache import get_content_hash, get_versioned_value, local_cache, register_theme_cache_key
+from ahmadcss.compiler import get_compiled_css_url
+from ahmadcss.custom_code import get_custom_code_urls
+from ahmadcss.logo import get_logo_variants
+from ahmadcss.preferences import get_preferences
+from ahmadcss.settings import (
+    FIELDTYPES,
+    LEGACY_ALIASES,
+    SCHEMA_VERSION,
+    get_default_public_settings,
+    get_overrides,
+    get_public_settings,
+    get_settings_values,
+    update_settings,
+)
+from ahmadcss.theme_css import get_theme_css_url
+
+THEME_PAYLOAD_KEY = register_theme_cache_key("ahmadcss:theme_payload")
+
+# Realtime event telling open desk pages the theme settings changed
+THEME_CHANGED_EVENT = "ahmadcss_theme_changed"
+
+# Browsers and proxies may reuse the payload briefly, then revalidate with the ETag
+THEME_MAX_AGE = 60
+THEME_STALE_WHILE_REVALIDATE = 86400
 
 
 @frappe.whitelist(allow_guest=True)
+@perf.timed("get_theme_settings")
 def get_theme_settings():
     """Get public theme settings - available for all users including guests"""
+    payload = with_css_assets(get_theme_payload())
+    if getattr(frappe.local, "request", None) is None:
+        return payload["settings"]
+
+    response = build_conditional_response(payload)
+    perf.record_payload(response.get_data())
+    return response
+
+
+def get_theme_payload():
+    """Return the cached theme settings together with their content hash"""
     try:
-        if frappe.db.exists("DocType", "AhmadCSS Settings"):
-            settings = frappe.get_single("AhmadCSS Settings")
-            return {
-                # General
-                "enable_theme": settings.enable_theme,
-                "color_theme": getattr(settings, 'color_theme', 'Silver'),
-                "dark_mode": settings.dark_mode,
-                "enable_animations": settings.enable_animations,
-                "animation_speed": settings.animation_speed or "Normal",
-                
-                # Header
-                "header_style": getattr(settings, 'header_style', 'Gradient'),
-                "header_gradient_start": getattr(settings, 'header_gradient_start', '#0f3b4a'),
-                "header_gradient_end": getattr(settings, 'header_gradient_end', '#0f766e'),
-                "header_blur": getattr(settings, 'header_blur', 30),
-                
-                # Body
-                "body_gradient_start": getattr(settings, 'body_gradient_start', '#dceef0'),
-                "body_gradient_middle": getattr(settings, 'body_gradient_middle', '#edf5f3'),
-                "body_gradient_end": getattr(settings, 'body_gradient_end', '#efe1cd'),
-                "enable_glassmorphism": settings.enable_glassmorphism,
-                "glass_blur": settings.glass_blur or 20,
-                "glass_opacity": settings.glass_opacity or 72,
-                
-                # Sidebar
-                "sidebar_style": settings.sidebar_style or "Glass",
-                "sidebar_gradient_start": getattr(settings, 'sidebar_gradient_start', '#1e1e2e'),
-                "sidebar_gradient_end": getattr(settings, 'sidebar_gradient_end', '#2d2d3f'),
-                "sidebar_width": settings.sidebar_width or 260,
-                "sidebar_blur": settings.sidebar_blur or 20,
-                
-                # Footer
-                "footer_style": getattr(settings, 'footer_style', 'Gradient'),
-                "footer_gradient_start": getattr(settings, 'footer_gradient_start', '#1e1e2e'),
-                "footer_gradient_end": getattr(settings, 'footer_gradient_end', '#2d2d3f'),
-                "show_footer": getattr(settings, 'show_footer', 1),
-                
-                # Typography
-                "font_family": settings.font_family or "Cairo",
-                
-                # Colors
-                "primary_color": settings.primary_color or "#0f766e",
-                "secondary_color": settings.secondary_color or "#d97706",
-                
-                # Legacy support
-                "navbar_style": getattr(settings, 'header_style', 'Gradient'),
-                "navbar_blur": getattr(settings, 'header_blur', 30),
-            }
+        return get_versioned_value(THEME_PAYLOAD_KEY, build_theme_payload)
     except Exception:
-        pass
-    
-    return get_default_theme()
+        settings = get_default_theme()
+        return {"settings": settings, "hash": get_content_hash(settings), "overrides": {}}
+
+
+def with_css_assets(payload):
+    """Add the hashed stylesheet URLs of the current build, which change without a settings save"""
+    assets, assets_hash = get_css_manifest()
+    if not assets:
+        return payload
+
+    key = ("css_assets", payload["hash"], assets_hash)
+    combined = local_cache.get(key)
+    if combined is None:
+        combined = {
+            "settings": {**payload["settings"], "css_assets": assets},
+            "hash": f"{payload['hash']}-{assets_hash}",
+        }
+        local_cache.set(key, combined)
+    return combined
+
+
+def build_theme_payload():
+    """Build the cacheable payload for get_theme_settings"""
+    values = get_settings_values()
+    settings = get_public_settings(values)
+    settings["theme_css"] = get_theme_css_url(values)
+    settings["compiled_css"] = get_compiled_css_url(values)
+    settings["version"] = values["version"]
+    code_urls = get_custom_code_urls(values)
+    # The script runs on the desk only: its URL goes to the boot, not to the settings guests can read
+    custom_js_url = code_urls.pop("custom_js_url", None)
+    settings.update(code_urls)
+    settings.update(get_logo_variants(values))
+    payload = {
+        "settings": settings,
+        "hash": get_content_hash(settings),
+        "overrides": get_overrides(settings),
+        "custom_js_url": custom_js_url,
+    }
+    register_site_artifacts(get_theme_artifact_urls(payload))
+    return payload
+
+
+def get_theme_artifact_urls(payload):
+    """URLs of the generated files a theme payload links, the desk-only Custom JS included"""
+    return get_artifact_urls({**payload["settings"], "custom_js_url": payload.get("custom_js_url")})
+
+
+def publish_theme_change(version):
+    """Tell open desk pages the settings are now at ``version``; each fetches them once.
+
+    Pages whose cached settings already carry that version skip the request.
+    """
+    frappe.publish_realtime(THEME_CHANGED_EVENT, {"version": version})
+
+
+def build_conditional_response(payload):
+    """Answer with 304 when the client already holds this payload, else send it with an ETag"""
+    if frappe.request.if_none_match.contains_weak(payload["hash"]):
+        response = Response(status=304)
+    else:
+        response = Response(
+            frappe.as_json({"message": payload["settings"]}, indent=None, separators=(",", ":")),
+            content_type="application/json",
+        )
+
+    response.set_etag(payload["hash"])
+    response.headers["Cache-Control"] = (
+        f"public, max-age={THEME_MAX_AGE}, stale-while-revalidate={THEME_STALE_WHILE_REVALIDATE}"
+    )
+    return response
 
 
 def get_default_theme():
     """Return default theme settings"""
-    return {
-        # General
-        "enable_theme": 1,
-        "color_theme": "Silver",
-        "dark_mode": 0,
-        "enable_animations": 1,
-        "animation_speed": "Normal",
-
-        # Header
-        "header_style": "Gradient",
-        "header_gradient_start": "#0f3b4a",
-        "header_gradient_end": "#0f766e",
-        "header_blur": 30,
-        "show_custom_logo": 0,
-
-        # Body
-        "body_gradient_start": "#dceef0",
-        "body_gradient_middle": "#edf5f3",
-        "body_gradient_end": "#efe1cd",
-        "enable_glassmorphism": 1,
-        "glass_blur": 20,
-        "glass_opacity": 72,
-
-        # Sidebar
-        "sidebar_style": "Glass",
-        "sidebar_gradient_start": "#1e1e2e",
-        "sidebar_gradient_end": "#2d2d3f",
-        "sidebar_width": 260,
-        "sidebar_blur": 20,
-        "sidebar_position": "Left",
-
-        # Footer
-        "footer_style": "Gradient",
-        "footer_gradient_start": "#1e1e2e",
-        "footer_gradient_end": "#2d2d3f",
-        "footer_blur": 10,
-        "show_footer": 1,
-
-        # Typography
-        "font_family": "Cairo",
-        "font_size_base": 14,
-        "arabic_font": "Cairo",
-        "enable_custom_fonts": 1,
-
-        # Colors
-        "primary_color": "#0f766e",
-        "secondary_color": "#d97706",
-        "success_color": "#10b981",
-        "warning_color": "#f59e0b",
-        "error_color": "#ef4444",
-
-        # Legacy
-        "navbar_style": "Gradient",
-        "navbar_blur": 30,
-    }
+    return get_default_public_settings()
 
 
 # قائمة الحقول المسموح بتعديلها
@@ -143,23 +152,15 @@ ALLOWED_THEME_FIELDS = [
 @frappe.whitelist()
 def save_theme_settings(settings):
     """Save theme settings with validation"""
-    import json
-    
     try:
-        if isinstance(settings, str):
-            settings = json.loads(settings)
-        
-        if not frappe.db.exists("DocType", "AhmadCSS Settings"):
-            return {"success": False, "message": _("Settings not configured")}
-        
-        doc = frappe.get_single("AhmadCSS Settings")
-        for key, value in settings.items():
-            if key in ALLOWED_THEME_FIELDS and hasattr(doc, key):
-                setattr(doc, key, value)
-        
-        doc.save()
-        frappe.clear_cache()
-        
+        settings = frappe.parse_json(settings)
+        changes = {
+            key: value
+            for key, value in settings.items()
+            if key in ALLOWED_THEME_FIELDS and LEGACY_ALIASES.get(key, key) in FIELDTYPES
+        }
+        update_settings(changes, ALLOWED_THEME_FIELDS)
+
         return {"success": True, "message": _("Settings saved successfully")}
     except Exception as e:
         # Truncate error message for logging
@@ -168,6 +169,25 @@ def save_theme_settings(settings):
         return {"success": False, "message": error_msg}
 
 
+@frappe.whitelist(methods=["POST", "PATCH"])
+def patch_theme_settings(changes, version=None):
+    """Apply several settings changes in one write.
+
+    Only fields whose value differs from the stored one are written; nothing is
+    saved when none do. Pass the ``version`` from the theme payload to have the
+    patch rejected if the settings were saved by someone else in the meantime.
+    """
+    try:
+        changed, version = update_settings(frappe.parse_json(changes), ALLOWED_THEME_FIELDS, version)
+    except frappe.TimestampMismatchError as e:
+        frappe.db.rollback()
+        return {"success": False, "conflict": True, "version": get_settings_values()["version"], "message": str(e)}
+    except frappe.ValidationError as e:
+        return {"success": False, "message": str(e)}
+
+    return {"success": True, "changed": list(changed), "version": version}
+
+
 # تم نقل toggle_dark_mode إلى ahmadcss_settings.py لتجنب التكرار
 # استخدم: ahmadcss.ahmadcss.doctype.ahmadcss_settings.ahmadcss_settings.toggle_dark_mode
 
@@ -176,6 +196,8 @@ def save_theme_settings(settings):
 def reset_theme():
     """Reset theme to default"""
     defaults = get_default_theme()
+    # Keep the uploaded logo; only the theme is reset
+    defaults.pop("custom_logo", None)
     
     doc = frappe.get_single("AhmadCSS Settings")
     
@@ -186,11 +208,28 @@ def reset_theme():
     doc.custom_css = ""
     doc.custom_js = ""
     doc.save()
-    frappe.clear_cache()
     
     return {"success": True, "message": _("Theme reset to defaults")}
 
 
+@perf.timed("get_boot_info")
 def get_boot_info(bootinfo):
-    """Add theme settings to boot info"""
-    bootinfo.ahmadcss = get_theme_settings()
+    """Add the theme to boot info as the fields that differ from the defaults.
+
+    The JS bundle ships the defaults table for ``schema`` and rebuilds the full
+    settings from ``overrides``; a browser already holding ``hash`` skips even that.
+    """
+    payload = get_theme_payload()
+    user_preferences = get_preferences()
+
+    overrides, settings_hash = payload["overrides"], payload["hash"]
+    if user_preferences:
+        overrides = {**overrides, **user_preferences}
+        settings_hash = get_content_hash([settings_hash, user_preferences])
+
+    bootinfo.ahmadcss = {"schema": SCHEMA_VERSION, "hash": settings_hash, "overrides": overrides}
+    if payload.get("custom_js_url") and frappe.session.user != "Guest":
+        bootinfo.ahmadcss["custom_js_url"] = payload["custom_js_url"]
+    bootinfo.ahmadcss_preferences = user_preferences
+    bootinfo.ahmadcss_assets = get_css_manifest()[0]
+    perf.record_payload([bootinfo.ahmadcss, user_preferences])
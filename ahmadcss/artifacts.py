@@ -0,0 +1,222 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Bench-wide bookkeeping for the files generated from AhmadCSS Settings.
+
+Generated files (``theme-*.css``, ``main-*.css``, ``custom-*.css/js``, ``logo-*``) are
+written to ``sites/assets/ahmadcss``, which all sites of a bench share, under
+content-hashed names. This module keeps three Redis hashes next to them, under
+keys shared by every site:
+
+- an index from a hash of the normalised settings to the file built from them,
+  so a site whose settings match another site's reuses that file unrendered;
+- the files each site currently references;
+- when each file was last referenced, so files no site uses any more can be
+  evicted least recently used first.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import time
+
+import frappe
+from frappe.utils import get_sites
+
+from ahmadcss.settings import SETTINGS_FIELDS
+
+STORE_KEY = "ahmadcss:artifacts:index"  # "<name>:<settings hash>": URL
+USED_KEY = "ahmadcss:artifacts:used"  # URL: last referenced (unix time)
+REFS_KEY = "ahmadcss:artifacts:refs"  # site: JSON list of URLs
+EVICTED_KEY = "ahmadcss:artifacts:evicted"
+
+# Settings keys holding the URLs (or srcsets) of files generated from the settings
+ARTIFACT_KEYS = (
+    "theme_css",
+    "compiled_css",
+    "custom_css_url",
+    "custom_js_url",
+    "logo_src",
+    "logo_srcset",
+    "logo_srcset_avif",
+)
+
+ARTIFACT_FOLDERS = ("css", "js", "images")
+ARTIFACT_PATTERN = re.compile(
+    r"^(?:(theme|main|custom)-[0-9a-f]+\.(css|js)|logo-[0-9a-f]+(-\dx\.(webp|avif)|\.svg|\.json))$"
+)
+COMPRESSED_SUFFIXES = ("", ".gz", ".br")
+
+# Unreferenced files are kept this long, for pages rendered before a settings change
+EVICT_GRACE = 7 * 24 * 3600
+# and no more than this many of them, least recently used evicted first
+MAX_UNREFERENCED = 100
+EVICT_INTERVAL = 24 * 3600
+
+# Modules whose code decides what a settings dict renders to
+RENDERER_MODULES = ("theme_css.py", "fonts.py", "palette.py")
+
+
+def get_artifact(name, values, build):
+    """Return the URL of the ``name`` file for a settings dict.
+
+    A file another site (or an earlier save) built from the same settings is
+    reused; otherwise ``build()`` writes it and its URL is indexed.
+    """
+    cache = frappe.cache()
+    store_key = cache.make_key(STORE_KEY, shared=True)
+    field = f"{name}:{get_settings_hash(values)}"
+
+    url = cache.pipeline().hget(store_key, field).execute()[0]
+    if url and os.path.exists(get_artifact_path(frappe.safe_decode(url))):
+        return frappe.safe_decode(url)
+
+    url = build()
+    if url:
+        cache.pipeline().hset(store_key, field, url).execute()
+    return url
+
+
+def get_settings_hash(values):
+    """Hash of every settings field (not the version) and of the renderer code"""
+    # Fed field by field: one JSON document of the whole settings would dominate a save's allocations
+    digest = hashlib.sha256(get_renderer_hash().encode())
+    for field in SETTINGS_FIELDS:
+        digest.update(f"{field}={values[field]!r};".encode())
+    return digest.hexdigest()[:20]
+
+
+@functools.lru_cache
+def get_renderer_hash():
+    digest = hashlib.sha256()
+    for filename in RENDERER_MODULES:
+        with open(os.path.join(os.path.dirname(__file__), filename), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def get_artifact_path(url):
+    return os.path.join(frappe.local.sites_path, url.lstrip("/"))
+
+
+def get_artifact_urls(settings):
+    """URLs of the generated files a settings payload links"""
+    urls = []
+    for key in ARTIFACT_KEYS:
+        # A srcset lists "<url> <density>" candidates; a plain URL is one candidate
+        urls.extend(candidate.split()[0] for candidate in (settings.get(key) or "").split(",") if candidate.strip())
+    return list(dict.fromkeys(urls))
+
+
+def register_site_artifacts(urls):
+    """Record the generated files the current site references, replacing its previous set"""
+    urls = sorted(set(urls))
+    cache = frappe.cache()
+    pipe = cache.pipeline()
+    pipe.hset(cache.make_key(REFS_KEY, shared=True), frappe.local.site, json.dumps(urls))
+    used_key = cache.make_key(USED_KEY, shared=True)
+    now = int(time.time())
+    for url in urls:
+        pipe.hset(used_key, url, now)
+    pipe.execute()
+
+
+def evict_unused():
+    """Scheduler job: delete generated files no site has referenced for a while.
+
+    Runs once per interval for the whole bench, whichever site's scheduler gets
+    there first, and only once every site has registered its files (after a
+    Redis flush they do so as their payloads are rebuilt). Files that were never
+    registered start their grace period on the first run that sees them.
+    """
+    cache = frappe.cache()
+    if not cache.set(cache.make_key(EVICTED_KEY, shared=True), int(time.time()), nx=True, ex=EVICT_INTERVAL):
+        return
+
+    try:
+        evicted = evict(cache)
+    except Exception:
+        frappe.log_error(title="AhmadCSS Artifact Eviction Error")
+        return
+    if evicted:
+        frappe.logger("ahmadcss").info(f"Evicted {len(evicted)} unused theme files")
+
+
+def evict(cache):
+    """Delete unreferenced files past the grace period or the count limit; return their URLs"""
+    refs_key = cache.make_key(REFS_KEY, shared=True)
+    used_key = cache.make_key(USED_KEY, shared=True)
+    store_key = cache.make_key(STORE_KEY, shared=True)
+    sites_path = frappe.local.sites_path
+    now = int(time.time())
+
+    refs, used, store = cache.pipeline().hgetall(refs_key).hgetall(used_key).hgetall(store_key).execute()
+    refs = {frappe.safe_decode(site): json.loads(urls) for site, urls in refs.items()}
+
+    sites = set(get_sites(sites_path))
+    if not sites.issubset(refs):
+        # A site we know nothing about may still link any of the files
+        return []
+
+    referenced = {url for site in sites for url in refs[site]}
+    dropped_sites = [site for site in refs if site not in sites]
+    used = {frappe.safe_decode(url): int(last_used) for url, last_used in used.items()}
+
+    unseen = []
+    candidates = []
+    for url in list_artifacts(sites_path):
+        if url in referenced or (url.endswith(".json") and get_manifest_logo(url) in referenced):
+            continue
+        if url in used:
+            candidates.append((used[url], url))
+        else:
+            unseen.append(url)
+
+    # Most recently used first: keep the head, evict the tail and whatever outlived the grace period
+    candidates.sort(reverse=True)
+    evicted = [
+        url for i, (last_used, url) in enumerate(candidates) if i >= MAX_UNREFERENCED or last_used < now - EVICT_GRACE
+    ]
+    for url in evicted:
+        path = get_artifact_path(url)
+        for suffix in COMPRESSED_SUFFIXES:
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    pipe = cache.pipeline()
+    for site in dropped_sites:
+        pipe.hdel(refs_key, site)
+    for url in unseen:
+        pipe.hset(used_key, url, now)
+    for url in evicted:
+        pipe.hdel(used_key, url)
+    evicted_urls = set(evicted)
+    for field, url in store.items():
+        if frappe.safe_decode(url) in evicted_urls:
+            pipe.hdel(store_key, field)
+    pipe.execute()
+    return evicted
+
+
+def list_artifacts(sites_path):
+    """URLs of the generated files in sites/assets/ahmadcss"""
+    for folder in ARTIFACT_FOLDERS:
+        path = os.path.join(sites_path, "assets", "ahmadcss", folder)
+        if not os.path.isdir(path):
+            continue
+        for filename in os.listdir(path):
+            if ARTIFACT_PATTERN.match(filename):
+                yield f"/assets/ahmadcss/{folder}/{filename}"
+
+
+def get_manifest_logo(url):
+    """URL of the logo a ``logo-<key>.json`` manifest describes; the manifest lives as long as it"""
+    try:
+        with open(get_artifact_path(url)) as f:
+            return json.load(f).get("logo_src")
+    except (OSError, ValueError):
+        return None
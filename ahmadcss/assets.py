@@ -0,0 +1,48 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Content-hashed stylesheet URLs, from the manifest written by scripts/build-css.js.
+
+Imported by hooks.py, so it must not need a site or a database connection.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "public", "dist", "css", "manifest.json")
+SOURCE_URL = "/assets/ahmadcss/css/{}"
+
+# Seconds between checks of the manifest for a new build
+CHECK_INTERVAL = 2
+
+_manifest = {"mtime": None, "checked": None, "assets": {}, "hash": ""}
+
+
+def get_css_manifest():
+    """Return ({source filename: hashed URL}, manifest hash); re-read only when the build changes it"""
+    now = time.monotonic()
+    if _manifest["checked"] is not None and now - _manifest["checked"] < CHECK_INTERVAL:
+        return _manifest["assets"], _manifest["hash"]
+    _manifest["checked"] = now
+
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime != _manifest["mtime"]:
+        assets = {}
+        if mtime is not None:
+            with open(MANIFEST_PATH) as f:
+                assets = json.load(f)
+        digest = hashlib.sha256(json.dumps(assets, sort_keys=True).encode()).hexdigest()[:12]
+        _manifest.update(mtime=mtime, assets=assets, hash=digest if assets else "")
+
+    return _manifest["assets"], _manifest["hash"]
+
+
+def get_css_url(filename):
+    """Hashed URL of a stylesheet in public/css, or its plain URL before the first build"""
+    return get_css_manifest()[0].get(filename) or SOURCE_URL.format(filename)
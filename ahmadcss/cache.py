@@ -0,0 +1,159 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Versioned cache for values derived from AhmadCSS Settings.
+
+Every derived value (the public theme payload, boot fragment, ...) is stored in
+Redis together with the theme version it was built for. A small per-process LRU
+sits in front of Redis so a hot worker only pays one Redis read for the version
+token. Saving the settings bumps the token, which makes every copy stale at once.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import frappe
+from redis.exceptions import LockError
+
+from ahmadcss import perf
+
+THEME_VERSION_KEY = "ahmadcss:theme_version"
+
+# Redis keys holding values derived from AhmadCSS Settings
+THEME_CACHE_KEYS = set()
+
+# Frappe caches the whole boot per user, and the theme is part of it
+BOOT_CACHE_KEYS = ("bootinfo",)
+
+LOCK_TIMEOUT = 30
+LOCK_WAIT = 5
+
+
+class LRUCache:
+    """Small thread-safe LRU map used as the per-process cache layer"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+local_cache = LRUCache()
+
+
+def get_theme_version():
+    """Return the current theme version token, creating one if Redis lost it"""
+    version = frappe.cache().get_value(THEME_VERSION_KEY)
+    if version is None:
+        version = bump_theme_version()
+    return version
+
+
+def bump_theme_version():
+    """Move the theme version forward so every cached copy becomes stale.
+
+    The token is a millisecond timestamp that never goes backwards, so it keeps
+    increasing even after Redis is flushed and the token has to be re-created.
+    """
+    previous = frappe.cache().get_value(THEME_VERSION_KEY) or 0
+    version = max(int(time.time() * 1000), int(previous) + 1)
+    frappe.cache().set_value(THEME_VERSION_KEY, version)
+    return version
+
+
+def register_theme_cache_key(key):
+    """Mark a Redis key as derived from AhmadCSS Settings so invalidation drops it"""
+    THEME_CACHE_KEYS.add(key)
+    return key
+
+
+def invalidate_theme_cache():
+    """Drop only what depends on AhmadCSS Settings instead of the whole site cache"""
+    bump_theme_version()
+    frappe.cache().delete_value([*THEME_CACHE_KEYS, *BOOT_CACHE_KEYS])
+    local_cache.clear()
+    perf.incr("invalidate_theme_cache")
+
+
+def get_content_hash(value):
+    """Return a stable short hash of a JSON-serialisable value"""
+    data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode()).hexdigest()[:20]
+
+
+def get_versioned_value(key, generator):
+    """Return the value cached under ``key`` for the current theme version.
+
+    ``generator`` is called to rebuild the value when neither the local LRU nor
+    Redis hold a copy for the current version. Only one worker rebuilds at a
+    time; the others wait for its result instead of stampeding the database.
+    """
+    version = get_theme_version()
+    local_key = (frappe.local.site, key, version)
+
+    value = local_cache.get(local_key)
+    if value is not None:
+        perf.count("local_cache_hit")
+        return value
+
+    value = _get_redis_value(key, version)
+    if value is None:
+        perf.count("cache_miss")
+        value = _regenerate(key, version, generator)
+    else:
+        perf.count("redis_cache_hit")
+
+    local_cache.set(local_key, value)
+    return value
+
+
+def _get_redis_value(key, version):
+    cached = frappe.cache().get_value(key)
+    if cached and cached.get("version") == version:
+        return cached["value"]
+
+
+def _regenerate(key, version, generator):
+    cache = frappe.cache()
+    lock = cache.lock(cache.make_key(f"{key}:lock"), timeout=LOCK_TIMEOUT)
+
+    if not lock.acquire(blocking=True, blocking_timeout=LOCK_WAIT):
+        # The worker holding the lock is taking too long; serve without storing
+        return generator()
+
+    try:
+        # Another worker may have finished the rebuild while we were waiting
+        value = _get_redis_value(key, version)
+        if value is None:
+            value = generator()
+            cache.set_value(key, {"version": version, "value": value})
+        return value
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            pass
@@ -0,0 +1,161 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Compile public/scss/main.scss with variables injected from AhmadCSS Settings.
+
+Compiles run in a background job and are cached on disk by a hash of the
+variable set (and of the SCSS sources), so switching back to an earlier theme
+needs no compile at all.
+
+The desk and website do not link the result (settings.compiled_css): main.scss
+is not what the colour themes are built from, so they keep loading
+glass-base.css and their delta until it is.
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+
+import frappe
+
+from ahmadcss.palette import STEPS
+from ahmadcss.settings import get_settings_values
+from ahmadcss.theme_css import get_theme_tokens, write_asset
+
+COMPILE_JOB_ID = "ahmadcss-scss-compile"
+COMPILE_TIMEOUT = 300
+
+# Settings-driven tokens that _variables.scss declares with !default
+SCSS_VARIABLES = (
+    *(f"--primary-{step}" for step in STEPS),
+    "--primary-on-surface",
+    "--secondary-400",
+    "--secondary-500",
+    "--secondary-600",
+    "--secondary-700",
+    "--success",
+    "--warning",
+    "--error",
+    "--glass-white",
+    "--glass-blur",
+    "--gradient-navbar",
+    "--gradient-bg",
+    "--font-sans",
+    "--sidebar-width",
+    "--transition-fast",
+    "--transition-base",
+    "--transition-slow",
+    "--transition-spring",
+)
+
+
+def get_scss_variables(settings):
+    """Return the SCSS variable overrides for a settings dict"""
+    tokens = get_theme_tokens(settings)
+    return {f"${token[2:]}": tokens[token] for token in SCSS_VARIABLES if token in tokens}
+
+
+def get_compile_hash(variables):
+    """Hash of the variable set and the SCSS sources it is compiled against"""
+    source = "".join(f"{name}:{value};" for name, value in sorted(variables.items()))
+    return hashlib.sha256((get_sources_hash() + source).encode()).hexdigest()[:16]
+
+
+@functools.lru_cache
+def get_sources_hash():
+    digest = hashlib.sha256()
+    scss_path = get_scss_path()
+    for root, dirs, files in os.walk(scss_path):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.endswith(".scss"):
+                with open(os.path.join(root, filename), "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def get_compiled_filename(compile_hash):
+    return f"main-{compile_hash}.css"
+
+
+def get_compiled_path(compile_hash):
+    filename = get_compiled_filename(compile_hash)
+    return os.path.join(frappe.local.sites_path, "assets", "ahmadcss", "css", filename)
+
+
+def get_compiled_css_url(settings):
+    """Return the URL of the compiled stylesheet for these settings, or None if not built yet"""
+    compile_hash = get_compile_hash(get_scss_variables(settings))
+    if os.path.exists(get_compiled_path(compile_hash)):
+        return f"/assets/ahmadcss/css/{get_compiled_filename(compile_hash)}"
+
+
+def enqueue_compile():
+    """Queue a compile for the current settings unless the result is already cached.
+
+    Saves in quick succession coalesce: the job is deduplicated per site and
+    reads the latest settings when it runs.
+    """
+    if get_compiled_css_url(get_settings_values()):
+        return
+
+    frappe.enqueue(
+        "ahmadcss.compiler.compile_theme",
+        queue="short",
+        timeout=COMPILE_TIMEOUT,
+        job_id=f"{COMPILE_JOB_ID}::{frappe.local.site}",
+        deduplicate=True,
+    )
+
+
+def compile_theme():
+    """Background job: compile main.scss for the current settings"""
+    from ahmadcss.cache import invalidate_theme_cache
+
+    compiled = set()
+    while True:
+        # Settings saved while we were compiling are picked up by another pass
+        frappe.db.rollback()
+        variables = get_scss_variables(get_settings_values())
+        compile_hash = get_compile_hash(variables)
+        if compile_hash in compiled:
+            break
+
+        if not os.path.exists(get_compiled_path(compile_hash)):
+            write_asset(get_compiled_filename(compile_hash), compile_scss(variables))
+        compiled.add(compile_hash)
+
+    # Let the theme payload pick up the new compiled stylesheet
+    invalidate_theme_cache()
+
+
+def compile_scss(variables):
+    """Compile main.scss with the given variable overrides and return the CSS"""
+    overrides = "".join(f"{name}: {value};\n" for name, value in variables.items())
+    source = f"{overrides}@import 'main';\n"
+
+    result = subprocess.run(
+        [*get_sass_command(), "--stdin", f"--load-path={get_scss_path()}", "--style=compressed", "--no-source-map"],
+        input=source,
+        capture_output=True,
+        text=True,
+        timeout=COMPILE_TIMEOUT,
+    )
+    if result.returncode:
+        frappe.throw(f"SCSS compilation failed: {result.stderr[:500]}")
+    return result.stdout
+
+
+def get_sass_command():
+    local_sass = os.path.join(frappe.get_app_path("ahmadcss"), "..", "node_modules", ".bin", "sass")
+    if os.path.exists(local_sass):
+        return [local_sass]
+    if shutil.which("sass"):
+        return ["sass"]
+    return ["npx", "--no-install", "sass"]
+
+
+def get_scss_path():
+    return frappe.get_app_path("ahmadcss", "public", "scss")
@@ -0,0 +1,113 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Publish the Custom CSS / Custom JS of AhmadCSS Settings as static files.
+
+Each snippet is minified with esbuild when the settings are saved, which also
+rejects one that does not parse, and written to ``sites/assets/ahmadcss``
+under a name hashed from its source once the save is committed. Payloads carry
+only the URLs: the stylesheet is linked in <head>. The script runs only while
+"Run Custom JavaScript" is on, and only on the desk: its URL is sent in the
+boot of logged-in users, never in the settings guests can read. Without
+esbuild (outside a bench) a snippet cannot be checked, so it is rejected.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+
+import frappe
+from frappe import _
+from frappe.utils import escape_html
+
+from ahmadcss.theme_css import write_asset
+
+MINIFY_TIMEOUT = 30
+
+# fieldname: (file type, payload key); the type is also the assets folder and esbuild loader
+CODE_FIELDS = {
+    "custom_css": ("css", "custom_css_url"),
+    "custom_js": ("js", "custom_js_url"),
+}
+
+# Bumped when the minifier options change, so files are rebuilt under new names
+MINIFY_VERSION = "1"
+
+
+# Snippets published only while this setting is on
+CODE_SWITCHES = {"custom_js": "enable_custom_js"}
+
+
+def get_custom_code_urls(values):
+    """{payload key: URL} of the published snippets of a settings dict; empty and switched off ones are left out"""
+    urls = {}
+    for fieldname, (_file_type, key) in CODE_FIELDS.items():
+        if not (values.get(fieldname) or "").strip():
+            continue
+        if fieldname in CODE_SWITCHES and not values.get(CODE_SWITCHES[fieldname]):
+            continue
+        try:
+            urls[key] = publish(fieldname, values[fieldname])
+        except Exception:
+            # Validated on save; only a missing or unwritable assets folder gets here
+            frappe.log_error(title=f"AhmadCSS {fieldname} Error")
+    return urls
+
+
+def check(fieldname, source):
+    """Minify a snippet in memory, rejecting one that does not parse; None when it is already published"""
+    file_type = CODE_FIELDS[fieldname][0]
+    if os.path.exists(get_path(get_filename(source, file_type), file_type)):
+        return None
+    return minify(source, file_type, fieldname)
+
+
+def publish(fieldname, source, minified=None):
+    """Write a snippet (minifying it unless given), unless this source is already published; return its URL"""
+    file_type = CODE_FIELDS[fieldname][0]
+    filename = get_filename(source, file_type)
+    if not os.path.exists(get_path(filename, file_type)):
+        if minified is None:
+            minified = minify(source, file_type, fieldname)
+        write_asset(filename, minified, folder=file_type)
+    return f"/assets/ahmadcss/{file_type}/{filename}"
+
+
+def get_filename(source, file_type):
+    digest = hashlib.sha256(f"{MINIFY_VERSION}:{source}".encode()).hexdigest()[:16]
+    return f"custom-{digest}.{file_type}"
+
+
+def get_path(filename, file_type):
+    return os.path.join(frappe.local.sites_path, "assets", "ahmadcss", file_type, filename)
+
+
+def minify(source, loader, fieldname):
+    """Return the minified snippet; a syntax error, or no esbuild to check it with, is raised as a ValidationError"""
+    label = frappe.unscrub(fieldname)
+    command = get_esbuild_command()
+    if not command:
+        frappe.throw(_("{0} cannot be checked: esbuild was not found. Run bench setup requirements --node.").format(label))
+
+    result = subprocess.run(
+        [*command, f"--loader={loader}", "--minify", "--charset=utf8", "--log-level=error"],
+        input=source,
+        capture_output=True,
+        text=True,
+        timeout=MINIFY_TIMEOUT,
+    )
+    if result.returncode:
+        frappe.throw(_("{0} has a syntax error:<br><pre>{1}</pre>").format(label, escape_html(result.stderr[:1000])))
+    return result.stdout
+
+
+def get_esbuild_command():
+    # This app's node_modules, then the one Frappe builds its own assets with
+    for app in ("ahmadcss", "frappe"):
+        path = os.path.join(frappe.get_app_path(app), "..", "node_modules", ".bin", "esbuild")
+        if os.path.exists(path):
+            return [path]
+    if shutil.which("esbuild"):
+        return ["esbuild"]
+    return None
@@ -0,0 +1,131 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Self-hosted web fonts for the families selected in AhmadCSS Settings.
+
+``scripts/vendor_fonts.py`` writes WOFF2 subsets to ``public/fonts`` and lists
+them in ``public/fonts/fonts.json``. The theme stylesheet gets ``@font-face``
+rules for the selected families only, and HTML responses get preload hints
+for their regular weight. A family that has not been vendored (Cairo, so far)
+is loaded from Google Fonts while "Load Missing Fonts from Google" is on, as it
+is by default, and renders in the system fonts of the stack otherwise.
+"""
+
+import json
+import os
+from urllib.parse import quote_plus
+
+import frappe
+
+from ahmadcss.cache import get_versioned_value, register_theme_cache_key
+from ahmadcss.settings import get_settings_values
+
+FONTS_PATH = os.path.join(os.path.dirname(__file__), "public", "fonts")
+MANIFEST_PATH = os.path.join(FONTS_PATH, "fonts.json")
+FONTS_URL = "/assets/ahmadcss/fonts/"
+
+FONT_PRELOAD_KEY = register_theme_cache_key("ahmadcss:font_preload")
+
+# Weights used by the AhmadCSS stylesheets
+FONT_WEIGHTS = (400, 500, 600, 700)
+PRELOAD_WEIGHT = 400
+
+# Families the stylesheets use when custom fonts are off
+DEFAULT_FAMILIES = ("Cairo", "Inter")
+
+UNICODE_RANGES = {
+    "arabic": "U+0600-06FF,U+0750-077F,U+0870-088E,U+0890-0891,U+0898-08E1,U+08E3-08FF,"
+    "U+200C-200E,U+2010-2011,U+204F,U+2E41,U+FB50-FDFF,U+FE70-FE74,U+FE76-FEFC",
+    "latin": "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,U+0304,U+0308,"
+    "U+0329,U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD",
+}
+
+GOOGLE_FONTS_URL = "https://fonts.googleapis.com/css2?{}&display=swap"
+
+
+_manifest = {"mtime": None, "fonts": {}}
+
+
+def load_manifest():
+    """Return {family: {weight: {subset: path}}} of the vendored fonts; re-read only when it changes"""
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime != _manifest["mtime"]:
+        fonts = {}
+        if mtime is not None:
+            with open(MANIFEST_PATH) as f:
+                fonts = json.load(f)
+        _manifest.update(mtime=mtime, fonts=fonts)
+
+    return _manifest["fonts"]
+
+
+def get_selected_families(settings):
+    """Families the theme uses: the configured ones, or the stylesheet defaults"""
+    if not settings.get("enable_custom_fonts"):
+        return DEFAULT_FAMILIES
+    return tuple(dict.fromkeys(f for f in (settings.get("font_family"), settings.get("arabic_font")) if f))
+
+
+def render_font_css(settings):
+    """@font-face rules for the selected vendored fonts, plus a Google Fonts @import for the rest unless turned off"""
+    manifest = load_manifest()
+    imports, faces = [], []
+
+    missing = [family for family in get_selected_families(settings) if family not in manifest]
+    if missing and settings.get("google_fonts_fallback"):
+        weights = ";".join(str(weight) for weight in FONT_WEIGHTS)
+        families = "&".join(f"family={quote_plus(family)}:wght@{weights}" for family in missing)
+        imports.append(f'@import url("{GOOGLE_FONTS_URL.format(families)}");')
+
+    for family in get_selected_families(settings):
+        for weight, subsets in sorted(manifest.get(family, {}).items()):
+            for subset, path in subsets.items():
+                faces.append(
+                    "@font-face{"
+                    f"font-family:'{family}';font-style:normal;font-weight:{weight};font-display:swap;"
+                    f"src:url({FONTS_URL}{path}) format('woff2');"
+                    f"unicode-range:{UNICODE_RANGES[subset]}"
+                    "}"
+                )
+
+    return imports, faces
+
+
+def get_preload_urls():
+    """URLs of the regular-weight font files of the selected families, cached per theme version"""
+    return get_versioned_value(FONT_PRELOAD_KEY, build_preload_urls)
+
+
+def build_preload_urls():
+    settings = get_settings_values()
+    manifest = load_manifest()
+
+    # Latin for the main family and Arabic for the Arabic one, which render first
+    wanted = [(settings.get("font_family"), "latin"), (settings.get("arabic_font"), "arabic")]
+    if not settings.get("enable_custom_fonts"):
+        wanted = [(DEFAULT_FAMILIES[0], "arabic"), (DEFAULT_FAMILIES[1], "latin")]
+
+    urls = []
+    for family, subset in wanted:
+        path = manifest.get(family, {}).get(str(PRELOAD_WEIGHT), {}).get(subset)
+        if path and FONTS_URL + path not in urls:
+            urls.append(FONTS_URL + path)
+    return urls
+
+
+def add_preload_headers(response, request):
+    """after_request hook: ask the browser to fetch the theme fonts alongside the HTML"""
+    if response.mimetype != "text/html":
+        return
+
+    try:
+        urls = get_preload_urls()
+    except Exception:
+        return
+
+    for url in urls:
+        response.headers.add("Link", f"<{url}>; rel=preload; as=font; type=font/woff2; crossorigin")
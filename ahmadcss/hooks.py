@@ -1,3 +1,5 @@
+from ahmadcss.assets import get_css_url as _css_url
+
 app_name = "ahmadcss"
 app_title = "AhmadCSS Material Theme"
 app_publisher = "ahmaddev"
@@ -25,23 +27,28 @@ add_to_apps_screen = [
 
 # include js, css files in header of desk.html
 # Only include components.css (common utilities) - themes loaded dynamically
+# Stylesheets resolve to the content-hashed copies built by scripts/build-css.js
 app_include_css = [
-    "/assets/ahmadcss/css/components.css"
+    _css_url("components.css")
 ]
+# ECharts is not included here: AhmadCSS.charts loads echarts.bundle.js on first use
 app_include_js = [
-    "https://cdn.jsdelivr.net/npm/echarts@5.5.0/dist/echarts.min.js",
     "ahmadcss.bundle.js"
 ]
 
 # include js, css files in header of web template
 # Only include components.css (common utilities) - themes loaded dynamically
 web_include_css = [
-    "/assets/ahmadcss/css/components.css"
+    _css_url("components.css")
 ]
 web_include_js = [
     "ahmadcss.bundle.js"
 ]
 
+# The content-hashed theme-<hash>.css generated from AhmadCSS Settings is
+# appended to app_include_css / web_include_css per request
+update_website_context = "ahmadcss.website.update_website_context"
+
 # include custom scss in every website theme (without file extension ".scss")
 # website_theme_scss = "ahmadcss/public/scss/website"
 
@@ -186,6 +193,12 @@ boot_session = "ahmadcss.api.get_boot_info"
 # 	],
 # }
 
+scheduler_events = {
+	"daily": [
+		"ahmadcss.artifacts.evict_unused"
+	],
+}
+
 # Testing
 # -------
 
@@ -217,7 +230,8 @@ boot_session = "ahmadcss.api.get_boot_info"
 # Request Events
 # ----------------
 # before_request = ["ahmadcss.utils.before_request"]
-# after_request = ["ahmadcss.utils.after_request"]
+# Preload hints for the self-hosted theme fonts on HTML pages
+after_request = ["ahmadcss.fonts.add_preload_headers"]
 
 # Job Events
 # ----------
@@ -0,0 +1,238 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Optimised variants of the custom logo shown in the header.
+
+Once a save is committed, the uploaded ``custom_logo`` is resized with Pillow
+to the header's logo height at 1x, 2x and 3x, as WebP and (where Pillow
+supports it) AVIF, with a tiny WebP placeholder to inline as a data URI. SVG
+logos are minified instead. Variants are written to
+``sites/assets/ahmadcss/images`` under names hashed from the uploaded file, so
+each upload is processed once; a small JSON manifest next to them spares
+payload builds from reading the upload again. The save itself only checks that
+the upload can be read.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+
+import frappe
+from frappe import _
+
+from ahmadcss.theme_css import write_asset
+
+# Height (px) of the logo box in the navbar (components/_navbar.scss)
+LOGO_HEIGHT = 36
+DENSITIES = (1, 2, 3)
+PLACEHOLDER_HEIGHT = 8
+
+# Pillow format: (extension, save options); preferred first
+FORMATS = {
+    "AVIF": ("avif", {"quality": 60}),
+    "WEBP": ("webp", {"quality": 82, "method": 6}),
+}
+PLACEHOLDER_OPTIONS = {"quality": 30}
+
+# Bumped when the sizes or encoder options change, so variants are rebuilt under new names
+LOGO_VERSION = "1"
+
+SVG_PATTERNS = (
+    # Prolog, doctype and comments
+    (re.compile(r"<\?xml.*?\?>|<!DOCTYPE[^>]*>|<!--.*?-->", re.S), ""),
+    # Editor metadata and Inkscape / Sodipodi elements and attributes
+    (re.compile(r"<metadata\b.*?</metadata>|<(sodipodi|inkscape):\w+[^>]*?(?:/>|>.*?</\1:\w+>)", re.S), ""),
+    (re.compile(r'\s(?:xmlns:(?:sodipodi|inkscape)|(?:sodipodi|inkscape):[\w.-]+)="[^"]*"'), ""),
+    # Whitespace between tags and runs of whitespace
+    (re.compile(r">\s+<"), "><"),
+    (re.compile(r"\s+"), " "),
+)
+SVG_STYLE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S)
+CSS_SPACES = re.compile(r"\s*([{};,])\s*")
+CSS_BLOCK = re.compile(r"\{([^{}]*)\}")
+CSS_COLON = re.compile(r"\s*:\s*")
+
+
+def get_logo_variants(values):
+    """{payload key: value} describing the optimised custom logo; empty when none is shown.
+
+    ``logo_src`` (plus ``logo_srcset``, ``logo_srcset_avif``, ``logo_width``,
+    ``logo_height`` and ``logo_placeholder`` for raster logos). Without them the
+    browser shows ``custom_logo`` as uploaded.
+    """
+    if not (values.get("show_custom_logo") and values.get("custom_logo")):
+        return {}
+    try:
+        return publish_logo(values["custom_logo"])
+    except Exception:
+        # Validated on save; only a deleted upload or an unwritable assets folder gets here
+        frappe.log_error(title="AhmadCSS Custom Logo Error")
+        return {}
+
+
+def check_logo(file_url):
+    """Reject an upload that is not a readable image, in memory; nothing is written"""
+    path = get_file_path(file_url)
+    if not path or path.lower().endswith(".svg") or os.path.exists(get_manifest_path(file_url, path)):
+        return
+
+    with open(path, "rb") as f:
+        open_image(f.read())
+
+
+def publish_logo(file_url):
+    """Write the variants of an uploaded logo unless they exist; return their payload keys"""
+    path = get_file_path(file_url)
+    if not path:
+        # An external URL: nothing to optimise
+        return {}
+
+    manifest_path = get_manifest_path(file_url, path)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            variants = json.load(f)
+        if os.path.exists(get_image_path(os.path.basename(variants["logo_src"]))):
+            return variants
+
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(LOGO_VERSION.encode() + content).hexdigest()[:16]
+    if path.lower().endswith(".svg"):
+        variants = publish_svg(content, digest)
+    else:
+        variants = publish_raster(content, digest)
+
+    write_asset(os.path.basename(manifest_path), json.dumps(variants), folder="images")
+    return variants
+
+
+def publish_svg(content, digest):
+    filename = f"logo-{digest}.svg"
+    if not os.path.exists(get_image_path(filename)):
+        write_asset(filename, minify_svg(frappe.safe_decode(content)), folder="images")
+    return {"logo_src": f"/assets/ahmadcss/images/{filename}"}
+
+
+def publish_raster(content, digest):
+    from PIL import ImageOps
+
+    image = ImageOps.exif_transpose(open_image(content))
+    image = image.convert("RGBA" if has_alpha(image) else "RGB")
+
+    srcsets = {}
+    for pillow_format, (extension, options) in get_formats().items():
+        candidates = []
+        for density, size in get_sizes(image.size):
+            filename = f"logo-{digest}-{density}x.{extension}"
+            if not os.path.exists(get_image_path(filename)):
+                write_image(filename, resize(image, size), pillow_format, options)
+            candidates.append(f"/assets/ahmadcss/images/{filename} {density}x")
+        srcsets[extension] = ", ".join(candidates)
+
+    width, height = get_sizes(image.size)[0][1]
+    variants = {
+        "logo_src": srcsets["webp"].split(" ", 1)[0],
+        "logo_srcset": srcsets["webp"],
+        "logo_width": width,
+        "logo_height": height,
+        "logo_placeholder": get_placeholder(image),
+    }
+    if "avif" in srcsets:
+        variants["logo_srcset_avif"] = srcsets["avif"]
+    return variants
+
+
+def open_image(content):
+    # Pillow ships with Frappe; only saves with a raster logo need it
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        image = Image.open(io.BytesIO(content))
+        image.load()
+    except (UnidentifiedImageError, OSError):
+        frappe.throw(_("Custom Logo is not an image that can be read"))
+    return image
+
+
+def get_sizes(size):
+    """[(density, (width, height))] to render; never upscaled beyond the upload"""
+    width, height = size
+    sizes = []
+    for density in DENSITIES:
+        target = LOGO_HEIGHT * density
+        if target > height and sizes:
+            break
+        target = min(target, height)
+        sizes.append((density, (max(1, round(width * target / height)), target)))
+    return sizes
+
+
+def get_formats():
+    from PIL import features
+
+    # AVIF needs a Pillow built with libavif (11.2+); WebP is always there
+    return {name: FORMATS[name] for name in FORMATS if name == "WEBP" or features.check(name.lower())}
+
+
+def has_alpha(image):
+    return image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+
+
+def resize(image, size):
+    from PIL import Image
+
+    return image if image.size == size else image.resize(size, Image.LANCZOS)
+
+
+def write_image(filename, image, pillow_format, options):
+    buffer = io.BytesIO()
+    image.save(buffer, pillow_format, **options)
+    write_asset(filename, buffer.getvalue(), folder="images")
+
+
+def get_placeholder(image):
+    """A few hundred bytes of blurry WebP, inlined while the logo loads"""
+    width, height = image.size
+    small = resize(image, (max(1, round(width * PLACEHOLDER_HEIGHT / height)), PLACEHOLDER_HEIGHT))
+    buffer = io.BytesIO()
+    small.save(buffer, "WEBP", **PLACEHOLDER_OPTIONS)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def minify_svg(source):
+    """Strip comments, editor metadata and whitespace from an SVG document"""
+    source = SVG_STYLE.sub(lambda m: m[1] + minify_style(m[2]) + m[3], source)
+    for pattern, replacement in SVG_PATTERNS:
+        source = pattern.sub(replacement, source)
+    return source.strip()
+
+
+def minify_style(css):
+    css = CSS_SPACES.sub(r"\1", css).strip()
+    # Inside declaration blocks only, where a colon never separates selectors
+    return CSS_BLOCK.sub(lambda m: "{" + CSS_COLON.sub(":", m[1]).rstrip(";") + "}", css)
+
+
+def get_file_path(file_url):
+    """Path of an uploaded /files/ or /private/files/ URL, or None for anything else"""
+    for prefix, folder in (("/files/", "public"), ("/private/files/", "private")):
+        if file_url.startswith(prefix):
+            filename = file_url[len(prefix) :].split("?", 1)[0]
+            if "/" in filename or filename.startswith("."):
+                return None
+            return frappe.get_site_path(folder, "files", filename)
+    return None
+
+
+def get_manifest_path(file_url, path):
+    # Keyed on the upload's size and mtime, so a replaced file under the same URL is processed again
+    stat = os.stat(path)
+    key = hashlib.sha256(f"{LOGO_VERSION}:{file_url}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+    return get_image_path(f"logo-{key}.json")
+
+
+def get_image_path(filename):
+    return os.path.join(frappe.local.sites_path, "assets", "ahmadcss", "images", filename)
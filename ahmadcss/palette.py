@@ -0,0 +1,246 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Derive the full colour palette from the base colours of AhmadCSS Settings.
+
+Each configured colour gets a 50-900 tint/shade scale computed in OKLCH (so
+steps look evenly spaced and keep their hue), hover / active / subtle
+variants, the text colour to put on it and the shade that stays readable on
+light and on dark surfaces, both checked against WCAG 2 contrast. Gradient
+stops get the text colour readable on all of them.
+
+Everything is computed once per colour (cached per process) and emitted by
+ahmadcss.theme_css as static custom properties, and by ahmadcss.compiler as
+SCSS variables, so browsers do no colour maths.
+"""
+
+import functools
+import math
+import re
+
+STEPS = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900)
+
+# OKLCH lightness and relative chroma of each step, taken from the default emerald scale
+LIGHTNESS = (0.979, 0.950, 0.905, 0.845, 0.773, 0.696, 0.596, 0.508, 0.432, 0.378)
+CHROMA = (0.14, 0.34, 0.60, 0.87, 1.03, 1.0, 0.85, 0.70, 0.58, 0.49)
+# Lightness reserved per step between the anchor and each end, so near-black and near-white scales keep distinct steps
+MIN_STEP_LIGHTNESS = 0.01
+
+# Setting: (token name, step the configured colour sits at, emit the whole scale)
+PALETTE_COLORS = {
+    "primary_color": ("primary", 600, True),
+    "secondary_color": ("secondary", 500, True),
+    "success_color": ("success", 500, False),
+    "warning_color": ("warning", 500, False),
+    "error_color": ("error", 500, False),
+}
+
+# Surface: gradient stop settings
+GRADIENTS = {
+    "navbar": ("header_gradient_start", "header_gradient_end"),
+    "sidebar": ("sidebar_gradient_start", "sidebar_gradient_end"),
+    "footer": ("footer_gradient_start", "footer_gradient_end"),
+    "body": ("body_gradient_start", "body_gradient_middle", "body_gradient_end"),
+}
+
+# Surfaces text is checked against: light glass, and $dark-glass-white
+LIGHT_SURFACE = "#ffffff"
+DARK_SURFACE = "#0a1e19"
+# Candidate text colours: white and $text-primary
+TEXT_COLORS = ("#ffffff", "#1a1a2e")
+
+# WCAG 2 AA for normal text
+MIN_CONTRAST = 4.5
+
+# Lightness and relative chroma of the tinted background used for "subtle" in dark mode
+DARK_SUBTLE = (0.30, 0.35)
+
+HEX_COLOR = re.compile(r"^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+
+# linear sRGB -> LMS -> OKLab and back (https://bottosson.github.io/posts/oklab/)
+RGB_TO_LMS = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+LMS_TO_OKLAB = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+OKLAB_TO_LMS = (
+    (1.0, 0.3963377774, 0.2158037573),
+    (1.0, -0.1055613458, -0.0638541728),
+    (1.0, -0.0894841775, -1.2914855480),
+)
+LMS_TO_RGB = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+
+
+def get_palette_tokens(settings):
+    """Return (tokens, dark mode tokens) derived from the colours of a settings dict"""
+    tokens, dark_tokens = {}, {}
+    for fieldname, (name, anchor, full_scale) in PALETTE_COLORS.items():
+        derived = get_color_tokens(settings.get(fieldname), name, anchor, full_scale)
+        if derived:
+            tokens.update(derived[0])
+            dark_tokens.update(derived[1])
+
+    for surface, fieldnames in GRADIENTS.items():
+        stops = [settings.get(fieldname) for fieldname in fieldnames]
+        text = get_text_color(*stops)
+        if text:
+            tokens[f"--text-on-{surface}"] = text
+    return tokens, dark_tokens
+
+
+@functools.lru_cache(maxsize=256)
+def get_color_tokens(color, name, anchor, full_scale):
+    """(tokens, dark mode tokens) of one configured colour, or None if it is not a hex colour"""
+    rgb = parse_hex(color)
+    if rgb is None:
+        return None
+
+    scale = get_scale(rgb, anchor)
+    i = STEPS.index(anchor)
+    light_surface, dark_surface = parse_hex(LIGHT_SURFACE), parse_hex(DARK_SURFACE)
+
+    tokens = {f"--{name}-{step}": to_hex(value) for step, value in zip(STEPS, scale, strict=True)} if full_scale else {}
+    tokens.update(
+        {
+            f"--{name}-hover": to_hex(scale[min(i + 1, len(STEPS) - 1)]),
+            f"--{name}-active": to_hex(scale[min(i + 2, len(STEPS) - 1)]),
+            f"--{name}-subtle": to_hex(scale[0]),
+            f"--{name}-on": pick_text_color([rgb]),
+            # The lightest shade from the configured one down that is readable on light glass
+            f"--{name}-on-surface": to_hex(pick_readable(scale[i:], light_surface)),
+        }
+    )
+
+    _lightness, chroma, hue = rgb_to_oklch(rgb)
+    dark_tokens = {
+        f"--{name}-hover": to_hex(scale[max(i - 1, 0)]),
+        f"--{name}-active": to_hex(scale[max(i - 2, 0)]),
+        f"--{name}-subtle": to_hex(oklch_to_rgb(DARK_SUBTLE[0], chroma * DARK_SUBTLE[1], hue)),
+        # The darkest shade from the configured one up that is readable on dark glass
+        f"--{name}-on-surface": to_hex(pick_readable(scale[i::-1], dark_surface)),
+    }
+    return tokens, dark_tokens
+
+
+def get_scale(rgb, anchor):
+    """The 50-900 scale around a colour, lightest first, which keeps its place at the ``anchor`` step"""
+    lightness, chroma, hue = rgb_to_oklch(rgb)
+    i = STEPS.index(anchor)
+    # Stretch the reference lightness curve so the anchor lands on the colour and the ends stay put;
+    # a colour too dark or too light for the steps on its far side is moved to the nearest lightness that fits
+    base = min(
+        max(lightness, LIGHTNESS[-1] + MIN_STEP_LIGHTNESS * (len(STEPS) - 1 - i)),
+        LIGHTNESS[0] - MIN_STEP_LIGHTNESS * i,
+    )
+    lighter = (LIGHTNESS[0] - base) / (LIGHTNESS[0] - LIGHTNESS[i])
+    darker = (base - LIGHTNESS[-1]) / (LIGHTNESS[i] - LIGHTNESS[-1])
+
+    scale = []
+    for j, (step_lightness, step_chroma) in enumerate(zip(LIGHTNESS, CHROMA, strict=True)):
+        if j == i and base == lightness:
+            # The configured colour itself, unless it was moved: then it is derived like every other step
+            scale.append(rgb)
+            continue
+        factor = lighter if j < i else darker
+        value = base + (step_lightness - LIGHTNESS[i]) * factor
+        scale.append(oklch_to_rgb(value, chroma * step_chroma / CHROMA[i], hue))
+    return scale
+
+
+@functools.lru_cache(maxsize=256)
+def get_text_color(*stops):
+    """The text colour readable on every stop of a gradient, or None without valid stops"""
+    colors = [rgb for rgb in map(parse_hex, stops) if rgb]
+    return pick_text_color(colors) if colors else None
+
+
+def pick_text_color(backgrounds):
+    """The candidate text colour with the best worst-case contrast on the backgrounds"""
+    return max(TEXT_COLORS, key=lambda text: min(contrast(parse_hex(text), bg) for bg in backgrounds))
+
+
+def pick_readable(candidates, background):
+    """The first candidate that meets MIN_CONTRAST on the background, else the best one"""
+    for rgb in candidates:
+        if contrast(rgb, background) >= MIN_CONTRAST:
+            return rgb
+    return max(candidates, key=lambda rgb: contrast(rgb, background))
+
+
+def contrast(rgb1, rgb2):
+    """WCAG 2 contrast ratio of two colours"""
+    high, low = sorted((relative_luminance(rgb1), relative_luminance(rgb2)), reverse=True)
+    return (high + 0.05) / (low + 0.05)
+
+
+def relative_luminance(rgb):
+    r, g, b = (to_linear(channel) for channel in rgb)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def rgb_to_oklch(rgb):
+    lms = [math.copysign(abs(value) ** (1 / 3), value) for value in multiply(RGB_TO_LMS, map(to_linear, rgb))]
+    lightness, a, b = multiply(LMS_TO_OKLAB, lms)
+    return lightness, math.hypot(a, b), math.atan2(b, a)
+
+
+def oklch_to_rgb(lightness, chroma, hue):
+    """sRGB of an OKLCH colour; out-of-gamut colours lose chroma until they fit"""
+    lightness = min(max(lightness, 0.0), 1.0)
+    rgb = oklch_to_linear_rgb(lightness, chroma, hue)
+    if not in_gamut(rgb):
+        low, high = 0.0, chroma
+        for _i in range(20):
+            mid = (low + high) / 2
+            if in_gamut(oklch_to_linear_rgb(lightness, mid, hue)):
+                low = mid
+            else:
+                high = mid
+        rgb = oklch_to_linear_rgb(lightness, low, hue)
+    return tuple(from_linear(min(max(channel, 0.0), 1.0)) for channel in rgb)
+
+
+def oklch_to_linear_rgb(lightness, chroma, hue):
+    lms = multiply(OKLAB_TO_LMS, (lightness, chroma * math.cos(hue), chroma * math.sin(hue)))
+    return multiply(LMS_TO_RGB, [value**3 for value in lms])
+
+
+def in_gamut(rgb, epsilon=1e-6):
+    return all(-epsilon <= channel <= 1 + epsilon for channel in rgb)
+
+
+def multiply(matrix, vector):
+    vector = tuple(vector)
+    return [sum(m * v for m, v in zip(row, vector, strict=True)) for row in matrix]
+
+
+def to_linear(channel):
+    return channel / 12.92 if channel <= 0.04045 else ((channel + 0.055) / 1.055) ** 2.4
+
+
+def from_linear(channel):
+    return channel * 12.92 if channel <= 0.0031308 else 1.055 * channel ** (1 / 2.4) - 0.055
+
+
+def parse_hex(color):
+    """(r, g, b) in 0-1 of a #rgb / #rrggbb colour, or None"""
+    match = HEX_COLOR.match((color or "").strip())
+    if not match:
+        return None
+    digits = match[1]
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    return tuple(int(digits[i : i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def to_hex(rgb):
+    return "#" + "".join(f"{round(channel * 255):02x}" for channel in rgb)
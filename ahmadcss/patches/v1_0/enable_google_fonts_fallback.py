@@ -0,0 +1,17 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from ahmadcss.settings import DOCTYPE
+
+
+def execute():
+    """Store the new fallback as on for existing sites, which use Cairo, until Cairo is vendored.
+
+    The settings form shows a value that was never stored as unchecked, so the
+    first save would otherwise turn it off.
+    """
+    if "google_fonts_fallback" in frappe.db.get_singles_dict(DOCTYPE):
+        return
+    frappe.db.set_single_value(DOCTYPE, "google_fonts_fallback", 1)
@@ -0,0 +1,183 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Sampled timings and counters for the theme hot paths.
+
+A sampled call records its latency, payload size and the cache hits it made
+in Redis, per site, with one pipelined round trip. Calls that are not sampled
+only pay for a ``random()``. The rate is read from the site config key
+``ahmadcss_perf_sample_rate`` (0 turns sampling off, 1 records every call).
+"""
+
+import functools
+import json
+import math
+import random
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+import frappe
+from frappe.utils import flt
+
+SAMPLE_RATE_CONFIG = "ahmadcss_perf_sample_rate"
+DEFAULT_SAMPLE_RATE = 0.01
+
+# Latency and payload samples kept per metric
+MAX_SAMPLES = 1000
+
+COUNTERS_KEY = "ahmadcss:perf:counters"
+LATENCY_KEY = "ahmadcss:perf:latency:{}"
+BYTES_KEY = "ahmadcss:perf:bytes:{}"
+
+METRICS = ("get_theme_settings", "get_boot_info", "save_settings")
+EVENTS = ("invalidate_theme_cache",)
+
+# The call being sampled in this request, if any
+current_sample = ContextVar("ahmadcss_perf_sample", default=None)
+
+
+def get_sample_rate():
+    return flt(frappe.conf.get(SAMPLE_RATE_CONFIG, DEFAULT_SAMPLE_RATE))
+
+
+def timed(metric):
+    """Decorator: sample the wrapped call's latency under ``metric``"""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Site config values are already numbers; keep the unsampled path minimal
+            rate = frappe.conf.get(SAMPLE_RATE_CONFIG, DEFAULT_SAMPLE_RATE)
+            # Calls nested in a sampled call are part of its latency
+            if not rate or random.random() >= rate or current_sample.get() is not None:
+                return fn(*args, **kwargs)
+
+            sample = {"counters": Counter(), "bytes": None}
+            token = current_sample.set(sample)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                current_sample.reset(token)
+                record(metric, elapsed, sample, weight=max(1, round(1 / flt(rate))))
+
+        return wrapper
+
+    return decorator
+
+
+def count(name):
+    """Count an event (cache hit, miss, ...) against the call being sampled, if any"""
+    sample = current_sample.get()
+    if sample is not None:
+        sample["counters"][name] += 1
+
+
+def record_payload(value):
+    """Record the size of what the sampled call sends to the browser"""
+    sample = current_sample.get()
+    if sample is None:
+        return
+    if isinstance(value, str):
+        value = value.encode()
+    if not isinstance(value, bytes):
+        value = json.dumps(value, separators=(",", ":"), default=str).encode()
+    sample["bytes"] = len(value)
+
+
+def incr(event):
+    """Count a rare event on every occurrence, without sampling"""
+    try:
+        cache = frappe.cache()
+        cache.pipeline().hincrby(cache.make_key(COUNTERS_KEY), event, 1).execute()
+    except Exception:
+        pass
+
+
+def record(metric, elapsed, sample, weight=1):
+    """Store one sample; counters are scaled by ``weight`` to estimate the real totals"""
+    try:
+        cache = frappe.cache()
+        counters_key = cache.make_key(COUNTERS_KEY)
+        latency_key = cache.make_key(LATENCY_KEY.format(metric))
+
+        pipe = cache.pipeline()
+        pipe.hincrby(counters_key, f"{metric}:calls", weight)
+        pipe.hincrby(counters_key, f"{metric}:samples", 1)
+        for name, value in sample["counters"].items():
+            pipe.hincrby(counters_key, f"{metric}:{name}", value * weight)
+        pipe.lpush(latency_key, round(elapsed, 3))
+        pipe.ltrim(latency_key, 0, MAX_SAMPLES - 1)
+        if sample["bytes"] is not None:
+            bytes_key = cache.make_key(BYTES_KEY.format(metric))
+            pipe.lpush(bytes_key, sample["bytes"])
+            pipe.ltrim(bytes_key, 0, MAX_SAMPLES - 1)
+        pipe.execute()
+    except Exception:
+        # Instrumentation must never break the request it measures
+        pass
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return None
+    index = max(0, math.ceil(percent / 100 * len(values)) - 1)
+    return values[index]
+
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else None,
+    }
+
+
+@frappe.whitelist()
+def get_stats():
+    """Latency percentiles and counters of the theme hot paths on this site"""
+    frappe.only_for("System Manager")
+
+    cache = frappe.cache()
+    pipe = cache.pipeline()
+    pipe.hgetall(cache.make_key(COUNTERS_KEY))
+    for metric in METRICS:
+        pipe.lrange(cache.make_key(LATENCY_KEY.format(metric)), 0, -1)
+        pipe.lrange(cache.make_key(BYTES_KEY.format(metric)), 0, -1)
+    counters, *lists = pipe.execute()
+    counters = {frappe.safe_decode(key): int(value) for key, value in (counters or {}).items()}
+
+    metrics = {}
+    for i, metric in enumerate(METRICS):
+        prefix = f"{metric}:"
+        metric_counters = {key[len(prefix) :]: value for key, value in counters.items() if key.startswith(prefix)}
+        latency, payload_bytes = lists[2 * i], lists[2 * i + 1]
+        metrics[metric] = {
+            **metric_counters,
+            "latency_ms": summarize([float(value) for value in latency]),
+            "payload_bytes": summarize([int(value) for value in payload_bytes]),
+        }
+
+    return {
+        "sample_rate": get_sample_rate(),
+        "metrics": metrics,
+        "events": {event: counters.get(event, 0) for event in EVENTS},
+    }
+
+
+@frappe.whitelist(methods=["POST"])
+def reset_stats():
+    frappe.only_for("System Manager")
+
+    frappe.cache().delete_value(
+        [
+            COUNTERS_KEY,
+            *(LATENCY_KEY.format(metric) for metric in METRICS),
+            *(BYTES_KEY.format(metric) for metric in METRICS),
+        ]
+    )
@@ -0,0 +1,48 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Per-user appearance preferences (dark mode, sidebar state, ...).
+
+They are kept in Frappe's User Settings, so a toggle is one small Redis hash
+write (synced to the database by Frappe's scheduler). AhmadCSS Settings and the
+shared theme caches are never touched.
+"""
+
+import frappe
+from frappe import _
+from frappe.model.utils.user_settings import get_user_settings, update_user_settings
+from frappe.utils import cint
+
+# User Settings are namespaced by doctype
+USER_SETTINGS_DOCTYPE = "AhmadCSS Settings"
+
+# Preference name -> cast applied to incoming values
+PREFERENCE_FIELDS = {
+    "dark_mode": cint,
+    "sidebar_collapsed": cint,
+}
+
+
+def get_preferences():
+    """Return the preferences the current user has set; unset ones are left out"""
+    if frappe.session.user == "Guest":
+        return {}
+
+    stored = frappe.parse_json(get_user_settings(USER_SETTINGS_DOCTYPE))
+    if not isinstance(stored, dict):
+        return {}
+    return {key: stored[key] for key in PREFERENCE_FIELDS if key in stored}
+
+
+@frappe.whitelist()
+def set_preference(key, value):
+    """Save one appearance preference for the current user"""
+    if key not in PREFERENCE_FIELDS:
+        frappe.throw(_("Invalid preference: {0}").format(key))
+
+    value = PREFERENCE_FIELDS[key](value)
+    update_user_settings(USER_SETTINGS_DOCTYPE, {key: value})
+
+    # The boot is cached per user; drop only this user's copy
+    frappe.cache().hdel("bootinfo", frappe.session.user)
+    return {key: value}
@@ -0,0 +1,47 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Charts chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) on the first
+   AhmadCSS.charts call. ECharts itself (echarts.bundle.js) is fetched the
+   first time a chart is drawn.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { CONFIG, requireBundle } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // CHARTS (ECharts, loaded on demand)
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Charts = {
+        loading: null,
+        
+        // Resolves to the echarts namespace; the bundle is fetched only once
+        load() {
+            if (window.echarts) return Promise.resolve(window.echarts);
+            if (!this.loading) {
+                this.loading = requireBundle(CONFIG.chartsBundle).then(() => {
+                    if (!window.echarts) throw new Error(`AhmadCSS: ${CONFIG.chartsBundle} did not load`);
+                    return window.echarts;
+                });
+                // Let a later chart retry after a failed fetch
+                this.loading.catch(() => { this.loading = null; });
+            }
+            return this.loading;
+        },
+        
+        // Draw a chart in `element`, matching the current dark mode
+        async render(element, option, opts = {}) {
+            const echarts = await this.load();
+            const dark = document.documentElement.getAttribute('data-dark-mode') === 'dark';
+            const chart = echarts.getInstanceByDom(element) || echarts.init(element, dark ? 'dark' : null, opts);
+            chart.setOption(option);
+            return chart;
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('charts', Charts);
+    
+})();
@@ -0,0 +1,202 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Theme controls chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) on desk pages of admins, and
+   by anyone's first AhmadCSS.setTheme / toggleTheme / patchSettings call:
+   the saved custom theme, the dark mode and customizer navbar buttons,
+   colour theme switching and versioned settings writes.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { Storage, Permissions, Toast, Events, Chunks, DarkMode, ColorTheme } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // SETTINGS PATCH - Send settings changes as one versioned request
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const SettingsPatch = {
+        version: null,
+        inflight: Promise.resolve(),
+        
+        getVersion() {
+            if (this.version !== null) return this.version;
+            return window.frappe?.boot?.ahmadcss?.overrides?.version ??
+                   Storage.get('theme_settings')?.settings?.version ?? null;
+        },
+        
+        send(changes) {
+            if (!Permissions.canEditTheme() || !Object.keys(changes).length || !(window.frappe && frappe.call)) {
+                return this.inflight;
+            }
+            
+            // One request at a time, so each patch carries the version of the previous one
+            this.inflight = this.inflight.then(() => frappe.call({
+                method: 'ahmadcss.api.patch_theme_settings',
+                type: 'POST',
+                args: {
+                    changes: JSON.stringify(changes),
+                    version: this.getVersion()
+                },
+                freeze: false
+            }).then((r) => {
+                const result = r.message || {};
+                if (result.version) this.version = result.version;
+                if (result.conflict) {
+                    Toast.warning(__('Theme settings were changed by someone else. Reload to see the latest.'));
+                }
+            }).catch(() => {
+                // Changes are already applied locally
+            }));
+            return this.inflight;
+        }
+    };
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // THEME SWITCH - Change the colour theme from the page
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const ThemeSwitch = {
+        setTheme(themeName) {
+            const normalized = ColorTheme.normalizeThemeName(themeName);
+            if (ColorTheme.themes.includes(normalized)) {
+                ColorTheme.currentTheme = normalized;
+                Storage.set('color_theme', normalized);
+                ColorTheme.apply();
+                this.updateSwitcher();
+                
+                // Sync with server
+                this.syncToServer(normalized);
+                
+                const config = ColorTheme.themeConfig[normalized];
+                Toast.show({
+                    message: __('Switched to {0} theme', [config.name + ' ' + config.emoji]),
+                    type: 'info'
+                });
+            }
+        },
+        
+        syncToServer(themeName) {
+            // Don't sync if user is on settings page to avoid timestamp conflicts
+            if (window.location.pathname.includes('AhmadCSS%20Settings') ||
+                window.location.pathname.includes('AhmadCSS-Settings') ||
+                window.location.pathname.includes('ahmadcss-settings')) {
+                return;
+            }
+            
+            SettingsPatch.send({ color_theme: this.getDisplayName(themeName) });
+        },
+        
+        getDisplayName(themeName) {
+            const mapping = {
+                'purple': 'Purple',
+                'silver': 'Silver'
+            };
+            return mapping[themeName] || themeName;
+        },
+        
+        toggle() {
+            const themes = ColorTheme.themes;
+            const nextIndex = (themes.indexOf(ColorTheme.currentTheme) + 1) % themes.length;
+            this.setTheme(themes[nextIndex]);
+        },
+        
+        updateSwitcher() {
+            const buttons = document.querySelectorAll('.ahmadcss-theme-btn');
+            buttons.forEach(btn => {
+                btn.classList.toggle('active', btn.dataset.theme === ColorTheme.currentTheme);
+            });
+        }
+    };
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // NAVBAR BUTTONS - Dark mode and theme customizer (admins only)
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const NavbarButtons = {
+        init() {
+            if (!Permissions.isAdmin()) return;
+            
+            const navbar = document.querySelector('.navbar');
+            if (!navbar) return;
+            const navRight = navbar.querySelector('.navbar-right') || navbar.querySelector('.nav-right') || navbar;
+            
+            this.createDarkModeToggle(navRight);
+            this.createCustomizerToggle(navRight);
+        },
+        
+        createDarkModeToggle(navRight) {
+            if (document.querySelector('.ahmadcss-darkmode-toggle')) return;
+            
+            const toggleBtn = document.createElement('button');
+            toggleBtn.className = 'ahmadcss-darkmode-toggle';
+            toggleBtn.setAttribute('aria-label', 'Toggle Dark Mode');
+            toggleBtn.innerHTML = this.getDarkModeIcon();
+            
+            Events.onClick('.ahmadcss-darkmode-toggle', () => DarkMode.toggle());
+            document.addEventListener('ahmadcss:dark-mode-changed', () => {
+                toggleBtn.innerHTML = this.getDarkModeIcon();
+            });
+            
+            navRight.appendChild(toggleBtn);
+        },
+        
+        getDarkModeIcon() {
+            return DarkMode.isEnabled
+                ? '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="5"/><path d="M12 1v2M12 21v2M4.22 4.22l1.42 1.42M18.36 18.36l1.42 1.42M1 12h2M21 12h2M4.22 19.78l1.42-1.42M18.36 5.64l1.42-1.42"/></svg>'
+                : '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/></svg>';
+        },
+        
+        createCustomizerToggle(navRight) {
+            if (document.querySelector('.ahmadcss-customizer-toggle')) return;
+            
+            const toggleBtn = document.createElement('button');
+            toggleBtn.className = 'ahmadcss-customizer-toggle';
+            toggleBtn.setAttribute('aria-label', 'Theme Customizer');
+            toggleBtn.innerHTML = '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="3"/><path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"/></svg>';
+            
+            Events.onClick('.ahmadcss-customizer-toggle', () => Chunks.load('customizer').then(panel => panel.toggle()));
+            
+            navRight.appendChild(toggleBtn);
+            
+            Chunks.prefetch(['customizer']);
+        }
+    };
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // CONTROLS
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Controls = {
+        init() {
+            this.loadSavedTheme();
+            NavbarButtons.init();
+        },
+        
+        // Overrides saved by the customizer panel in this browser
+        loadSavedTheme() {
+            const theme = Storage.get('custom_theme');
+            if (!theme) return;
+            
+            const style = document.documentElement.style;
+            style.setProperty('--primary-600', theme.primaryColor);
+            style.setProperty('--secondary-500', theme.secondaryColor);
+            style.setProperty('--glass-blur', theme.blur + 'px');
+            style.setProperty('--glass-white', `rgba(255, 255, 255, ${theme.opacity / 100})`);
+            style.setProperty('--radius-lg', theme.radius + 'px');
+        },
+        
+        // The version another save announced over realtime (see the theme-updates chunk)
+        setVersion(version) {
+            SettingsPatch.version = version;
+        },
+        
+        send: (changes) => SettingsPatch.send(changes),
+        setTheme: (themeName) => ThemeSwitch.setTheme(themeName),
+        toggleTheme: () => ThemeSwitch.toggle()
+    };
+    
+    window.AhmadCSS.defineChunk('controls', Controls);
+    
+})();
@@ -0,0 +1,57 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Custom CSS / JS chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) only when the settings have
+   Custom CSS or Custom JS, or a custom stylesheet linked earlier has to go.
+   ahmadcss.custom_code publishes them as hashed files on save; pages get
+   their URLs only. The script's URL is in the desk boot of logged-in users,
+   and only while "Run Custom JavaScript" is on.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // CUSTOM CODE MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const CustomCode = {
+        scriptLoaded: false,
+        
+        apply(settings) {
+            if (!settings) return;
+            this.linkStylesheet(settings.custom_css_url);
+            this.loadScript(window.frappe?.boot?.ahmadcss?.custom_js_url);
+        },
+        
+        // Usually already in <head> (ahmadcss.website); swap it when the CSS changed
+        linkStylesheet(url) {
+            const links = document.querySelectorAll('link[href^="/assets/ahmadcss/css/custom-"]');
+            if (!url) {
+                links.forEach(link => link.remove());
+                return;
+            }
+            if (Array.from(links).some(link => link.getAttribute('href') === url)) return;
+            
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = url;
+            link.onload = () => links.forEach(old => old.remove());
+            document.head.appendChild(link);
+        },
+        
+        // Runs once per page load, after the page is parsed; a changed script runs from the next load
+        loadScript(url) {
+            if (!url || this.scriptLoaded) return;
+            this.scriptLoaded = true;
+            
+            const script = document.createElement('script');
+            script.src = url;
+            script.async = false;
+            document.head.appendChild(script);
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('customCode', CustomCode);
+    
+})();
@@ -0,0 +1,167 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Theme customizer chunk (admins only)
+
+   The controls chunk (ahmadcss-controls.bundle.js) applies the saved custom
+   theme and adds the navbar button; this panel is loaded when an admin first
+   opens it, or when the browser is idle.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { Storage, SettingsPatch, Toast, Events } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // THEME CUSTOMIZER MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const ThemeCustomizer = {
+        isOpen: false,
+        panel: null,
+        
+        init() {
+            this.createPanel();
+            this.syncPanel();
+        },
+        
+        createPanel() {
+            if (document.querySelector('.ahmadcss-customizer')) return;
+            
+            this.panel = document.createElement('div');
+            this.panel.className = 'ahmadcss-customizer';
+            this.panel.innerHTML = `
+                <div class="ahmadcss-customizer-header">
+                    <h3>🎨 Theme Customizer</h3>
+                    <button class="ahmadcss-customizer-close" aria-label="Close">
+                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                            <line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>
+                        </svg>
+                    </button>
+                </div>
+                <div class="ahmadcss-customizer-body">
+                    <div class="ahmadcss-customizer-section">
+                        <label>Primary Color</label>
+                        <input type="color" id="ahmadcss-primary-color" value="#0f766e">
+                    </div>
+                    <div class="ahmadcss-customizer-section">
+                        <label>Secondary Color</label>
+                        <input type="color" id="ahmadcss-secondary-color" value="#d97706">
+                    </div>
+                    <div class="ahmadcss-customizer-section">
+                        <label>Glass Blur: <span id="blur-value">20</span>px</label>
+                        <input type="range" id="ahmadcss-blur" min="0" max="50" value="20">
+                    </div>
+                    <div class="ahmadcss-customizer-section">
+                        <label>Glass Opacity: <span id="opacity-value">72</span>%</label>
+                        <input type="range" id="ahmadcss-opacity" min="30" max="100" value="72">
+                    </div>
+                    <div class="ahmadcss-customizer-section">
+                        <label>Border Radius: <span id="radius-value">16</span>px</label>
+                        <input type="range" id="ahmadcss-radius" min="0" max="30" value="16">
+                    </div>
+                </div>
+                <div class="ahmadcss-customizer-footer">
+                    <button class="ahmadcss-btn ahmadcss-btn-secondary" id="ahmadcss-reset">Reset</button>
+                    <button class="ahmadcss-btn ahmadcss-btn-primary" id="ahmadcss-save">Save</button>
+                </div>
+            `;
+            
+            document.body.appendChild(this.panel);
+            this.bindEvents();
+        },
+        
+        // One input listener for the panel; each control maps to a CSS token and a setting.
+        // Input only previews locally; the settings are written once, on Save
+        inputs: {
+            'ahmadcss-primary-color': { token: '--primary-600', field: 'primary_color' },
+            'ahmadcss-secondary-color': { token: '--secondary-500', field: 'secondary_color' },
+            'ahmadcss-blur': { token: '--glass-blur', field: 'glass_blur', label: 'blur-value', unit: 'px' },
+            'ahmadcss-opacity': { token: '--glass-white', field: 'glass_opacity', label: 'opacity-value',
+                                  format: (value) => `rgba(255, 255, 255, ${value / 100})` },
+            'ahmadcss-radius': { token: '--radius-lg', label: 'radius-value', unit: 'px' }
+        },
+        
+        bindEvents() {
+            this.panel.addEventListener('input', (e) => {
+                const input = this.inputs[e.target.id];
+                if (!input) return;
+                
+                const value = e.target.value;
+                if (input.label) {
+                    document.getElementById(input.label).textContent = value;
+                }
+                this.updateCSS(input.token, input.format ? input.format(value) : value + (input.unit || ''));
+            });
+            
+            Events.onClick('.ahmadcss-customizer-close', () => this.close());
+            Events.onClick('#ahmadcss-save', () => this.saveTheme());
+            Events.onClick('#ahmadcss-reset', () => this.resetTheme());
+        },
+        
+        // Sliders fire many input events per frame; only the last value per token is written
+        updateCSS(property, value) {
+            Events.write(property, () => document.documentElement.style.setProperty(property, value));
+        },
+        
+        saveTheme() {
+            const theme = {
+                primaryColor: this.panel.querySelector('#ahmadcss-primary-color').value,
+                secondaryColor: this.panel.querySelector('#ahmadcss-secondary-color').value,
+                blur: this.panel.querySelector('#ahmadcss-blur').value,
+                opacity: this.panel.querySelector('#ahmadcss-opacity').value,
+                radius: this.panel.querySelector('#ahmadcss-radius').value
+            };
+            
+            Storage.set('custom_theme', theme);
+            SettingsPatch.send(this.getChanges());
+            Toast.success(__('Theme saved successfully') + ' ✨');
+        },
+        
+        // {setting: value} of the controls backed by a setting
+        getChanges() {
+            const changes = {};
+            Object.entries(this.inputs).forEach(([id, input]) => {
+                if (!input.field) return;
+                const value = this.panel.querySelector(`#${id}`).value;
+                changes[input.field] = input.unit || input.format ? parseInt(value, 10) : value;
+            });
+            return changes;
+        },
+        
+        // The controls chunk already applied the saved theme; show its values
+        syncPanel() {
+            const theme = Storage.get('custom_theme');
+            if (!theme) return;
+            
+            if (this.panel) {
+                this.panel.querySelector('#ahmadcss-primary-color').value = theme.primaryColor;
+                this.panel.querySelector('#ahmadcss-secondary-color').value = theme.secondaryColor;
+                this.panel.querySelector('#ahmadcss-blur').value = theme.blur;
+                this.panel.querySelector('#ahmadcss-opacity').value = theme.opacity;
+                this.panel.querySelector('#ahmadcss-radius').value = theme.radius;
+                document.getElementById('blur-value').textContent = theme.blur;
+                document.getElementById('opacity-value').textContent = theme.opacity;
+                document.getElementById('radius-value').textContent = theme.radius;
+            }
+        },
+        
+        // Nothing reaches the server before Save, so dropping the local theme undoes the preview
+        resetTheme() {
+            Storage.remove('custom_theme');
+            location.reload();
+        },
+        
+        toggle() {
+            this.isOpen = !this.isOpen;
+            this.panel.classList.toggle('ahmadcss-customizer-open', this.isOpen);
+        },
+        
+        close() {
+            this.isOpen = false;
+            this.panel.classList.remove('ahmadcss-customizer-open');
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('customizer', ThemeCustomizer);
+    
+})();
@@ -0,0 +1,115 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Ripple and smooth scroll chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) when the browser is idle;
+   nothing here is needed for the first paint.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { Events, Performance } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // RIPPLE EFFECT MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const RippleEffect = {
+        init() {
+            Events.onClick('.btn, .shortcut-widget-box, .standard-sidebar-item, .ahmadcss-btn', (e, target) => this.ripple(e, target));
+            this.injectStyles();
+        },
+        
+        ripple(e, target) {
+            // One of the animations the lite and off performance tiers do without
+            if (Performance.tier !== 'full') return;
+
+            // Read layout now, write it in the next frame with the other DOM writes
+            const rect = target.getBoundingClientRect();
+            const size = Math.max(rect.width, rect.height);
+            const x = e.clientX - rect.left - size / 2;
+            const y = e.clientY - rect.top - size / 2;
+            const isStatic = getComputedStyle(target).position === 'static';
+            
+            const ripple = document.createElement('span');
+            ripple.className = 'ahmadcss-ripple';
+            ripple.style.cssText = `width:${size}px;height:${size}px;left:${x}px;top:${y}px`;
+            
+            Events.write(ripple, () => {
+                target.classList.add('ahmadcss-ripple-host');
+                target.classList.toggle('ahmadcss-ripple-host-static', isStatic);
+                target.appendChild(ripple);
+            });
+            
+            ripple.addEventListener('animationend', () => {
+                ripple.remove();
+                if (!target.querySelector('.ahmadcss-ripple')) {
+                    target.classList.remove('ahmadcss-ripple-host', 'ahmadcss-ripple-host-static');
+                }
+            }, { once: true });
+        },
+        
+        injectStyles() {
+            if (document.getElementById('ahmadcss-ripple-styles')) return;
+            
+            const style = document.createElement('style');
+            style.id = 'ahmadcss-ripple-styles';
+            style.textContent = `
+                .ahmadcss-ripple-host {
+                    overflow: hidden;
+                }
+                .ahmadcss-ripple-host-static {
+                    position: relative;
+                }
+                .ahmadcss-ripple {
+                    position: absolute;
+                    background: rgba(255, 255, 255, 0.3);
+                    border-radius: 50%;
+                    transform: scale(0);
+                    pointer-events: none;
+                    animation: ahmadcss-ripple 0.6s ease-out;
+                }
+                @keyframes ahmadcss-ripple {
+                    to {
+                        transform: scale(4);
+                        opacity: 0;
+                    }
+                }
+            `;
+            document.head.appendChild(style);
+        }
+    };
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // SMOOTH SCROLL MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const SmoothScroll = {
+        init() {
+            // Delegated, so links rendered after load are covered too
+            Events.onClick('a[href^="#"]', (e, anchor) => {
+                const targetId = anchor.getAttribute('href');
+                if (targetId === '#') return;
+                
+                const target = document.getElementById(decodeURIComponent(targetId.slice(1)));
+                if (target) {
+                    e.preventDefault();
+                    target.scrollIntoView({
+                        behavior: Performance.tier === 'off' ? 'auto' : 'smooth',
+                        block: 'start'
+                    });
+                }
+            });
+        }
+    };
+    
+    const Effects = {
+        init() {
+            RippleEffect.init();
+            SmoothScroll.init();
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('effects', Effects);
+    
+})();
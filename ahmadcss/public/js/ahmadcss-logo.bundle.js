@@ -0,0 +1,102 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Custom logo chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) only when the settings show
+   a custom logo, or one shown earlier has to go. It renders the variants
+   ahmadcss.logo writes into the navbar.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { Events } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // LOGO MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Logo = {
+        apply(settings) {
+            const brand = document.querySelector('.navbar .navbar-brand');
+            if (!brand || !settings) return;
+            
+            const src = settings.show_custom_logo ? (settings.logo_src || settings.custom_logo) : null;
+            const current = brand.querySelector('.ahmadcss-logo');
+            // Already showing this logo, or no logo either way
+            if (current ? current.dataset.src === src : !src) return;
+            
+            if (!src) {
+                Events.write('logo', () => {
+                    brand.querySelector('.ahmadcss-logo')?.remove();
+                    brand.classList.remove('ahmadcss-has-logo');
+                });
+                return;
+            }
+            
+            this.injectStyles();
+            const picture = this.render(settings, src);
+            Events.write('logo', () => {
+                brand.querySelector('.ahmadcss-logo')?.remove();
+                brand.prepend(picture);
+                brand.classList.add('ahmadcss-has-logo');
+            });
+        },
+        
+        // AVIF where supported, WebP otherwise; the placeholder fills the box until it loads
+        render(settings, src) {
+            const picture = document.createElement('picture');
+            picture.className = 'ahmadcss-logo';
+            picture.dataset.src = src;
+            
+            if (settings.logo_srcset_avif) {
+                const source = document.createElement('source');
+                source.type = 'image/avif';
+                source.srcset = settings.logo_srcset_avif;
+                picture.appendChild(source);
+            }
+            
+            const img = document.createElement('img');
+            img.src = src;
+            img.alt = window.frappe?.boot?.sysdefaults?.app_name || 'Logo';
+            img.decoding = 'async';
+            if (settings.logo_srcset) img.srcset = settings.logo_srcset;
+            if (settings.logo_width && settings.logo_height) {
+                img.width = settings.logo_width;
+                img.height = settings.logo_height;
+            }
+            if (settings.logo_placeholder) {
+                img.style.backgroundImage = `url("${settings.logo_placeholder}")`;
+                img.addEventListener('load', () => img.style.removeProperty('background-image'), { once: true });
+            }
+            picture.appendChild(img);
+            return picture;
+        },
+        
+        // Hides the default logo (navbar ::before and Frappe's app logo) while ours is shown
+        injectStyles() {
+            if (document.getElementById('ahmadcss-logo-styles')) return;
+            
+            const style = document.createElement('style');
+            style.id = 'ahmadcss-logo-styles';
+            style.textContent = `
+                .ahmadcss-has-logo::before,
+                .ahmadcss-has-logo > .app-logo {
+                    display: none !important;
+                }
+                .ahmadcss-logo img {
+                    display: block;
+                    height: 36px;
+                    width: auto;
+                    max-width: 200px;
+                    object-fit: contain;
+                    background-size: contain;
+                    background-repeat: no-repeat;
+                }
+            `;
+            document.head.appendChild(style);
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('logo', Logo);
+    
+})();
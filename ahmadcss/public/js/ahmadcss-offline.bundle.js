@@ -0,0 +1,37 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Service worker chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) when the browser is idle,
+   only while "Enable Service Worker" is on or a worker of ours still controls
+   the page and has to be removed.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // OFFLINE CACHE MODULE - Optional service worker for theme assets and settings
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const OfflineCache = {
+        scriptUrl: '/api/method/ahmadcss.service_worker.get_service_worker',
+        
+        // Register or remove the worker to match the "Enable Service Worker" setting
+        sync(settings) {
+            if (!settings || !('serviceWorker' in navigator)) return;
+            
+            if (settings.enable_service_worker) {
+                navigator.serviceWorker.register(this.scriptUrl, { scope: '/' }).catch(() => {});
+            } else if (navigator.serviceWorker.controller) {
+                navigator.serviceWorker.getRegistrations().then(registrations => {
+                    registrations
+                        .filter(registration => registration.active?.scriptURL.includes(this.scriptUrl))
+                        .forEach(registration => registration.unregister());
+                });
+            }
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('offline', OfflineCache);
+    
+})();
@@ -0,0 +1,86 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Performance tier detection chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) when the browser is idle, on
+   devices that have no tier yet while "Performance Mode" is Auto. The tier it
+   picks is remembered, so later page loads apply it without this chunk.
+   AhmadCSS.performance.redetect() loads it to pick the tier again.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { Storage, Performance } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // PERFORMANCE PROBE MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const PerformanceProbe = {
+        probing: false,
+        
+        // Below these, a device gets the lite tier without probing
+        minDeviceMemory: 4,       // GB, navigator.deviceMemory
+        minCores: 4,              // navigator.hardwareConcurrency
+        // Frames sampled, and the average frame time (ms) that means lite
+        probeFrames: 30,
+        slowFrameTime: 1000 / 40,
+        
+        // Forget this device's tier and pick it again
+        redetect() {
+            Storage.remove('performance_tier');
+            Performance.sync(Storage.get('theme_settings')?.settings);
+        },
+        
+        // Pick this device's tier and remember it
+        pick() {
+            const tier = this.detect();
+            if (tier === 'full') {
+                this.probe();
+                return;
+            }
+            Storage.set('performance_tier', tier);
+            Performance.set(tier);
+        },
+        
+        // Pick a tier from what the browser tells about the device
+        detect() {
+            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return 'off';
+            
+            const memory = navigator.deviceMemory;
+            const cores = navigator.hardwareConcurrency;
+            if ((memory && memory < this.minDeviceMemory) || (cores && cores < this.minCores)) return 'lite';
+            return 'full';
+        },
+        
+        // Time a few frames; slow ones mean the effects cost too much
+        probe() {
+            if (this.probing) return;
+            this.probing = true;
+            
+            const times = [];
+            let last = null;
+            const frame = (now) => {
+                if (last !== null) times.push(now - last);
+                last = now;
+                if (times.length < this.probeFrames && !document.hidden) {
+                    requestAnimationFrame(frame);
+                    return;
+                }
+                
+                this.probing = false;
+                // A hidden tab pauses frames: try again on a later page load
+                if (times.length < this.probeFrames) return;
+                
+                const average = times.reduce((sum, time) => sum + time, 0) / times.length;
+                const tier = average > this.slowFrameTime ? 'lite' : 'full';
+                Storage.set('performance_tier', tier);
+                Performance.set(tier);
+            };
+            requestAnimationFrame(frame);
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('performance', PerformanceProbe);
+    
+})();
@@ -0,0 +1,140 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Sidebar chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) right after it has applied
+   the saved collapsed state: the desktop collapse toggle and the mobile
+   sidebar button.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { Storage, Preferences, Events } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // SIDEBAR TOGGLE MODULE (Desktop & Mobile)
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const SidebarToggle = {
+        isCollapsed: false,
+        
+        init() {
+            // The core bundle already applied the saved state
+            this.isCollapsed = document.body.classList.contains('sidebar-collapsed');
+            
+            // Frappe's toggle buttons, wherever and whenever they are rendered
+            Events.onClick('.sidebar-toggle-btn, .sidebar-toggle-placeholder, [data-action="toggle-sidebar"]', (e) => {
+                e.preventDefault();
+                e.stopPropagation();
+                this.toggle();
+            });
+            
+            // Our navbar button collapses the sidebar on desktop (it opens it on mobile)
+            Events.onClick('.ahmadcss-sidebar-toggle', (e) => {
+                if (window.innerWidth < 992) return;
+                e.preventDefault();
+                this.toggle();
+            });
+            
+            // Listen to Frappe's toggle event for compatibility
+            if (window.jQuery) {
+                jQuery(document.body).on('toggleSidebar', () => this.syncFrappeToggle());
+            }
+        },
+        
+        syncFrappeToggle() {
+            Events.write('sidebar-sync', () => {
+                const sidebar = document.querySelector('.layout-side-section');
+                const isVisible = sidebar && !this.isCollapsed && window.getComputedStyle(sidebar).display !== 'none';
+                document.body.classList.toggle('sidebar-collapsed', !isVisible);
+            });
+        },
+        
+        toggle() {
+            this.isCollapsed = !this.isCollapsed;
+            Storage.set('sidebar_collapsed', this.isCollapsed);
+            Preferences.set('sidebar_collapsed', this.isCollapsed ? 1 : 0);
+            this.apply();
+        },
+        
+        // The body class collapses every sidebar Frappe renders later too (see components.css)
+        apply() {
+            Events.write('sidebar', () => {
+                document.body.classList.toggle('sidebar-collapsed', this.isCollapsed);
+            });
+        },
+        
+        collapse() {
+            if (!this.isCollapsed) this.toggle();
+        },
+        
+        expand() {
+            if (this.isCollapsed) this.toggle();
+        }
+    };
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // MOBILE SIDEBAR MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const MobileSidebar = {
+        init() {
+            this.createToggleButton();
+            this.bindEvents();
+        },
+        
+        // Shown below 992px by components.css
+        createToggleButton() {
+            const navbar = document.querySelector('.navbar');
+            if (!navbar || document.querySelector('.ahmadcss-sidebar-toggle')) return;
+            
+            const toggleBtn = document.createElement('button');
+            toggleBtn.className = 'ahmadcss-sidebar-toggle';
+            toggleBtn.innerHTML = '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="3" y1="6" x2="21" y2="6"/><line x1="3" y1="12" x2="21" y2="12"/><line x1="3" y1="18" x2="21" y2="18"/></svg>';
+            
+            navbar.insertBefore(toggleBtn, navbar.firstChild);
+        },
+        
+        bindEvents() {
+            Events.onClick(null, (e) => {
+                if (window.innerWidth >= 992) return;
+                
+                if (e.target.closest('.ahmadcss-sidebar-toggle')) {
+                    this.toggle();
+                    return;
+                }
+                
+                // Close the open sidebar on a click outside it
+                const sidebar = document.querySelector('.layout-side-section.show');
+                if (sidebar && !sidebar.contains(e.target)) {
+                    Events.write('mobile-sidebar', () => sidebar.classList.remove('show', 'opened'));
+                }
+            });
+        },
+        
+        toggle() {
+            const sidebar = document.querySelector('.layout-side-section');
+            if (sidebar) {
+                Events.write('mobile-sidebar', () => {
+                    const open = !sidebar.classList.contains('show');
+                    sidebar.classList.toggle('show', open);
+                    sidebar.classList.toggle('opened', open);
+                });
+            }
+        }
+    };
+    
+    const Sidebar = {
+        init() {
+            SidebarToggle.init();
+            MobileSidebar.init();
+        },
+        
+        toggle: () => SidebarToggle.toggle(),
+        collapse: () => SidebarToggle.collapse(),
+        expand: () => SidebarToggle.expand()
+    };
+    
+    window.AhmadCSS.defineChunk('sidebar', Sidebar);
+    
+})();
@@ -0,0 +1,111 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Loading skeletons chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) the first time
+   AhmadCSS.skeleton is used.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // LOADING SKELETON MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Skeleton = {
+        show(container, options = {}) {
+            const {
+                rows = 3,
+                avatar = false,
+                type = 'lines' // 'lines', 'card', 'table', 'form'
+            } = options;
+            
+            const element = typeof container === 'string' 
+                ? document.querySelector(container) 
+                : container;
+            
+            if (!element) return null;
+            
+            const skeleton = document.createElement('div');
+            skeleton.className = 'ahmadcss-skeleton-wrapper';
+            skeleton.innerHTML = this.getTemplate(type, rows, avatar);
+            
+            element.innerHTML = '';
+            element.appendChild(skeleton);
+            
+            return skeleton;
+        },
+        
+        hide(container) {
+            const element = typeof container === 'string' 
+                ? document.querySelector(container) 
+                : container;
+            
+            if (!element) return;
+            
+            const skeleton = element.querySelector('.ahmadcss-skeleton-wrapper');
+            if (skeleton) {
+                skeleton.classList.add('ahmadcss-skeleton-fade');
+                setTimeout(() => skeleton.remove(), 300);
+            }
+        },
+        
+        getTemplate(type, rows, avatar) {
+            switch(type) {
+                case 'card':
+                    return `
+                        <div class="ahmadcss-skeleton-card">
+                            <div class="ahmadcss-skeleton ahmadcss-skeleton-image"></div>
+                            <div class="ahmadcss-skeleton-body">
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-title"></div>
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-text"></div>
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-text" style="width: 60%"></div>
+                            </div>
+                        </div>
+                    `;
+                
+                case 'table':
+                    let tableRows = '';
+                    for (let i = 0; i < rows; i++) {
+                        tableRows += `
+                            <div class="ahmadcss-skeleton-table-row">
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 15%"></div>
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 25%"></div>
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 35%"></div>
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 15%"></div>
+                            </div>
+                        `;
+                    }
+                    return `<div class="ahmadcss-skeleton-table">${tableRows}</div>`;
+                
+                case 'form':
+                    let fields = '';
+                    for (let i = 0; i < rows; i++) {
+                        fields += `
+                            <div class="ahmadcss-skeleton-field">
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-label"></div>
+                                <div class="ahmadcss-skeleton ahmadcss-skeleton-input"></div>
+                            </div>
+                        `;
+                    }
+                    return `<div class="ahmadcss-skeleton-form">${fields}</div>`;
+                
+                default: // lines
+                    let lines = '';
+                    if (avatar) {
+                        lines += '<div class="ahmadcss-skeleton ahmadcss-skeleton-avatar"></div>';
+                    }
+                    lines += '<div class="ahmadcss-skeleton-lines">';
+                    for (let i = 0; i < rows; i++) {
+                        const width = i === rows - 1 ? '60%' : (90 - i * 10) + '%';
+                        lines += `<div class="ahmadcss-skeleton ahmadcss-skeleton-line" style="width: ${width}"></div>`;
+                    }
+                    lines += '</div>';
+                    return lines;
+            }
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('skeleton', Skeleton);
+    
+})();
@@ -0,0 +1,45 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Theme updates chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) when the browser is idle, on
+   pages with a realtime connection. The server announces each settings save
+   (ahmadcss.api.publish_theme_change); open pages fetch the new settings once
+   instead of polling.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { CONFIG, Storage, Chunks, ColorTheme } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // THEME UPDATES MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const ThemeUpdates = {
+        listening: false,
+        
+        init() {
+            if (this.listening || !window.frappe?.realtime?.on) return;
+            this.listening = true;
+            
+            frappe.realtime.on(CONFIG.themeChangedEvent, (data) => this.onChange(data));
+        },
+        
+        onChange(data) {
+            if (!data?.version) return;
+            // The next settings write of this page is based on that version
+            if (Chunks.modules.controls) Chunks.modules.controls.setVersion(data.version);
+            
+            const cached = Storage.get('theme_settings');
+            if (cached?.settings?.version === data.version) return;
+            
+            ColorTheme.loadThemeFromAPI(false, data.version)
+                .then(serverTheme => ColorTheme.applyServerTheme(serverTheme))
+                .catch(() => {});
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('themeUpdates', ThemeUpdates);
+    
+})();
@@ -0,0 +1,120 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Toast notifications chunk
+
+   Loaded by the core bundle (ahmadcss.bundle.js) on the first toast, or when
+   the browser is idle. Call it through AhmadCSS.toast / AhmadCSS.notify.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+(function() {
+    'use strict';
+    
+    const { CONFIG, Events } = window.AhmadCSS.core;
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // TOAST NOTIFICATIONS MODULE
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Toast = {
+        container: null,
+        
+        init() {
+            this.createContainer();
+            Events.onClick('.ahmadcss-toast-close', (e, button) => this.dismiss(button.closest('.ahmadcss-toast')));
+        },
+        
+        createContainer() {
+            if (document.querySelector('.ahmadcss-toast-container')) return;
+            
+            this.container = document.createElement('div');
+            this.container.className = 'ahmadcss-toast-container';
+            document.body.appendChild(this.container);
+        },
+        
+        show({ message, type = 'info', duration = CONFIG.toastDuration, title = null }) {
+            if (!this.container) this.createContainer();
+            
+            const toast = document.createElement('div');
+            toast.className = `ahmadcss-toast ahmadcss-toast-${type}`;
+            
+            const icons = {
+                success: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/></svg>',
+                error: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="15" y1="9" x2="9" y2="15"/><line x1="9" y1="9" x2="15" y2="15"/></svg>',
+                warning: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M10.29 3.86L1.82 18a2 2 0 0 0 1.71 3h16.94a2 2 0 0 0 1.71-3L13.71 3.86a2 2 0 0 0-3.42 0z"/><line x1="12" y1="9" x2="12" y2="13"/><line x1="12" y1="17" x2="12.01" y2="17"/></svg>',
+                info: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="12" y1="16" x2="12" y2="12"/><line x1="12" y1="8" x2="12.01" y2="8"/></svg>'
+            };
+            
+            // استخدام DOM API بدلاً من innerHTML لمنع XSS
+            const iconDiv = document.createElement('div');
+            iconDiv.className = 'ahmadcss-toast-icon';
+            iconDiv.innerHTML = icons[type] || icons.info;  // Safe: predefined icons only
+            
+            const contentDiv = document.createElement('div');
+            contentDiv.className = 'ahmadcss-toast-content';
+            
+            if (title) {
+                const titleDiv = document.createElement('div');
+                titleDiv.className = 'ahmadcss-toast-title';
+                titleDiv.textContent = title;  // Safe: textContent escapes HTML
+                contentDiv.appendChild(titleDiv);
+            }
+            
+            const messageDiv = document.createElement('div');
+            messageDiv.className = 'ahmadcss-toast-message';
+            messageDiv.textContent = message;  // Safe: textContent escapes HTML
+            contentDiv.appendChild(messageDiv);
+            
+            const closeBtn = document.createElement('button');
+            closeBtn.className = 'ahmadcss-toast-close';
+            closeBtn.setAttribute('aria-label', 'Close');
+            closeBtn.innerHTML = '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/></svg>';
+            
+            const progressDiv = document.createElement('div');
+            progressDiv.className = 'ahmadcss-toast-progress';
+            
+            toast.appendChild(iconDiv);
+            toast.appendChild(contentDiv);
+            toast.appendChild(closeBtn);
+            toast.appendChild(progressDiv);
+            
+            // Auto dismiss
+            setTimeout(() => this.dismiss(toast), duration);
+            
+            // Progress bar animation
+            progressDiv.style.animation = `ahmadcss-toast-progress ${duration}ms linear forwards`;
+            
+            this.container.appendChild(toast);
+            
+            // Trigger animation
+            requestAnimationFrame(() => {
+                toast.classList.add('ahmadcss-toast-show');
+            });
+            
+            return toast;
+        },
+        
+        dismiss(toast) {
+            toast.classList.remove('ahmadcss-toast-show');
+            toast.classList.add('ahmadcss-toast-hide');
+            setTimeout(() => toast.remove(), 300);
+        },
+        
+        success(message, title = null) {
+            return this.show({ message, type: 'success', title });
+        },
+        
+        error(message, title = null) {
+            return this.show({ message, type: 'error', title });
+        },
+        
+        warning(message, title = null) {
+            return this.show({ message, type: 'warning', title });
+        },
+        
+        info(message, title = null) {
+            return this.show({ message, type: 'info', title });
+        }
+    };
+    
+    window.AhmadCSS.defineChunk('toast', Toast);
+    
+})();
@@ -3,13 +3,22 @@
    JavaScript Module for Frappe/ERPNext
    
    Features:
-   - Dark Mode Toggle with persistence
+   - Color theme, performance tier and dark mode, applied before the first paint
+   - Saved sidebar state
+   
+   Loaded on first use or when idle (ahmadcss-*.bundle.js, see Chunks):
+   - Sidebar toggles and Mobile Sidebar
+   - Theme controls for admins: navbar buttons, theme switching, settings writes
    - Toast Notifications
    - Loading Skeletons
-   - Theme Customizer
-   - Ripple Effects
-   - Smooth Scroll
-   - Mobile Sidebar
+   - Theme Customizer panel
+   - Ripple Effects and Smooth Scroll
+   - Performance tier detection
+   - Live theme updates over realtime
+   - Charts
+   - Service worker, Custom CSS / JS and custom logo, when the settings use them
+   
+   scripts/check-bundle-size.js keeps the built core within its size budget.
    ═══════════════════════════════════════════════════════════════════════════ */
 
 (function() {
@@ -26,7 +35,84 @@
         sidebarWidth: 260,
         animationDuration: 250,
         toastDuration: 4000,
-        storagePrefix: 'ahmadcss_'
+        storagePrefix: 'ahmadcss_',
+        // Rules shared by every color theme; each theme adds a small delta sheet
+        themeBaseCSS: 'glass-base.css',
+        // Tree-shaken ECharts, fetched the first time a chart is drawn
+        chartsBundle: 'echarts.bundle.js',
+        // Realtime event published when AhmadCSS Settings are saved
+        themeChangedEvent: 'ahmadcss_theme_changed',
+        // Pages without a desk boot re-check the theme settings at most this often (ms);
+        // desk pages are told about changes over realtime instead
+        themeRevalidateInterval: 10 * 60 * 1000,
+        // Feature bundles loaded on first use or when idle (see Chunks)
+        chunks: {
+            sidebar: 'ahmadcss-sidebar.bundle.js',
+            controls: 'ahmadcss-controls.bundle.js',
+            themeUpdates: 'ahmadcss-theme-updates.bundle.js',
+            charts: 'ahmadcss-charts.bundle.js',
+            toast: 'ahmadcss-toast.bundle.js',
+            skeleton: 'ahmadcss-skeleton.bundle.js',
+            customizer: 'ahmadcss-customizer.bundle.js',
+            effects: 'ahmadcss-effects.bundle.js',
+            performance: 'ahmadcss-performance.bundle.js',
+            offline: 'ahmadcss-offline.bundle.js',
+            customCode: 'ahmadcss-custom-code.bundle.js',
+            logo: 'ahmadcss-logo.bundle.js'
+        }
+    };
+    
+    // Public defaults of AhmadCSS Settings, tagged with ahmadcss.settings.SCHEMA_VERSION.
+    // Desk boots only send the fields that differ from these. If the doctype
+    // defaults change, the schema no longer matches and settings are fetched in full.
+    const THEME_DEFAULTS = {
+        schema: 'a5f9b74f1702ea09e616',
+        values: {
+            enable_theme: 1,
+            color_theme: 'Silver',
+            dark_mode: 0,
+            enable_animations: 1,
+            animation_speed: 'Normal',
+            header_style: 'Gradient',
+            header_gradient_start: '#0f3b4a',
+            header_gradient_end: '#0f766e',
+            header_blur: 30,
+            show_custom_logo: 0,
+            custom_logo: null,
+            body_gradient_start: '#dceef0',
+            body_gradient_middle: '#edf5f3',
+            body_gradient_end: '#efe1cd',
+            enable_glassmorphism: 1,
+            glass_blur: 20,
+            glass_opacity: 72,
+            performance_mode: 'Auto',
+            sidebar_style: 'Glass',
+            sidebar_gradient_start: '#1e1e2e',
+            sidebar_gradient_end: '#2d2d3f',
+            sidebar_width: 260,
+            sidebar_blur: 20,
+            sidebar_position: 'Left',
+            footer_style: 'Gradient',
+            footer_gradient_start: '#1e1e2e',
+            footer_gradient_end: '#2d2d3f',
+            footer_blur: 10,
+            show_footer: 1,
+            font_family: 'Cairo',
+            font_size_base: 14,
+            arabic_font: 'Cairo',
+            enable_custom_fonts: 1,
+            google_fonts_fallback: 1,
+            primary_color: '#0f766e',
+            secondary_color: '#d97706',
+            success_color: '#10b981',
+            warning_color: '#f59e0b',
+            error_color: '#ef4444',
+            enable_service_worker: 0,
+            navbar_style: 'Gradient',
+            navbar_blur: 30,
+            gradient_start: '#dceef0',
+            gradient_end: '#efe1cd'
+        }
     };
     
     // ═══════════════════════════════════════════════════════════════════════
@@ -91,6 +177,91 @@
         }
     };
     
+    // ═══════════════════════════════════════════════════════════════════════
+    // EVENTS - One delegated click listener, one router hook, batched DOM writes
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Events = {
+        actions: [],
+        routeHandlers: [],
+        writes: new Map(),
+        frame: null,
+        
+        init() {
+            // Capture phase, so an action can stop Frappe's own handler on the same element
+            document.addEventListener('click', (e) => this.dispatch(e), true);
+            
+            if (window.frappe && frappe.router) {
+                frappe.router.on('change', () => {
+                    this.write('route', () => this.routeHandlers.forEach(handler => handler()));
+                });
+            }
+        },
+        
+        // handler(event, matchedElement) runs for clicks inside `selector`, or for every click
+        onClick(selector, handler) {
+            this.actions.push({ selector, handler });
+        },
+        
+        // handler() runs in the first frame after each desk route change
+        onRoute(handler) {
+            this.routeHandlers.push(handler);
+        },
+        
+        dispatch(e) {
+            if (!(e.target instanceof Element)) return;
+            for (const { selector, handler } of this.actions) {
+                if (!selector) {
+                    handler(e, null);
+                    continue;
+                }
+                const target = e.target.closest(selector);
+                if (target) handler(e, target);
+            }
+        },
+        
+        // Run fn in the next animation frame; a later write with the same key replaces it
+        write(key, fn) {
+            this.writes.delete(key);
+            this.writes.set(key, fn);
+            if (!this.frame) {
+                this.frame = requestAnimationFrame(() => this.flush());
+            }
+        },
+        
+        flush() {
+            const writes = this.writes;
+            this.writes = new Map();
+            this.frame = null;
+            writes.forEach(fn => fn());
+        }
+    };
+    
+    // ═══════════════════════════════════════════════════════════════════════
+    // USER PREFERENCES - Personal toggles stored per user on the server
+    // ═══════════════════════════════════════════════════════════════════════
+    
+    const Preferences = {
+        get(key, defaultValue = null) {
+            const value = window.frappe?.boot?.ahmadcss_preferences?.[key];
+            return value === undefined ? defaultValue : value;
+        },
+        
+        set(key, value) {
+            if (!window.frappe || !frappe.call || frappe.session?.user === 'Guest') return;
+            
+            if (frappe.boot) {
+                frappe.boot.ahmadcss_preferences = { ...frappe.boot.ahmadcss_preferences, [key]: value };
+            }
+            frappe.call({
+                method: 'ahmadcss.preferences.set_preference',
+                args: { key, value },
+                async: true,
+                freeze: false
+            });
+        }
+    };
+    
     // ═══════════════════════════════════════════════════════════════════════
     // DARK MODE MODULE
     // ═══════════════════════════════════════════════════════════════════════
@@ -100,43 +271,35 @@
         
         init() {
             // Check saved preference
-            const saved = Storage.get('dark_mode');
+            const saved = Storage.get('dark_mode', Preferences.get('dark_mode'));
             if (saved !== null) {
-                this.isEnabled = saved;
+                this.isEnabled = !!saved;
             } else {
                 // Check system preference
                 this.isEnabled = window.matchMedia('(prefers-color-scheme: dark)').matches;
             }
             
             this.apply();
-            this.createToggleButton();
             this.listenSystemChange();
         },
         
         apply() {
-            if (this.isEnabled) {
-                document.documentElement.setAttribute('data-dark-mode', 'dark');
-                document.body.classList.add('ahmadcss-dark');
-            } else {
-                document.documentElement.setAttribute('data-dark-mode', 'light');
-                document.body.classList.remove('ahmadcss-dark');
-            }
+            document.documentElement.setAttribute('data-dark-mode', this.isEnabled ? 'dark' : 'light');
+            document.body.classList.toggle('ahmadcss-dark', this.isEnabled);
+            
+            // The admins' navbar button (controls chunk) follows this
+            document.dispatchEvent(new CustomEvent('ahmadcss:dark-mode-changed', {
+                detail: { enabled: this.isEnabled }
+            }));
         },
         
         toggle() {
             this.isEnabled = !this.isEnabled;
             Storage.set('dark_mode', this.isEnabled);
             this.apply();
-            this.updateToggleButton();
             
-            // Sync with server if available - only for admins
-            if (Permissions.isAdmin() && window.frappe && frappe.call) {
-                frappe.call({
-                    method: 'ahmadcss.ahmadcss.doctype.ahmadcss_settings.ahmadcss_settings.toggle_dark_mode',
-                    args: { dark_mode: this.isEnabled ? 1 : 0 },
-                    async: true
-                });
-            }
+            // Saved for this user only, so it follows them to other devices
+            Preferences.set('dark_mode', this.isEnabled ? 1 : 0);
             
             Toast.show({
                 message: this.isEnabled ? __('Dark mode enabled') + ' 🌙' : __('Light mode enabled') + ' ☀️',
@@ -144,728 +307,182 @@
             });
         },
         
-        createToggleButton() {
-            // Don't create toggle button on login page
-            if (window.location.pathname === '/login' || 
-                window.location.pathname === '/login/' ||
-                document.body.classList.contains('login-page') ||
-                document.querySelector('.login-content')) {
-                return;
-            }
-            
-            // Only show dark mode toggle to admins
-            if (!Permissions.isAdmin()) {
-                return;
-            }
-            
-            const navbar = document.querySelector('.navbar');
-            if (!navbar || document.querySelector('.ahmadcss-darkmode-toggle')) return;
-            
-            const toggleBtn = document.createElement('button');
-            toggleBtn.className = 'ahmadcss-darkmode-toggle';
-            toggleBtn.setAttribute('aria-label', 'Toggle Dark Mode');
-            toggleBtn.innerHTML = this.getIcon();
-            
-            toggleBtn.addEventListener('click', () => this.toggle());
-            
-            // Find a good place to insert (before user dropdown or at end)
-            const navRight = navbar.querySelector('.navbar-right') || navbar.querySelector('.nav-right') || navbar;
-            navRight.appendChild(toggleBtn);
-        },
-        
-        updateToggleButton() {
-            const btn = document.querySelector('.ahmadcss-darkmode-toggle');
-            if (btn) {
-                btn.innerHTML = this.getIcon();
-            }
-        },
-        
-        getIcon() {
-            return this.isEnabled 
-                ? '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="5"/><path d="M12 1v2M12 21v2M4.22 4.22l1.42 1.42M18.36 18.36l1.42 1.42M1 12h2M21 12h2M4.22 19.78l1.42-1.42M18.36 5.64l1.42-1.42"/></svg>'
-                : '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/></svg>';
-        },
-        
         listenSystemChange() {
             window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', (e) => {
                 if (Storage.get('dark_mode') === null) {
                     this.isEnabled = e.matches;
                     this.apply();
-                    this.updateToggleButton();
                 }
             });
         }
     };
     
     // ═══════════════════════════════════════════════════════════════════════
-    // TOAST NOTIFICATIONS MODULE
+    // CHUNKS - Feature bundles loaded on first use or when idle
     // ═══════════════════════════════════════════════════════════════════════
     
-    const Toast = {
-        container: null,
-        
-        init() {
-            this.createContainer();
-        },
-        
-        createContainer() {
-            if (document.querySelector('.ahmadcss-toast-container')) return;
-            
-            this.container = document.createElement('div');
-            this.container.className = 'ahmadcss-toast-container';
-            document.body.appendChild(this.container);
-        },
-        
-        show({ message, type = 'info', duration = CONFIG.toastDuration, title = null }) {
-            if (!this.container) this.createContainer();
-            
-            const toast = document.createElement('div');
-            toast.className = `ahmadcss-toast ahmadcss-toast-${type}`;
-            
-            const icons = {
-                success: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/></svg>',
-                error: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="15" y1="9" x2="9" y2="15"/><line x1="9" y1="9" x2="15" y2="15"/></svg>',
-                warning: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M10.29 3.86L1.82 18a2 2 0 0 0 1.71 3h16.94a2 2 0 0 0 1.71-3L13.71 3.86a2 2 0 0 0-3.42 0z"/><line x1="12" y1="9" x2="12" y2="13"/><line x1="12" y1="17" x2="12.01" y2="17"/></svg>',
-                info: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="12" y1="16" x2="12" y2="12"/><line x1="12" y1="8" x2="12.01" y2="8"/></svg>'
-            };
-            
-            // استخدام DOM API بدلاً من innerHTML لمنع XSS
-            const iconDiv = document.createElement('div');
-            iconDiv.className = 'ahmadcss-toast-icon';
-            iconDiv.innerHTML = icons[type] || icons.info;  // Safe: predefined icons only
-            
-            const contentDiv = document.createElement('div');
-            contentDiv.className = 'ahmadcss-toast-content';
-            
-            if (title) {
-                const titleDiv = document.createElement('div');
-                titleDiv.className = 'ahmadcss-toast-title';
-                titleDiv.textContent = title;  // Safe: textContent escapes HTML
-                contentDiv.appendChild(titleDiv);
-            }
-            
-            const messageDiv = document.createElement('div');
-            messageDiv.className = 'ahmadcss-toast-message';
-            messageDiv.textContent = message;  // Safe: textContent escapes HTML
-            contentDiv.appendChild(messageDiv);
-            
-            const closeBtn = document.createElement('button');
-            closeBtn.className = 'ahmadcss-toast-close';
-            closeBtn.setAttribute('aria-label', 'Close');
-            closeBtn.innerHTML = '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/></svg>';
-            
-            const progressDiv = document.createElement('div');
-            progressDiv.className = 'ahmadcss-toast-progress';
-            
-            toast.appendChild(iconDiv);
-            toast.appendChild(contentDiv);
-            toast.appendChild(closeBtn);
-            toast.appendChild(progressDiv);
-            
-            // Close button
-            closeBtn.addEventListener('click', () => {
-                this.dismiss(toast);
-            });
-            
-            // Auto dismiss
-            setTimeout(() => this.dismiss(toast), duration);
-            
-            // Progress bar animation
-            progressDiv.style.animation = `ahmadcss-toast-progress ${duration}ms linear forwards`;
-            
-            this.container.appendChild(toast);
-            
-            // Trigger animation
-            requestAnimationFrame(() => {
-                toast.classList.add('ahmadcss-toast-show');
-            });
-            
-            return toast;
-        },
-        
-        dismiss(toast) {
-            toast.classList.remove('ahmadcss-toast-show');
-            toast.classList.add('ahmadcss-toast-hide');
-            setTimeout(() => toast.remove(), 300);
-        },
-        
-        success(message, title = null) {
-            return this.show({ message, type: 'success', title });
-        },
-        
-        error(message, title = null) {
-            return this.show({ message, type: 'error', title });
-        },
-        
-        warning(message, title = null) {
-            return this.show({ message, type: 'warning', title });
-        },
-        
-        info(message, title = null) {
-            return this.show({ message, type: 'info', title });
+    // Run fn once the browser has nothing better to do
+    function whenIdle(fn) {
+        if (window.requestIdleCallback) {
+            requestIdleCallback(fn, { timeout: 5000 });
+        } else {
+            setTimeout(fn, 2000);
         }
-    };
-    
-    // ═══════════════════════════════════════════════════════════════════════
-    // LOADING SKELETON MODULE
-    // ═══════════════════════════════════════════════════════════════════════
+    }
     
-    const Skeleton = {
-        show(container, options = {}) {
-            const {
-                rows = 3,
-                avatar = false,
-                type = 'lines' // 'lines', 'card', 'table', 'form'
-            } = options;
-            
-            const element = typeof container === 'string' 
-                ? document.querySelector(container) 
-                : container;
-            
-            if (!element) return null;
-            
-            const skeleton = document.createElement('div');
-            skeleton.className = 'ahmadcss-skeleton-wrapper';
-            skeleton.innerHTML = this.getTemplate(type, rows, avatar);
-            
-            element.innerHTML = '';
-            element.appendChild(skeleton);
-            
-            return skeleton;
-        },
-        
-        hide(container) {
-            const element = typeof container === 'string' 
-                ? document.querySelector(container) 
-                : container;
-            
-            if (!element) return;
-            
-            const skeleton = element.querySelector('.ahmadcss-skeleton-wrapper');
-            if (skeleton) {
-                skeleton.classList.add('ahmadcss-skeleton-fade');
-                setTimeout(() => skeleton.remove(), 300);
-            }
-        },
-        
-        getTemplate(type, rows, avatar) {
-            switch(type) {
-                case 'card':
-                    return `
-                        <div class="ahmadcss-skeleton-card">
-                            <div class="ahmadcss-skeleton ahmadcss-skeleton-image"></div>
-                            <div class="ahmadcss-skeleton-body">
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-title"></div>
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-text"></div>
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-text" style="width: 60%"></div>
-                            </div>
-                        </div>
-                    `;
-                
-                case 'table':
-                    let tableRows = '';
-                    for (let i = 0; i < rows; i++) {
-                        tableRows += `
-                            <div class="ahmadcss-skeleton-table-row">
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 15%"></div>
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 25%"></div>
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 35%"></div>
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-cell" style="width: 15%"></div>
-                            </div>
-                        `;
-                    }
-                    return `<div class="ahmadcss-skeleton-table">${tableRows}</div>`;
-                
-                case 'form':
-                    let fields = '';
-                    for (let i = 0; i < rows; i++) {
-                        fields += `
-                            <div class="ahmadcss-skeleton-field">
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-label"></div>
-                                <div class="ahmadcss-skeleton ahmadcss-skeleton-input"></div>
-                            </div>
-                        `;
-                    }
-                    return `<div class="ahmadcss-skeleton-form">${fields}</div>`;
-                
-                default: // lines
-                    let lines = '';
-                    if (avatar) {
-                        lines += '<div class="ahmadcss-skeleton ahmadcss-skeleton-avatar"></div>';
-                    }
-                    lines += '<div class="ahmadcss-skeleton-lines">';
-                    for (let i = 0; i < rows; i++) {
-                        const width = i === rows - 1 ? '60%' : (90 - i * 10) + '%';
-                        lines += `<div class="ahmadcss-skeleton ahmadcss-skeleton-line" style="width: ${width}"></div>`;
-                    }
-                    lines += '</div>';
-                    return lines;
-            }
+    // Fetch a bundle of this app through Frappe's asset map (assets.json)
+    function requireBundle(bundle) {
+        if (!(window.frappe && frappe.require)) {
+            return Promise.reject(new Error(`AhmadCSS: cannot load ${bundle} on this page`));
         }
-    };
-    
-    // ═══════════════════════════════════════════════════════════════════════
-    // THEME CUSTOMIZER MODULE
-    // ═══════════════════════════════════════════════════════════════════════
+        return Promise.resolve(frappe.require(bundle));
+    }
     
-    const ThemeCustomizer = {
-        isOpen: false,
-        panel: null,
-        
-        init() {
-            this.createPanel();
-            this.createToggleButton();
-            this.loadSavedTheme();
-        },
-        
-        createPanel() {
-            if (document.querySelector('.ahmadcss-customizer')) return;
-            
-            this.panel = document.createElement('div');
-            this.panel.className = 'ahmadcss-customizer';
-            this.panel.innerHTML = `
-                <div class="ahmadcss-customizer-header">
-                    <h3>🎨 Theme Customizer</h3>
-                    <button class="ahmadcss-customizer-close" aria-label="Close">
-                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                            <line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/>
-                        </svg>
-                    </button>
-                </div>
-                <div class="ahmadcss-customizer-body">
-                    <div class="ahmadcss-customizer-section">
-                        <label>Primary Color</label>
-                        <input type="color" id="ahmadcss-primary-color" value="#0f766e">
-                    </div>
-                    <div class="ahmadcss-customizer-section">
-                        <label>Secondary Color</label>
-                        <input type="color" id="ahmadcss-secondary-color" value="#d97706">
-                    </div>
-                    <div class="ahmadcss-customizer-section">
-                        <label>Glass Blur: <span id="blur-value">20</span>px</label>
-                        <input type="range" id="ahmadcss-blur" min="0" max="50" value="20">
-                    </div>
-                    <div class="ahmadcss-customizer-section">
-                        <label>Glass Opacity: <span id="opacity-value">72</span>%</label>
-                        <input type="range" id="ahmadcss-opacity" min="30" max="100" value="72">
-                    </div>
-                    <div class="ahmadcss-customizer-section">
-                        <label>Border Radius: <span id="radius-value">16</span>px</label>
-                        <input type="range" id="ahmadcss-radius" min="0" max="30" value="16">
-                    </div>
-                </div>
-                <div class="ahmadcss-customizer-footer">
-                    <button class="ahmadcss-btn ahmadcss-btn-secondary" id="ahmadcss-reset">Reset</button>
-                    <button class="ahmadcss-btn ahmadcss-btn-primary" id="ahmadcss-save">Save</button>
-                </div>
-            `;
-            
-            document.body.appendChild(this.panel);
-            this.bindEvents();
-        },
-        
-        bindEvents() {
-            // Close button
-            this.panel.querySelector('.ahmadcss-customizer-close').addEventListener('click', () => this.close());
-            
-            // Color pickers
-            this.panel.querySelector('#ahmadcss-primary-color').addEventListener('input', (e) => {
-                this.updateCSS('--primary-600', e.target.value);
-            });
-            
-            this.panel.querySelector('#ahmadcss-secondary-color').addEventListener('input', (e) => {
-                this.updateCSS('--secondary-500', e.target.value);
-            });
-            
-            // Range sliders
-            this.panel.querySelector('#ahmadcss-blur').addEventListener('input', (e) => {
-                document.getElementById('blur-value').textContent = e.target.value;
-                this.updateCSS('--glass-blur', e.target.value + 'px');
-            });
-            
-            this.panel.querySelector('#ahmadcss-opacity').addEventListener('input', (e) => {
-                document.getElementById('opacity-value').textContent = e.target.value;
-                const opacity = e.target.value / 100;
-                this.updateCSS('--glass-white', `rgba(255, 255, 255, ${opacity})`);
-            });
-            
-            this.panel.querySelector('#ahmadcss-radius').addEventListener('input', (e) => {
-                document.getElementById('radius-value').textContent = e.target.value;
-                this.updateCSS('--radius-lg', e.target.value + 'px');
-            });
-            
-            // Save button
-            this.panel.querySelector('#ahmadcss-save').addEventListener('click', () => this.saveTheme());
-            
-            // Reset button
-            this.panel.querySelector('#ahmadcss-reset').addEventListener('click', () => this.resetTheme());
-        },
-        
-        updateCSS(property, value) {
-            document.documentElement.style.setProperty(property, value);
-        },
-        
-        saveTheme() {
-            const theme = {
-                primaryColor: this.panel.querySelector('#ahmadcss-primary-color').value,
-                secondaryColor: this.panel.querySelector('#ahmadcss-secondary-color').value,
-                blur: this.panel.querySelector('#ahmadcss-blur').value,
-                opacity: this.panel.querySelector('#ahmadcss-opacity').value,
-                radius: this.panel.querySelector('#ahmadcss-radius').value
-            };
-            
-            Storage.set('custom_theme', theme);
-            Toast.success(__('Theme saved successfully') + ' ✨');
-        },
-        
-        loadSavedTheme() {
-            const theme = Storage.get('custom_theme');
-            if (!theme) return;
-            
-            this.updateCSS('--primary-600', theme.primaryColor);
-            this.updateCSS('--secondary-500', theme.secondaryColor);
-            this.updateCSS('--glass-blur', theme.blur + 'px');
-            this.updateCSS('--glass-white', `rgba(255, 255, 255, ${theme.opacity / 100})`);
-            this.updateCSS('--radius-lg', theme.radius + 'px');
-            
-            // Update panel values
-            if (this.panel) {
-                this.panel.querySelector('#ahmadcss-primary-color').value = theme.primaryColor;
-                this.panel.querySelector('#ahmadcss-secondary-color').value = theme.secondaryColor;
-                this.panel.querySelector('#ahmadcss-blur').value = theme.blur;
-                this.panel.querySelector('#ahmadcss-opacity').value = theme.opacity;
-                this.panel.querySelector('#ahmadcss-radius').value = theme.radius;
-                document.getElementById('blur-value').textContent = theme.blur;
-                document.getElementById('opacity-value').textContent = theme.opacity;
-                document.getElementById('radius-value').textContent = theme.radius;
-            }
-        },
+    const Chunks = {
+        modules: {},
+        loading: {},
         
-        resetTheme() {
-            Storage.remove('custom_theme');
-            location.reload();
+        // Called by each chunk bundle once it has run
+        define(name, module) {
+            this.modules[name] = module;
         },
         
-        createToggleButton() {
-            // Only show theme customizer to admins
-            if (!Permissions.isAdmin()) {
-                return;
+        load(name) {
+            if (this.modules[name]) return Promise.resolve(this.modules[name]);
+            if (!this.loading[name]) {
+                const bundle = CONFIG.chunks[name];
+                this.loading[name] = requireBundle(bundle).then(() => {
+                    if (!this.modules[name]) throw new Error(`AhmadCSS: ${bundle} did not load`);
+                    if (this.modules[name].init) this.modules[name].init();
+                    return this.modules[name];
+                });
+                // Let a later call retry after a failed fetch
+                this.loading[name].catch(() => { delete this.loading[name]; });
             }
-            
-            const navbar = document.querySelector('.navbar');
-            if (!navbar || document.querySelector('.ahmadcss-customizer-toggle')) return;
-            
-            const toggleBtn = document.createElement('button');
-            toggleBtn.className = 'ahmadcss-customizer-toggle';
-            toggleBtn.setAttribute('aria-label', 'Theme Customizer');
-            toggleBtn.innerHTML = '<svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="3"/><path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"/></svg>';
-            
-            toggleBtn.addEventListener('click', () => this.toggle());
-            
-            const navRight = navbar.querySelector('.navbar-right') || navbar.querySelector('.nav-right') || navbar;
-            navRight.appendChild(toggleBtn);
+            return this.loading[name];
         },
         
-        toggle() {
-            this.isOpen = !this.isOpen;
-            this.panel.classList.toggle('ahmadcss-customizer-open', this.isOpen);
+        // Load chunks once the browser has nothing better to do
+        prefetch(names) {
+            whenIdle(() => names.forEach(name => this.load(name).catch(() => {})));
         },
         
-        close() {
-            this.isOpen = false;
-            this.panel.classList.remove('ahmadcss-customizer-open');
+        // An object whose methods load the chunk, then call the real method (returning a promise)
+        proxy(name, methods) {
+            const facade = {};
+            methods.forEach(method => {
+                facade[method] = (...args) => this.load(name)
+                    .then(module => module[method](...args))
+                    .catch((e) => {
+                        if (window.frappe?.boot?.developer_mode) {
+                            console.warn(`AhmadCSS ${name}.${method}:`, e);
+                        }
+                        return null;
+                    });
+            });
+            return facade;
         }
     };
     
-    // ═══════════════════════════════════════════════════════════════════════
-    // RIPPLE EFFECT MODULE
-    // ═══════════════════════════════════════════════════════════════════════
+    const Toast = Chunks.proxy('toast', ['show', 'dismiss', 'success', 'error', 'warning', 'info']);
+    const Skeleton = Chunks.proxy('skeleton', ['show', 'hide']);
+    const Sidebar = Chunks.proxy('sidebar', ['toggle', 'collapse', 'expand']);
+    const Charts = Chunks.proxy('charts', ['load', 'render']);
+    const Customizer = Chunks.proxy('customizer', ['toggle', 'close']);
     
-    const RippleEffect = {
-        init() {
-            document.addEventListener('click', this.handleClick.bind(this));
-            this.injectStyles();
-        },
-        
-        handleClick(e) {
-            const target = e.target.closest('.btn, .shortcut-widget-box, .standard-sidebar-item, .ahmadcss-btn');
-            if (!target) return;
-            
-            const ripple = document.createElement('span');
-            ripple.className = 'ahmadcss-ripple';
-            
-            const rect = target.getBoundingClientRect();
-            const size = Math.max(rect.width, rect.height);
-            const x = e.clientX - rect.left - size / 2;
-            const y = e.clientY - rect.top - size / 2;
-            
-            ripple.style.cssText = `
-                position: absolute;
-                width: ${size}px;
-                height: ${size}px;
-                left: ${x}px;
-                top: ${y}px;
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 50%;
-                transform: scale(0);
-                pointer-events: none;
-                animation: ahmadcss-ripple 0.6s ease-out;
-            `;
-            
-            const originalPosition = getComputedStyle(target).position;
-            if (originalPosition === 'static') {
-                target.style.position = 'relative';
-            }
-            target.style.overflow = 'hidden';
-            
-            target.appendChild(ripple);
-            
-            setTimeout(() => {
-                ripple.remove();
-                if (originalPosition === 'static') {
-                    target.style.position = '';
-                }
-            }, 600);
-        },
-        
-        injectStyles() {
-            if (document.getElementById('ahmadcss-ripple-styles')) return;
-            
-            const style = document.createElement('style');
-            style.id = 'ahmadcss-ripple-styles';
-            style.textContent = `
-                @keyframes ahmadcss-ripple {
-                    to {
-                        transform: scale(4);
-                        opacity: 0;
-                    }
-                }
-            `;
-            document.head.appendChild(style);
-        }
-    };
+    // Settings writes and theme switching (admins load the chunk on every desk page)
+    const SettingsPatch = Chunks.proxy('controls', ['send']);
+    const ThemeSwitch = Chunks.proxy('controls', ['setTheme', 'toggleTheme']);
     
-    // ═══════════════════════════════════════════════════════════════════════
-    // SMOOTH SCROLL MODULE
-    // ═══════════════════════════════════════════════════════════════════════
+    // Settings features most sites leave off; their chunks load only when the settings use them
+    const OfflineCache = Chunks.proxy('offline', ['sync']);
+    const CustomCode = Chunks.proxy('customCode', ['apply']);
+    const Logo = Chunks.proxy('logo', ['apply']);
     
-    const SmoothScroll = {
-        init() {
-            document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-                anchor.addEventListener('click', function(e) {
-                    const targetId = this.getAttribute('href');
-                    if (targetId === '#') return;
-                    
-                    const target = document.querySelector(targetId);
-                    if (target) {
-                        e.preventDefault();
-                        target.scrollIntoView({
-                            behavior: 'smooth',
-                            block: 'start'
-                        });
-                    }
-                });
-            });
+    const SettingsFeatures = {
+        apply(settings) {
+            if (!settings) return;
+            
+            // Also load to remove what an earlier page load added
+            if ('serviceWorker' in navigator && (settings.enable_service_worker || navigator.serviceWorker.controller)) {
+                whenIdle(() => OfflineCache.sync(settings));
+            }
+            // Custom JS comes with the desk boot only (see ahmadcss.custom_code)
+            if (settings.custom_css_url || window.frappe?.boot?.ahmadcss?.custom_js_url ||
+                document.querySelector('link[href^="/assets/ahmadcss/css/custom-"]')) {
+                CustomCode.apply(settings);
+            }
+            if (settings.show_custom_logo || document.querySelector('.ahmadcss-logo')) {
+                Logo.apply(settings);
+            }
         }
     };
     
     // ═══════════════════════════════════════════════════════════════════════
-    // SIDEBAR TOGGLE MODULE (Desktop & Mobile)
+    // PERFORMANCE TIER - Glass effects off on devices that struggle with them
     // ═══════════════════════════════════════════════════════════════════════
     
-    const SidebarToggle = {
-        isCollapsed: false,
-        
-        init() {
-            // Check saved state
-            this.isCollapsed = Storage.get('sidebar_collapsed', false);
-            
-            // Apply saved state
-            if (this.isCollapsed) {
-                this.collapse();
+    // full: every effect. lite: no blur or translucency, fewer shadows and
+    // animations (the theme's *-lite.css, from scripts/build-lite-css.js).
+    // off: lite without any animation or transition.
+    const PerformanceProbe = Chunks.proxy('performance', ['pick', 'redetect']);
+    
+    const Performance = {
+        tiers: ['full', 'lite', 'off'],
+        tier: 'full',
+        
+        // "Performance Mode" in settings: Auto picks the tier on each device
+        // and remembers it there, the other modes force one
+        sync(settings) {
+            const mode = ((settings && settings.performance_mode) || THEME_DEFAULTS.values.performance_mode).toLowerCase();
+            if (this.tiers.includes(mode)) {
+                this.set(mode);
+                return;
             }
             
-            // Bind to Frappe's toggle button
-            this.bindFrappeToggle();
-            
-            // Also handle our custom toggle
-            this.bindCustomToggle();
-        },
-        
-        bindFrappeToggle() {
-            // Wait for DOM and bind to Frappe's sidebar toggle
-            const bindToggle = () => {
-                const toggleBtns = document.querySelectorAll('.sidebar-toggle-btn, .sidebar-toggle-placeholder, [data-action="toggle-sidebar"]');
-                
-                toggleBtns.forEach(btn => {
-                    if (btn.dataset.ahmadcssBound) return;
-                    btn.dataset.ahmadcssBound = 'true';
-                    
-                    btn.addEventListener('click', (e) => {
-                        e.preventDefault();
-                        e.stopPropagation();
-                        this.toggle();
-                    });
-                });
-            };
-            
-            // Bind immediately and after page changes
-            bindToggle();
-            
-            // Re-bind on page navigation
-            if (window.frappe && frappe.router) {
-                frappe.router.on('change', () => {
-                    setTimeout(bindToggle, 100);
-                });
+            const saved = Storage.get('performance_tier');
+            if (this.tiers.includes(saved)) {
+                this.set(saved);
+                return;
             }
             
-            // Also use MutationObserver to catch dynamically added buttons
-            const observer = new MutationObserver((mutations) => {
-                mutations.forEach((mutation) => {
-                    if (mutation.addedNodes.length) {
-                        bindToggle();
-                    }
-                });
-            });
-            
-            observer.observe(document.body, { childList: true, subtree: true });
-            
-            // Listen to Frappe's toggle event for compatibility
-            $(document.body).on('toggleSidebar', () => {
-                const sidebar = document.querySelector('.layout-side-section');
-                const isVisible = sidebar && 
-                                  window.getComputedStyle(sidebar).display !== 'none' &&
-                                  !sidebar.classList.contains('ahmadcss-sidebar-collapsed');
-                
-                if (!isVisible) {
-                    document.body.classList.add('sidebar-collapsed');
-                } else {
-                    document.body.classList.remove('sidebar-collapsed');
-                }
-            });
+            // No tier yet: full until the performance chunk has measured the device
+            this.set('full');
+            whenIdle(() => PerformanceProbe.pick());
         },
         
-        bindCustomToggle() {
-            document.addEventListener('click', (e) => {
-                const target = e.target.closest('.ahmadcss-sidebar-toggle');
-                if (target) {
-                    e.preventDefault();
-                    this.toggle();
-                }
-            });
+        // Forget this device's tier and pick it again
+        redetect() {
+            return PerformanceProbe.redetect();
         },
         
-        toggle() {
-            this.isCollapsed = !this.isCollapsed;
-            Storage.set('sidebar_collapsed', this.isCollapsed);
-            
-            if (this.isCollapsed) {
-                this.collapse();
+        set(tier) {
+            this.tier = tier;
+            if (tier === 'full') {
+                document.documentElement.removeAttribute('data-ahmadcss-perf');
             } else {
-                this.expand();
-            }
-        },
-        
-        collapse() {
-            const sidebar = document.querySelector('.layout-side-section');
-            const mainSection = document.querySelector('.layout-main-section-wrapper');
-            
-            if (sidebar) {
-                sidebar.classList.add('ahmadcss-sidebar-collapsed');
-                // Use setProperty to override !important in CSS
-                sidebar.style.setProperty('display', 'none', 'important');
-                sidebar.style.setProperty('width', '0', 'important');
-                sidebar.style.setProperty('max-width', '0', 'important');
+                document.documentElement.setAttribute('data-ahmadcss-perf', tier);
             }
             
-            if (mainSection) {
-                mainSection.classList.add('ahmadcss-sidebar-collapsed');
-                mainSection.style.setProperty('max-width', '100%', 'important');
-                mainSection.style.setProperty('flex', '1 1 100%', 'important');
-                mainSection.style.setProperty('width', '100%', 'important');
-            }
-            
-            document.body.classList.add('sidebar-collapsed');
-        },
-        
-        expand() {
-            const sidebar = document.querySelector('.layout-side-section');
-            const mainSection = document.querySelector('.layout-main-section-wrapper');
-            
-            if (sidebar) {
-                sidebar.classList.remove('ahmadcss-sidebar-collapsed');
-                // Remove inline styles to let CSS take control
-                sidebar.style.removeProperty('display');
-                sidebar.style.removeProperty('width');
-                sidebar.style.removeProperty('max-width');
-            }
-            
-            if (mainSection) {
-                mainSection.classList.remove('ahmadcss-sidebar-collapsed');
-                mainSection.style.removeProperty('max-width');
-                mainSection.style.removeProperty('flex');
-                mainSection.style.removeProperty('width');
+            // Before the first ColorTheme.apply() there are no theme sheets to update
+            if (!document.querySelector('link[data-ahmadcss-theme-css]')) return;
+            if (tier === 'full') {
+                document.querySelector('link[data-ahmadcss-theme-css="lite"]')?.remove();
+            } else {
+                ColorTheme.loadThemeCSS(ColorTheme.currentTheme);
             }
-            
-            document.body.classList.remove('sidebar-collapsed');
         }
     };
     
     // ═══════════════════════════════════════════════════════════════════════
-    // MOBILE SIDEBAR MODULE
+    // SIDEBAR STATE - Collapsed before the first paint; the toggles are a chunk
     // ═══════════════════════════════════════════════════════════════════════
     
-    const MobileSidebar = {
-        toggleBtn: null,
-        
-        init() {
-            this.createToggleButton();
-            this.bindEvents();
-        },
-        
-        createToggleButton() {
-            const navbar = document.querySelector('.navbar');
-            if (!navbar || document.querySelector('.ahmadcss-sidebar-toggle')) return;
-            
-            this.toggleBtn = document.createElement('button');
-            this.toggleBtn.className = 'ahmadcss-sidebar-toggle';
-            this.toggleBtn.innerHTML = '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="3" y1="6" x2="21" y2="6"/><line x1="3" y1="12" x2="21" y2="12"/><line x1="3" y1="18" x2="21" y2="18"/></svg>';
-            
-            this.toggleBtn.addEventListener('click', () => this.toggle());
-            
-            navbar.insertBefore(this.toggleBtn, navbar.firstChild);
-            this.updateVisibility();
-        },
-        
-        bindEvents() {
-            window.addEventListener('resize', () => this.updateVisibility());
-            
-            document.addEventListener('click', (e) => {
-                if (window.innerWidth >= 992) return;
-                
-                const sidebar = document.querySelector('.layout-side-section');
-                const isClickInside = sidebar?.contains(e.target) || this.toggleBtn?.contains(e.target);
-                
-                if (!isClickInside && sidebar?.classList.contains('show')) {
-                    sidebar.classList.remove('show', 'opened');
-                }
-            });
-        },
-        
-        toggle() {
-            const sidebar = document.querySelector('.layout-side-section');
-            if (sidebar) {
-                sidebar.classList.toggle('show');
-                sidebar.classList.toggle('opened');
-            }
-        },
-        
-        updateVisibility() {
-            if (this.toggleBtn) {
-                this.toggleBtn.style.display = window.innerWidth < 992 ? 'flex' : 'none';
-            }
-        }
-    };
+    function applySavedSidebar() {
+        const collapsed = Storage.get('sidebar_collapsed', Preferences.get('sidebar_collapsed', false));
+        document.body.classList.toggle('sidebar-collapsed', !!collapsed);
+        Chunks.load('sidebar').catch(() => {});
+    }
     
     // ═══════════════════════════════════════════════════════════════════════
     // COLOR THEME MODULE (All Themes)
@@ -883,7 +500,9 @@
                 emoji: '💜',
                 gradient: 'linear-gradient(135deg, #7c3aed 0%, #3b82f6 100%)',
                 cssClass: '',
-                dataTheme: ''
+                dataTheme: '',
+                cssFile: 'glass-ultimate-delta.css',
+                liteFile: 'glass-ultimate-lite.css'
             },
             'silver': {
                 name: 'Silver',
@@ -891,7 +510,9 @@
                 emoji: '🌫️',
                 gradient: 'linear-gradient(135deg, #94a3b8 0%, #64748b 100%)',
                 cssClass: 'ahmadcss-theme-silver',
-                dataTheme: 'silver'
+                dataTheme: 'silver',
+                cssFile: 'glass-silver-delta.css',
+                liteFile: 'glass-silver-lite.css'
             }
         },
         
@@ -902,44 +523,87 @@
         
         // Initialize silently without showing switcher (for homepage and login)
         initSilent() {
-            // First, apply saved theme immediately for faster rendering
-            const saved = Storage.get('color_theme', 'silver');
-            this.currentTheme = saved;
-            this.apply();
+            this.loadFromServer();
+        },
+        
+        // Load theme from API using fetch (works for guests too); on page load the
+        // desk boot already carries the settings, so the request can be skipped
+        async loadThemeFromAPI(fromBoot = false, version = null) {
+            const settings = (fromBoot && this.settingsFromBoot()) || await this.fetchSettings(version);
+            Performance.sync(settings);
+            SettingsFeatures.apply(settings);
+            if (settings && settings.theme_css) {
+                this.applyThemeTokens(settings.theme_css);
+            }
+            if (settings && settings.color_theme) {
+                return this.normalizeThemeName(settings.color_theme);
+            }
+            return null;
+        },
+        
+        // True when this browser already applied the current settings: the ones the
+        // desk boot describes, or (without a boot) ones checked recently
+        isCacheCurrent() {
+            const boot = window.frappe?.boot?.ahmadcss;
+            const cached = Storage.get('theme_settings');
+            if (!cached) return false;
+            if (boot) return !!(boot.hash && cached.hash === boot.hash);
+            return Date.now() - (cached.checked || 0) < CONFIG.themeRevalidateInterval;
+        },
+        
+        // Rebuild the full settings from the compact boot (defaults + overrides)
+        settingsFromBoot() {
+            const boot = window.frappe?.boot?.ahmadcss;
+            // Missing, or the bundle was built for other defaults: use the API
+            if (!boot || boot.schema !== THEME_DEFAULTS.schema) return null;
             
-            // Then try to get theme from server to sync
-            this.loadThemeFromAPI().then(serverTheme => {
-                if (serverTheme && this.themes.includes(serverTheme)) {
-                    this.currentTheme = serverTheme;
-                    Storage.set('color_theme', serverTheme);
-                    this.apply();
-                }
-            }).catch(() => {
-                // Keep the localStorage theme if API fails
-            });
+            const cached = Storage.get('theme_settings');
+            if (cached && cached.hash === boot.hash) return cached.settings;
+            
+            const settings = { ...THEME_DEFAULTS.values, ...boot.overrides };
+            Storage.set('theme_settings', { hash: boot.hash, etag: null, settings: settings });
+            return settings;
         },
         
-        // Load theme from API using fetch (works for guests too)
-        async loadThemeFromAPI() {
+        // Fetch settings, revalidating the locally cached copy with its ETag. Passing
+        // the version that must be served makes the service worker skip its cache.
+        async fetchSettings(version = null) {
+            const cached = Storage.get('theme_settings');
+            const headers = { 'Accept': 'application/json' };
+            if (cached && cached.etag) {
+                headers['If-None-Match'] = cached.etag;
+            }
+            
             try {
-                const response = await fetch('/api/method/ahmadcss.api.get_theme_settings', {
+                const query = version ? `?v=${encodeURIComponent(version)}` : '';
+                const response = await fetch(`/api/method/ahmadcss.api.get_theme_settings${query}`, {
                     method: 'GET',
-                    headers: {
-                        'Accept': 'application/json',
-                        'Content-Type': 'application/json'
-                    }
+                    headers: headers,
+                    cache: 'no-cache'
                 });
                 
+                if (response.status === 304 && cached) {
+                    Storage.set('theme_settings', { ...cached, checked: Date.now() });
+                    return cached.settings;
+                }
+                
                 if (response.ok) {
                     const data = await response.json();
-                    if (data && data.message && data.message.color_theme) {
-                        return this.normalizeThemeName(data.message.color_theme);
+                    if (data && data.message) {
+                        const etag = response.headers.get('ETag');
+                        Storage.set('theme_settings', {
+                            hash: etag ? etag.replace(/^W\//, '').replace(/"/g, '') : null,
+                            etag: etag,
+                            checked: Date.now(),
+                            settings: data.message
+                        });
+                        return data.message;
                     }
                 }
             } catch (e) {
                 // Silently fail for guests
             }
-            return null;
+            return cached ? cached.settings : null;
         },
         
         loadFromServer() {
@@ -948,19 +612,29 @@
             this.currentTheme = saved;
             this.apply();
             
+            // Open pages hear about settings saves over realtime (theme-updates chunk)
+            if (window.frappe?.realtime?.on) Chunks.prefetch(['themeUpdates']);
+            
+            // Nothing changed on the server since this browser last applied it
+            if (this.isCacheCurrent()) {
+                SettingsFeatures.apply(Storage.get('theme_settings').settings);
+                return;
+            }
+            
             // Then try to get theme from server to sync
-            this.loadThemeFromAPI().then(serverTheme => {
-                if (serverTheme && this.themes.includes(serverTheme)) {
-                    this.currentTheme = serverTheme;
-                    Storage.set('color_theme', serverTheme);
-                    this.apply();
-                }
-                // Theme switcher removed - no color bar
-            }).catch(() => {
+            this.loadThemeFromAPI(true).then(serverTheme => this.applyServerTheme(serverTheme)).catch(() => {
                 // Keep the localStorage theme if API fails
             });
         },
         
+        applyServerTheme(serverTheme) {
+            if (serverTheme && this.themes.includes(serverTheme)) {
+                this.currentTheme = serverTheme;
+                Storage.set('color_theme', serverTheme);
+                this.apply();
+            }
+        },
+        
         normalizeThemeName(name) {
             if (!name) return 'silver';
             const normalized = name.toLowerCase().replace(/\s+/g, '-');
@@ -975,8 +649,8 @@
         },
         
         apply() {
-            // Unload all theme CSS files first
-            this.unloadAllThemes();
+            // Unload other themes' CSS files first
+            this.unloadAllThemes(this.currentTheme);
             
             // Remove all theme classes
             this.themes.forEach(theme => {
@@ -1008,98 +682,63 @@
             }));
         },
         
-        loadThemeCSS(themeName) {
-            // Map theme names to CSS files
-            const cssMap = {
-                'purple': 'glass-ultimate.css',
-                'silver': 'glass-silver.css'
-            };
+        // Stylesheets a theme needs, in load order: the shared base, then its delta,
+        // then the lite overrides on the lite and off performance tiers
+        getThemeStylesheets(themeName) {
+            const config = this.themeConfig[themeName];
+            if (!config) return [];
             
-            const cssFile = cssMap[themeName];
-            if (!cssFile) return;
+            const cached = Storage.get('theme_settings');
+            const settings = (cached && cached.settings) || {};
             
-            // Remove existing to force reload with cache-busting
-            const existingLink = document.querySelector(`link[data-ahmadcss-theme-css="${cssFile}"]`);
-            if (existingLink) existingLink.remove();
+            // Content-hashed copies from the build manifest, if built
+            const assets = window.frappe?.boot?.ahmadcss_assets || settings.css_assets || {};
+            const asset = (file) => assets[file] || `/assets/ahmadcss/css/${file}?v=${CONFIG.version}`;
             
-            // Create and append link element with version for cache-busting
-            const link = document.createElement('link');
-            link.rel = 'stylesheet';
-            link.href = `/assets/ahmadcss/css/${cssFile}?v=${CONFIG.version}`;
-            link.setAttribute('data-ahmadcss-theme-css', cssFile);
-            document.head.appendChild(link);
-        },
-        
-        unloadAllThemes() {
-            // Remove all dynamically loaded theme CSS files
-            const themeLinks = document.querySelectorAll('link[data-ahmadcss-theme-css]');
-            themeLinks.forEach(link => link.remove());
-        },
-        
-        setTheme(themeName) {
-            const normalized = this.normalizeThemeName(themeName);
-            if (this.themes.includes(normalized)) {
-                this.currentTheme = normalized;
-                Storage.set('color_theme', normalized);
-                this.apply();
-                this.updateSwitcher();
-                
-                // Sync with server
-                this.syncToServer(normalized);
-                
-                const config = this.themeConfig[normalized];
-                Toast.show({
-                    message: __('Switched to {0} theme', [config.name + ' ' + config.emoji]),
-                    type: 'info'
-                });
-            }
-        },
-        
-        syncToServer(themeName) {
-            // Don't sync if user is on settings page to avoid timestamp conflicts
-            if (window.location.pathname.includes('AhmadCSS%20Settings') || 
-                window.location.pathname.includes('AhmadCSS-Settings') ||
-                window.location.pathname.includes('ahmadcss-settings')) {
-                return;
-            }
+            // Not settings.compiled_css: main.css has neither the glass themes' rules
+            // nor their colour split, so linking it instead would restyle every site
+            const sheets = [CONFIG.themeBaseCSS, config.cssFile].map(file => ({ key: file, href: asset(file) }));
             
-            if (window.frappe && frappe.call) {
-                frappe.call({
-                    method: 'ahmadcss.api.save_theme_settings',
-                    args: {
-                        settings: JSON.stringify({ color_theme: this.getDisplayName(themeName) })
-                    },
-                    async: true,
-                    freeze: false,
-                    error: function() {
-                        // Silently ignore errors - theme is already saved locally
-                    }
-                });
+            if (Performance.tier !== 'full') {
+                sheets.push({ key: 'lite', href: asset(config.liteFile) });
             }
+            return sheets;
         },
         
-        getDisplayName(themeName) {
-            const mapping = {
-                'purple': 'Purple',
-                'silver': 'Silver'
-            };
-            return mapping[themeName] || themeName;
-        },
-        
-        toggle() {
-            const currentIndex = this.themes.indexOf(this.currentTheme);
-            const nextIndex = (currentIndex + 1) % this.themes.length;
-            this.setTheme(this.themes[nextIndex]);
+        loadThemeCSS(themeName) {
+            this.getThemeStylesheets(themeName).forEach(({ key, href }) => {
+                // Nothing to do if this exact stylesheet is already linked
+                const existingLink = document.querySelector(`link[data-ahmadcss-theme-css="${key}"]`);
+                if (existingLink && existingLink.getAttribute('href') === href) return;
+                if (existingLink) existingLink.remove();
+                
+                const link = document.createElement('link');
+                link.rel = 'stylesheet';
+                link.href = href;
+                link.setAttribute('data-ahmadcss-theme-css', key);
+                document.head.appendChild(link);
+            });
         },
         
-        createSwitcher() {
-            // Color bar removed — theme is set via AhmadCSS Settings doctype
+        // Link the server-generated theme-<hash>.css (usually already in <head>)
+        applyThemeTokens(url) {
+            const links = document.querySelectorAll('link[href*="/assets/ahmadcss/css/theme-"]');
+            if (Array.from(links).some(link => link.getAttribute('href') === url)) return;
+            
+            const link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = url;
+            link.onload = () => links.forEach(old => old.remove());
+            document.head.appendChild(link);
         },
         
-        updateSwitcher() {
-            const buttons = document.querySelectorAll('.ahmadcss-theme-btn');
-            buttons.forEach(btn => {
-                btn.classList.toggle('active', btn.dataset.theme === this.currentTheme);
+        unloadAllThemes(keepTheme = null) {
+            // Remove dynamically loaded theme CSS files (except the ones being kept,
+            // so the shared base stays cached and parsed across theme switches)
+            const keep = new Set(keepTheme ? this.getThemeStylesheets(keepTheme).map(sheet => sheet.key) : []);
+            const themeLinks = document.querySelectorAll('link[data-ahmadcss-theme-css]');
+            themeLinks.forEach(link => {
+                if (!keep.has(link.getAttribute('data-ahmadcss-theme-css'))) link.remove();
             });
         }
     };
@@ -1109,19 +748,17 @@
     // ═══════════════════════════════════════════════════════════════════════
     
     const Utils = {
+        // Undo inline layout styles left by other scripts; the theme's state lives in classes
         cleanupInlineStyles() {
             const body = document.body;
             if (body) {
-                body.style.marginLeft = '';
-                body.style.paddingLeft = '';
+                body.style.removeProperty('margin-left');
+                body.style.removeProperty('padding-left');
             }
             
             const sidebar = document.querySelector('.layout-side-section');
             if (sidebar && window.innerWidth >= 992) {
-                sidebar.style.display = '';
-                sidebar.style.visibility = '';
-                sidebar.style.opacity = '';
-                sidebar.style.transform = '';
+                ['display', 'visibility', 'opacity', 'transform'].forEach(property => sidebar.style.removeProperty(property));
             }
         }
     };
@@ -1149,6 +786,11 @@
             console.log(`🎨 AhmadCSS v${CONFIG.version} - Professional Glassmorphism loaded`);
         }
         
+        Events.init();
+        
+        // Pick the performance tier before the theme sheets are linked
+        Performance.sync(ColorTheme.settingsFromBoot() || Storage.get('theme_settings')?.settings);
+        
         // Clean up any inline styles
         Utils.cleanupInlineStyles();
         
@@ -1162,38 +804,26 @@
         // On homepage, only apply theme without showing controls
         if (isHomePage()) {
             ColorTheme.initSilent();  // Apply saved theme without showing switcher
-            Toast.init();
-            RippleEffect.init();
-            SmoothScroll.init();
-            SidebarToggle.init();
-            MobileSidebar.init();
+            applySavedSidebar();
+            Chunks.prefetch(['effects']);
             return;
         }
         
         // Initialize all modules (only for logged-in users on other pages)
         ColorTheme.init();  // Initialize color theme first
         DarkMode.init();
-        Toast.init();
-        ThemeCustomizer.init();
-        RippleEffect.init();
-        SmoothScroll.init();
-        SidebarToggle.init();  // Desktop sidebar toggle
-        MobileSidebar.init();
+        applySavedSidebar();
         
-        // Re-run on page navigation
-        if (window.frappe && frappe.router) {
-            frappe.router.on('change', function() {
-                setTimeout(Utils.cleanupInlineStyles, 100);
-                setTimeout(() => SidebarToggle.bindFrappeToggle(), 200);
-            });
+        // Saved custom theme, navbar buttons and the customizer panel
+        if (Permissions.isAdmin()) {
+            Chunks.load('controls').catch(() => {});
         }
-    }
-    
-    // Start when DOM is ready
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', init);
-    } else {
-        init();
+        
+        // Ripple and smooth scroll, and toasts before they are first needed
+        Chunks.prefetch(['effects', 'toast']);
+        
+        // Re-run on page navigation; toggle buttons need no re-binding (see Events)
+        Events.onRoute(Utils.cleanupInlineStyles);
     }
     
     // ═══════════════════════════════════════════════════════════════════════
@@ -1204,31 +834,60 @@
         version: CONFIG.version,
         config: CONFIG,
         
+        // Shared with the chunk bundles
+        core: {
+            CONFIG, Storage, Permissions, Preferences, SettingsPatch, Toast, Events, Chunks,
+            Performance, DarkMode, ColorTheme, requireBundle
+        },
+        defineChunk: (name, module) => Chunks.define(name, module),
+        loadChunk: (name) => Chunks.load(name),
+        
         // Color Theme
         colorTheme: ColorTheme,
-        setTheme: (theme) => ColorTheme.setTheme(theme),
-        toggleTheme: () => ColorTheme.toggle(),
+        setTheme: (theme) => ThemeSwitch.setTheme(theme),
+        toggleTheme: () => ThemeSwitch.toggleTheme(),
         
         // Dark Mode
         darkMode: DarkMode,
         toggleDarkMode: () => DarkMode.toggle(),
         
         // Sidebar
-        sidebar: SidebarToggle,
-        toggleSidebar: () => SidebarToggle.toggle(),
+        sidebar: Sidebar,
+        toggleSidebar: () => Sidebar.toggle(),
         
         // Toast Notifications
         toast: Toast,
-        notify: Toast.show.bind(Toast),
+        notify: Toast.show,
         
-        // Loading Skeleton
+        // Loading Skeleton (methods return promises, the chunk loads on first use)
         skeleton: Skeleton,
         
+        // Performance tier (full, lite or off) of this device
+        performance: Performance,
+        
+        // Charts (methods return promises, the chunk loads on first use)
+        charts: Charts,
+        loadCharts: () => Charts.load(),
+        
         // Theme Customizer
-        customizer: ThemeCustomizer,
+        customizer: Customizer,
+        
+        // Per-user preferences
+        preferences: Preferences,
+        
+        // Versioned settings writes
+        settingsPatch: SettingsPatch,
+        patchSettings: (changes) => SettingsPatch.send(changes),
         
         // Utilities
         refresh: Utils.cleanupInlineStyles
     };
     
+    // Start when DOM is ready; after the API above, which the chunks init() loads read
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init);
+    } else {
+        init();
+    }
+    
 })();
@@ -0,0 +1,34 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Charts bundle
+
+   A tree-shaken ECharts build with only the chart types and components the
+   theme's charts use. It is not in app_include_js: AhmadCSS.charts.load()
+   fetches it the first time a chart is drawn. Add a chart type here before
+   using it.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+import * as echarts from 'echarts/core';
+import { BarChart, LineChart, PieChart } from 'echarts/charts';
+import {
+    DatasetComponent,
+    GridComponent,
+    LegendComponent,
+    TitleComponent,
+    TooltipComponent
+} from 'echarts/components';
+import { CanvasRenderer } from 'echarts/renderers';
+
+echarts.use([
+    BarChart,
+    LineChart,
+    PieChart,
+    DatasetComponent,
+    GridComponent,
+    LegendComponent,
+    TitleComponent,
+    TooltipComponent,
+    CanvasRenderer
+]);
+
+// Same global the CDN build used to define, for existing custom scripts
+window.echarts = echarts;
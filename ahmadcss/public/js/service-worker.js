@@ -0,0 +1,153 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Service worker (optional, "Enable Service Worker" in settings)
+
+   Served by ahmadcss.service_worker.get_service_worker, which prepends
+   self.AHMADCSS_SW = { cache, precache, settingsUrl }. A new build or theme sheet
+   changes that config and so the script, and the browser installs the new worker.
+
+   - Precaches the hashed theme assets of the current build and settings.
+   - Serves other content-hashed assets (/assets/<app>/dist/, theme-*.css,
+     custom-*.css/js, fonts) cache-first, since their content never changes.
+   - Serves get_theme_settings stale-while-revalidate. A request for a newer
+     settings version (?v=) than the cached one goes to the network.
+   - Purges the caches of older versions, and unregisters itself when the
+     setting is turned off.
+   Pages and other API calls are never cached.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+const CONFIG = self.AHMADCSS_SW;
+
+const CACHE_PREFIX = 'ahmadcss-';
+const PRECACHE = `${CACHE_PREFIX}precache-${CONFIG.cache}`;
+const RUNTIME = `${CACHE_PREFIX}runtime`;
+const SETTINGS = `${CACHE_PREFIX}settings`;
+
+// Content-hashed URLs, safe to serve from the cache forever
+const IMMUTABLE_PATTERNS = [
+    /^\/assets\/[^/]+\/dist\//,
+    /^\/assets\/ahmadcss\/css\/(theme|main|custom)-[0-9a-f]+\.css$/,
+    /^\/assets\/ahmadcss\/js\/custom-[0-9a-f]+\.js$/,
+    /^\/assets\/ahmadcss\/fonts\//
+];
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then(cache => cache.addAll(CONFIG.precache))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil(
+        caches.keys()
+            // Entries of the previous build, including the hashed files cached at runtime
+            .then(keys => Promise.all(keys
+                .filter(key => key === RUNTIME || (key.startsWith(`${CACHE_PREFIX}precache-`) && key !== PRECACHE))
+                .map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+
+    if (url.pathname === CONFIG.settingsUrl) {
+        event.respondWith(serveSettings(url));
+    } else if (IMMUTABLE_PATTERNS.some(pattern => pattern.test(url.pathname))) {
+        event.respondWith(serveImmutable(request));
+    }
+});
+
+async function serveImmutable(request) {
+    const cached = await caches.match(request);
+    if (cached) return cached;
+
+    const response = await fetch(request);
+    if (response.ok) {
+        const cache = await caches.open(RUNTIME);
+        cache.put(request, response.clone());
+    }
+    return response;
+}
+
+// One cache entry per settings URL, whatever ?v= the page asked for
+async function serveSettings(url) {
+    const wanted = Number(url.searchParams.get('v')) || 0;
+    const cache = await caches.open(SETTINGS);
+    const cached = await cache.match(CONFIG.settingsUrl);
+    const cachedVersion = cached ? await readVersion(cached.clone()) : null;
+
+    const revalidate = refreshSettings(cache, cachedVersion);
+    if (cached && cachedVersion !== null && cachedVersion >= wanted) {
+        // Stale-while-revalidate: answer now, update the cache in the background
+        revalidate.catch(() => {});
+        return cached;
+    }
+
+    try {
+        return await revalidate;
+    } catch (e) {
+        if (cached) return cached;
+        throw e;
+    }
+}
+
+async function refreshSettings(cache, cachedVersion) {
+    // No conditional headers from the page: the cache must hold a full 200 response
+    const response = await fetch(CONFIG.settingsUrl, { headers: { 'Accept': 'application/json' }, cache: 'no-cache' });
+    if (!response.ok) return response;
+
+    const settings = await readSettings(response.clone());
+    if (settings && !settings.enable_service_worker) {
+        await retire();
+        return response;
+    }
+
+    await cache.put(CONFIG.settingsUrl, response.clone());
+    if (settings && settings.version !== cachedVersion) {
+        await purgeStaleAssets(settings);
+    }
+    return response;
+}
+
+async function readSettings(response) {
+    try {
+        const data = await response.json();
+        return data && data.message;
+    } catch (e) {
+        return null;
+    }
+}
+
+async function readVersion(response) {
+    const settings = await readSettings(response);
+    return settings && settings.version !== undefined ? Number(settings.version) : null;
+}
+
+// Files generated for older settings are not needed any more
+async function purgeStaleAssets(settings) {
+    // The Custom JS URL is desk-only, so a cached script is dropped too and fetched on the next desk load
+    const current = new Set([settings.theme_css, settings.compiled_css, settings.custom_css_url].filter(Boolean));
+    const cache = await caches.open(RUNTIME);
+    const requests = await cache.keys();
+    await Promise.all(requests
+        .filter(request => {
+            const path = new URL(request.url).pathname;
+            return /^\/assets\/ahmadcss\/(css\/(theme|main|custom)|js\/custom)-/.test(path) && !current.has(path);
+        })
+        .map(request => cache.delete(request)));
+}
+
+// The setting was turned off: drop every cache and stop controlling pages
+async function retire() {
+    const keys = await caches.keys();
+    await Promise.all(keys.filter(key => key.startsWith(CACHE_PREFIX)).map(key => caches.delete(key)));
+    await self.registration.unregister();
+}
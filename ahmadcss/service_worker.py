@@ -0,0 +1,58 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Optional service worker caching the theme assets and settings.
+
+``public/js/service-worker.js`` is served from /api/method/ with a
+``Service-Worker-Allowed: /`` header, so it can control both the desk and the
+website. The precache list of the current build and settings is prepended to
+the script, so a new build or theme sheet changes the script and the browser
+installs the new worker. Pages register it only when "Enable Service Worker"
+is set.
+"""
+
+import json
+import os
+
+import frappe
+from werkzeug.wrappers import Response
+
+from ahmadcss.api import get_theme_payload, with_css_assets
+from ahmadcss.artifacts import get_artifact_urls
+from ahmadcss.cache import get_content_hash, local_cache
+from ahmadcss.fonts import get_preload_urls
+
+SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "public", "js", "service-worker.js")
+SETTINGS_URL = "/api/method/ahmadcss.api.get_theme_settings"
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_service_worker():
+    """The service worker script for the current build and settings"""
+    payload = with_css_assets(get_theme_payload())
+
+    key = ("service_worker", payload["hash"])
+    script = local_cache.get(key)
+    if script is None:
+        script = build_service_worker(payload["settings"])
+        local_cache.set(key, script)
+
+    response = Response(script, content_type="application/javascript")
+    response.headers["Service-Worker-Allowed"] = "/"
+    # Browsers compare the script on each check; always send the current one
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def build_service_worker(settings):
+    precache = sorted(
+        {
+            *(settings.get("css_assets") or {}).values(),
+            *get_artifact_urls(settings),
+            *get_preload_urls(),
+        }
+    )
+    config = {"cache": get_content_hash(precache), "precache": precache, "settingsUrl": SETTINGS_URL}
+
+    with open(SCRIPT_PATH) as f:
+        return f"self.AHMADCSS_SW = {json.dumps(config)};\n{f.read()}"
@@ -0,0 +1,157 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Single reader for AhmadCSS Settings.
+
+Defaults and field types come from the doctype JSON, loaded once at import, so
+there is one source of truth for them. Values are read with a single
+``tabSingles`` query and no Document is built.
+"""
+
+import json
+import os
+
+import frappe
+from frappe.utils import cint, flt, get_datetime
+
+from ahmadcss import perf
+from ahmadcss.cache import get_content_hash
+
+DOCTYPE = "AhmadCSS Settings"
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), "ahmadcss", "doctype", "ahmadcss_settings", "ahmadcss_settings.json"
+)
+
+NO_VALUE_FIELDTYPES = ("Section Break", "Column Break", "Tab Break", "HTML", "Button", "Heading", "Fold")
+
+# Never sent to the browser as values; ahmadcss.custom_code publishes the code as files
+PRIVATE_FIELDS = ("custom_css", "custom_js", "enable_custom_js")
+
+# Keys older clients still read, mapped to the field they mirror
+LEGACY_ALIASES = {
+    "navbar_style": "header_style",
+    "navbar_blur": "header_blur",
+    "gradient_start": "body_gradient_start",
+    "gradient_end": "body_gradient_end",
+}
+
+
+def cast_value(fieldtype, value):
+    if fieldtype in ("Check", "Int"):
+        return cint(value)
+    if fieldtype in ("Float", "Percent"):
+        return flt(value)
+    if fieldtype in ("Code", "Small Text", "Text", "Long Text"):
+        return value or ""
+    return value
+
+
+def load_schema():
+    """Return ({fieldname: fieldtype}, {fieldname: default}) from the doctype JSON"""
+    with open(SCHEMA_PATH) as f:
+        meta = json.load(f)
+
+    fieldtypes, defaults = {}, {}
+    for field in meta["fields"]:
+        if field["fieldtype"] in NO_VALUE_FIELDTYPES:
+            continue
+        fieldtypes[field["fieldname"]] = field["fieldtype"]
+        defaults[field["fieldname"]] = cast_value(field["fieldtype"], field.get("default"))
+    return fieldtypes, defaults
+
+
+FIELDTYPES, DEFAULTS = load_schema()
+SETTINGS_FIELDS = tuple(FIELDTYPES)
+PUBLIC_FIELDS = tuple(field for field in SETTINGS_FIELDS if field not in PRIVATE_FIELDS)
+
+
+def get_settings_values(for_update=False):
+    """Return every settings field, read with one query and defaults filled in.
+
+    ``version`` is added alongside the fields; it changes on every save and is
+    what clients send back to guard their writes.
+    """
+    stored = frappe.db.get_singles_dict(DOCTYPE, for_update=for_update)
+
+    values = {}
+    for fieldname in SETTINGS_FIELDS:
+        value = stored.get(fieldname)
+        if value is None or value == "":
+            values[fieldname] = DEFAULTS[fieldname]
+        else:
+            values[fieldname] = cast_value(FIELDTYPES[fieldname], value)
+    values["version"] = get_version(stored.get("modified"))
+    return values
+
+
+def get_version(modified):
+    """Integer settings version (microseconds since the epoch of the last save)"""
+    if not modified:
+        return 0
+    return int(get_datetime(modified).timestamp() * 1_000_000)
+
+
+def get_changes(values, changes):
+    """Return the fields of ``changes`` whose value differs from ``values``"""
+    changed = {}
+    for fieldname, value in changes.items():
+        value = cast_value(FIELDTYPES[fieldname], value)
+        if value != values[fieldname]:
+            changed[fieldname] = value
+    return changed
+
+
+@perf.timed("save_settings")
+def update_settings(changes, allowed_fields=SETTINGS_FIELDS, version=None):
+    """Write only the fields that actually changed, in a single save.
+
+    The settings row is locked while diffing, so when ``version`` is given and
+    someone else saved in between, ``frappe.TimestampMismatchError`` is raised
+    instead of silently overwriting their changes. Returns the changed fields
+    and the settings version after the write.
+    """
+    changes = {LEGACY_ALIASES.get(fieldname, fieldname): value for fieldname, value in changes.items()}
+    invalid = [f for f in changes if f not in allowed_fields or f not in FIELDTYPES]
+    if invalid:
+        frappe.throw(f"Invalid field: {', '.join(invalid)}")
+
+    values = get_settings_values(for_update=True)
+    if version is not None and cint(version) != values["version"]:
+        raise frappe.TimestampMismatchError("Settings were changed by someone else, reload and try again")
+
+    changed = get_changes(values, changes)
+    if not changed:
+        return changed, values["version"]
+
+    doc = frappe.get_single(DOCTYPE)
+    doc.update(changed)
+    doc.save()
+    return changed, get_version(doc.modified)
+
+
+def serialize(values, fields=SETTINGS_FIELDS):
+    """Return the given fields of a settings dict plus the legacy aliases"""
+    data = {fieldname: values[fieldname] for fieldname in fields}
+    for alias, fieldname in LEGACY_ALIASES.items():
+        data[alias] = values[fieldname]
+    return data
+
+
+def get_public_settings(values=None):
+    """Settings that are safe to send to every visitor, including guests"""
+    return serialize(values or get_settings_values(), PUBLIC_FIELDS)
+
+
+def get_default_public_settings():
+    return serialize(DEFAULTS, PUBLIC_FIELDS)
+
+
+def get_overrides(settings):
+    """Return the public settings that differ from the defaults table shipped to the browser"""
+    defaults = get_default_public_settings()
+    return {key: value for key, value in settings.items() if key not in defaults or defaults[key] != value}
+
+
+# Identifies the public defaults table; the JS bundle ships a copy tagged with it
+SCHEMA_VERSION = get_content_hash(get_default_public_settings())
@@ -0,0 +1,210 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from ahmadcss import artifacts
+from ahmadcss.artifacts import (
+    EVICT_GRACE,
+    REFS_KEY,
+    STORE_KEY,
+    USED_KEY,
+    evict,
+    get_artifact_urls,
+    register_site_artifacts,
+)
+
+THEME = "/assets/ahmadcss/css/theme-0a1b2c3d.css"
+OLD_THEME = "/assets/ahmadcss/css/theme-0d0d0d0d.css"
+CUSTOM_JS = "/assets/ahmadcss/js/custom-1f1f1f1f.js"
+LOGO = "/assets/ahmadcss/images/logo-2e2e2e2e-1x.webp"
+LOGO_2X = "/assets/ahmadcss/images/logo-2e2e2e2e-2x.webp"
+MANIFEST = "/assets/ahmadcss/images/logo-3c3c3c3c.json"
+
+
+class FakeRedis:
+    """The hash commands artifacts.py pipelines, in memory, with Redis's bytes replies"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def make_key(self, key, shared=False):
+        return key
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def hash(self, key):
+        return {field.decode(): value.decode() for field, value in self.hashes.get(key, {}).items()}
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.replies = []
+
+    def hget(self, key, field):
+        self.replies.append(self.redis.hashes.get(key, {}).get(field.encode()))
+        return self
+
+    def hgetall(self, key):
+        self.replies.append(dict(self.redis.hashes.get(key, {})))
+        return self
+
+    def hset(self, key, field, value):
+        self.redis.hashes.setdefault(key, {})[field.encode()] = str(value).encode()
+        self.replies.append(1)
+        return self
+
+    def hdel(self, key, field):
+        # evict() passes back the bytes fields hgetall returned
+        field = field if isinstance(field, bytes) else field.encode()
+        self.replies.append(int(self.redis.hashes.get(key, {}).pop(field, None) is not None))
+        return self
+
+    def execute(self):
+        replies, self.replies = self.replies, []
+        return replies
+
+
+class TestArtifacts(FrappeTestCase):
+    def setUp(self):
+        self.sites_path = tempfile.mkdtemp(prefix="ahmadcss-test-")
+        self.addCleanup(shutil.rmtree, self.sites_path)
+        for site in ("one.local", "two.local"):
+            os.makedirs(os.path.join(self.sites_path, site))
+            with open(os.path.join(self.sites_path, site, "site_config.json"), "w") as f:
+                f.write("{}")
+
+        self.redis = FakeRedis()
+        for patcher in (
+            patch.object(frappe.local, "sites_path", self.sites_path),
+            patch.object(frappe.local, "site", "one.local"),
+            patch.object(artifacts.frappe, "cache", return_value=self.redis),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write(self, url, content="x", compressed=False):
+        path = os.path.join(self.sites_path, url.lstrip("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        for suffix in (".gz", ".br") if compressed else ():
+            with open(path + suffix, "w") as f:
+                f.write(content)
+        with open(path, "w") as f:
+            f.write(content)
+
+    def exists(self, url):
+        return os.path.exists(os.path.join(self.sites_path, url.lstrip("/")))
+
+    def register(self, site, urls):
+        with patch.object(frappe.local, "site", site):
+            register_site_artifacts(urls)
+
+    def set_used(self, url, seconds_ago):
+        self.redis.pipeline().hset(USED_KEY, url, int(time.time()) - seconds_ago).execute()
+
+    def test_get_artifact_urls(self):
+        settings = {
+            "theme_css": THEME,
+            "custom_js_url": CUSTOM_JS,
+            "logo_src": LOGO,
+            "logo_srcset": f"{LOGO} 1x, {LOGO_2X} 2x",
+            "custom_css_url": None,
+        }
+        self.assertEqual(get_artifact_urls(settings), [THEME, CUSTOM_JS, LOGO, LOGO_2X])
+
+    def test_register_replaces_the_site_references(self):
+        self.register("one.local", [THEME, CUSTOM_JS])
+        self.register("one.local", [OLD_THEME])
+        self.assertEqual(json.loads(self.redis.hash(REFS_KEY)["one.local"]), [OLD_THEME])
+        self.assertEqual(set(self.redis.hash(USED_KEY)), {THEME, CUSTOM_JS, OLD_THEME})
+
+    def test_referenced_files_are_kept(self):
+        for url in (THEME, CUSTOM_JS):
+            self.write(url)
+        self.register("one.local", [THEME])
+        self.register("two.local", [CUSTOM_JS])
+        self.set_used(THEME, EVICT_GRACE * 2)
+
+        self.assertEqual(evict(self.redis), [])
+        self.assertTrue(self.exists(THEME))
+        self.assertTrue(self.exists(CUSTOM_JS))
+
+    def test_unreferenced_files_are_evicted_after_the_grace_period(self):
+        self.write(THEME)
+        self.write(OLD_THEME, compressed=True)
+        self.write(CUSTOM_JS)
+        self.register("one.local", [THEME])
+        self.register("two.local", [THEME])
+        self.set_used(OLD_THEME, EVICT_GRACE + 60)
+        self.set_used(CUSTOM_JS, 60)
+        self.redis.pipeline().hset(STORE_KEY, "theme_css:abc", OLD_THEME).execute()
+
+        self.assertEqual(evict(self.redis), [OLD_THEME])
+        for suffix in ("", ".gz", ".br"):
+            self.assertFalse(self.exists(OLD_THEME + suffix))
+        self.assertTrue(self.exists(CUSTOM_JS))
+        self.assertNotIn(OLD_THEME, self.redis.hash(USED_KEY))
+        self.assertNotIn("theme_css:abc", self.redis.hash(STORE_KEY))
+
+    def test_least_recently_used_beyond_the_limit_are_evicted(self):
+        self.register("one.local", [])
+        self.register("two.local", [])
+        for seconds_ago, url in enumerate((THEME, OLD_THEME, CUSTOM_JS)):
+            self.write(url)
+            self.set_used(url, seconds_ago)
+
+        with patch.object(artifacts, "MAX_UNREFERENCED", 1):
+            evicted = evict(self.redis)
+        self.assertEqual(sorted(evicted), sorted([OLD_THEME, CUSTOM_JS]))
+        self.assertTrue(self.exists(THEME))
+
+    def test_files_never_seen_start_their_grace_period(self):
+        self.write(OLD_THEME)
+        self.register("one.local", [])
+        self.register("two.local", [])
+
+        self.assertEqual(evict(self.redis), [])
+        self.assertTrue(self.exists(OLD_THEME))
+        self.assertIn(OLD_THEME, self.redis.hash(USED_KEY))
+
+    def test_nothing_is_evicted_until_every_site_registered(self):
+        self.write(OLD_THEME)
+        self.register("one.local", [])
+        self.set_used(OLD_THEME, EVICT_GRACE + 60)
+
+        self.assertEqual(evict(self.redis), [])
+        self.assertTrue(self.exists(OLD_THEME))
+
+    def test_references_of_dropped_sites_are_forgotten(self):
+        self.write(OLD_THEME)
+        self.register("one.local", [])
+        self.register("two.local", [])
+        self.register("gone.local", [OLD_THEME])
+        self.set_used(OLD_THEME, EVICT_GRACE + 60)
+
+        self.assertEqual(evict(self.redis), [OLD_THEME])
+        self.assertNotIn("gone.local", self.redis.hash(REFS_KEY))
+
+    def test_logo_manifest_lives_as_long_as_its_logo(self):
+        self.write(LOGO)
+        self.write(MANIFEST, json.dumps({"logo_src": LOGO}))
+        self.register("one.local", [LOGO])
+        self.register("two.local", [])
+        self.set_used(MANIFEST, EVICT_GRACE + 60)
+
+        self.assertEqual(evict(self.redis), [])
+        self.assertTrue(self.exists(MANIFEST))
+
+        self.register("one.local", [])
+        self.set_used(LOGO, EVICT_GRACE + 60)
+        self.assertEqual(sorted(evict(self.redis)), sorted([LOGO, MANIFEST]))
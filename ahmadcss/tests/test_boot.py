@@ -0,0 +1,78 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import json
+import os
+import re
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from ahmadcss.api import get_boot_info, get_theme_payload
+from ahmadcss.settings import SCHEMA_VERSION, get_default_public_settings, get_overrides
+
+JS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "public", "js")
+BUNDLES = ("ahmadcss.bundle.js", "ahmadcss.js")
+
+THEME_DEFAULTS = re.compile(r"const THEME_DEFAULTS = (\{.*?\n    \});", re.S)
+
+
+def read_bundle_defaults(filename):
+    """THEME_DEFAULTS of a bundle, read as JSON: quoted keys and double-quoted strings"""
+    with open(os.path.join(JS_PATH, filename)) as f:
+        block = THEME_DEFAULTS.search(f.read())[1]
+    block = re.sub(r"'((?:[^'\\]|\\.)*)'", lambda m: json.dumps(m[1]), block)
+    block = re.sub(r"^(\s*)(\w+):", r'\1"\2":', block, flags=re.M)
+    return json.loads(block)
+
+
+class TestBundleDefaults(FrappeTestCase):
+    def test_bundle_ships_the_current_defaults(self):
+        # A doctype default changed without updating the bundle makes every desk boot fetch the settings again
+        for filename in BUNDLES:
+            defaults = read_bundle_defaults(filename)
+            self.assertEqual(defaults["schema"], SCHEMA_VERSION, filename)
+            self.assertEqual(defaults["values"], get_default_public_settings(), filename)
+
+
+class TestOverrides(FrappeTestCase):
+    def test_defaults_have_no_overrides(self):
+        self.assertEqual(get_overrides(get_default_public_settings()), {})
+
+    def test_only_changed_and_extra_fields(self):
+        settings = {
+            **get_default_public_settings(),
+            "glass_blur": 99,
+            "theme_css": "/assets/ahmadcss/css/theme-0a1b2c3d.css",
+        }
+        self.assertEqual(
+            get_overrides(settings), {"glass_blur": 99, "theme_css": "/assets/ahmadcss/css/theme-0a1b2c3d.css"}
+        )
+
+
+class TestBootInfo(FrappeTestCase):
+    def get_boot(self, preferences):
+        bootinfo = frappe._dict()
+        with patch("ahmadcss.api.get_preferences", return_value=preferences):
+            get_boot_info(bootinfo)
+        return bootinfo
+
+    def test_boot_rebuilds_the_payload(self):
+        payload = get_theme_payload()
+        boot = self.get_boot({}).ahmadcss
+
+        self.assertEqual(boot["schema"], SCHEMA_VERSION)
+        self.assertEqual(boot["hash"], payload["hash"])
+        # What the bundle does: its defaults table plus the overrides
+        self.assertEqual({**get_default_public_settings(), **boot["overrides"]}, payload["settings"])
+        self.assertLess(len(boot["overrides"]), len(payload["settings"]))
+
+    def test_preferences_override_and_change_the_hash(self):
+        payload = get_theme_payload()
+        bootinfo = self.get_boot({"dark_mode": 1})
+
+        self.assertEqual(bootinfo.ahmadcss["overrides"]["dark_mode"], 1)
+        self.assertEqual(bootinfo.ahmadcss_preferences, {"dark_mode": 1})
+        self.assertNotEqual(bootinfo.ahmadcss["hash"], payload["hash"])
+        self.assertNotEqual(bootinfo.ahmadcss["hash"], self.get_boot({"dark_mode": 0}).ahmadcss["hash"])
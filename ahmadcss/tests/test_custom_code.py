@@ -0,0 +1,51 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from ahmadcss import custom_code
+from ahmadcss.api import get_boot_info
+from ahmadcss.custom_code import get_custom_code_urls, minify
+
+SNIPPETS = {"custom_css": "body { color: red; }", "custom_js": "console.log('ahmadcss');"}
+
+
+class TestCustomCode(FrappeTestCase):
+    def setUp(self):
+        self.sites_path = tempfile.mkdtemp(prefix="ahmadcss-test-")
+        self.addCleanup(shutil.rmtree, self.sites_path)
+        for patcher in (
+            patch.object(frappe.local, "sites_path", self.sites_path),
+            patch.object(custom_code, "minify", side_effect=lambda source, loader, fieldname: source),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_custom_js_needs_its_switch(self):
+        self.assertEqual(set(get_custom_code_urls({**SNIPPETS, "enable_custom_js": 0})), {"custom_css_url"})
+        self.assertEqual(
+            set(get_custom_code_urls({**SNIPPETS, "enable_custom_js": 1})), {"custom_css_url", "custom_js_url"}
+        )
+
+    def test_custom_js_url_is_desk_only(self):
+        payload = {"settings": {}, "hash": "0a1b", "overrides": {}, "custom_js_url": "/assets/ahmadcss/js/custom-1f.js"}
+        bootinfo = frappe._dict()
+        with (
+            patch("ahmadcss.api.get_theme_payload", return_value=payload),
+            patch("ahmadcss.api.get_preferences", return_value={}),
+        ):
+            get_boot_info(bootinfo)
+        self.assertEqual(bootinfo.ahmadcss["custom_js_url"], payload["custom_js_url"])
+        self.assertNotIn("custom_js_url", payload["settings"])
+
+
+class TestMinify(FrappeTestCase):
+    def test_without_esbuild_snippets_are_rejected(self):
+        with patch.object(custom_code, "get_esbuild_command", return_value=None):
+            with self.assertRaises(frappe.ValidationError):
+                minify(SNIPPETS["custom_js"], "js", "custom_js")
@@ -0,0 +1,84 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import unittest
+
+from ahmadcss.palette import (
+    LIGHTNESS,
+    MIN_CONTRAST,
+    STEPS,
+    contrast,
+    get_color_tokens,
+    get_scale,
+    parse_hex,
+    pick_readable,
+    rgb_to_oklch,
+    to_hex,
+)
+
+WHITE = parse_hex("#ffffff")
+BLACK = parse_hex("#000000")
+
+
+def lightness(color):
+    return rgb_to_oklch(parse_hex(color))[0]
+
+
+class TestScale(unittest.TestCase):
+    def assertDarkens(self, color, anchor):
+        # As emitted: rounded to hex
+        scale = [to_hex(rgb) for rgb in get_scale(parse_hex(color), anchor)]
+        self.assertEqual(len(scale), len(STEPS))
+        for step, lighter, darker in zip(STEPS[1:], scale[:-1], scale[1:], strict=True):
+            self.assertGreater(
+                lightness(lighter), lightness(darker), f"{color} at {anchor}: {step} is not darker ({scale})"
+            )
+
+    def test_darkens_step_by_step(self):
+        for color in ("#0f766e", "#10b981", "#3b82f6", "#f59e0b", "#ef4444", "#ffff00", "#0000ff", "#808080"):
+            for anchor in (500, 600):
+                self.assertDarkens(color, anchor)
+
+    def test_black_and_white_darken_step_by_step(self):
+        for color in ("#000000", "#010101", "#fefefe", "#ffffff"):
+            for anchor in STEPS[1:-1]:
+                self.assertDarkens(color, anchor)
+
+    def test_anchor_keeps_configured_colour(self):
+        scale = get_scale(parse_hex("#0f766e"), 600)
+        self.assertEqual(to_hex(scale[STEPS.index(600)]), "#0f766e")
+
+    def test_black_anchor_is_derived(self):
+        scale = get_scale(BLACK, 600)
+        self.assertNotEqual(to_hex(scale[STEPS.index(600)]), "#000000")
+        self.assertGreater(lightness(to_hex(scale[-1])), LIGHTNESS[-1] - 0.01)
+
+    def test_ends_stay_put(self):
+        scale = get_scale(parse_hex("#3b82f6"), 500)
+        self.assertAlmostEqual(lightness(to_hex(scale[0])), LIGHTNESS[0], delta=0.005)
+        self.assertAlmostEqual(lightness(to_hex(scale[-1])), LIGHTNESS[-1], delta=0.005)
+
+    def test_invalid_colour(self):
+        self.assertIsNone(get_color_tokens("teal", "primary", 600, True))
+        self.assertIsNone(parse_hex("#12345"))
+        self.assertEqual(parse_hex("#fff"), WHITE)
+
+
+class TestPickReadable(unittest.TestCase):
+    def test_first_readable_candidate(self):
+        candidates = [parse_hex(color) for color in ("#eeeeee", "#777777", "#333333", "#000000")]
+        picked = pick_readable(candidates, WHITE)
+        self.assertEqual(to_hex(picked), "#333333")
+        self.assertGreaterEqual(contrast(picked, WHITE), MIN_CONTRAST)
+
+    def test_best_candidate_when_none_is_readable(self):
+        candidates = [parse_hex(color) for color in ("#ffffff", "#dddddd", "#bbbbbb")]
+        self.assertEqual(to_hex(pick_readable(candidates, WHITE)), "#bbbbbb")
+
+    def test_on_surface_tokens_are_readable(self):
+        for color in ("#0f766e", "#f59e0b", "#ffffff", "#000000"):
+            tokens, dark_tokens = get_color_tokens(color, "primary", 600, True)
+            on_light = contrast(parse_hex(tokens["--primary-on-surface"]), WHITE)
+            on_dark = contrast(parse_hex(dark_tokens["--primary-on-surface"]), parse_hex("#0a1e19"))
+            self.assertGreaterEqual(on_light, MIN_CONTRAST, color)
+            self.assertGreaterEqual(on_dark, MIN_CONTRAST, color)
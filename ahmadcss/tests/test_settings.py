@@ -0,0 +1,57 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from ahmadcss.settings import get_changes, get_settings_values, update_settings
+
+
+class TestUpdateSettings(FrappeTestCase):
+    def setUp(self):
+        self.values = get_settings_values()
+        # Valid (0-100) and different from the stored value
+        self.new_blur = 10 if self.values["glass_blur"] != 10 else 20
+
+    def tearDown(self):
+        frappe.db.rollback()
+
+    def test_get_changes_casts_and_drops_unchanged(self):
+        color = "#123456" if self.values["primary_color"] != "#123456" else "#654321"
+        changes = get_changes(self.values, {"glass_blur": str(self.values["glass_blur"]), "primary_color": color})
+        self.assertEqual(changes, {"primary_color": color})
+
+    def test_unchanged_values_are_not_saved(self):
+        changed, version = update_settings({"glass_blur": self.values["glass_blur"]}, version=self.values["version"])
+        self.assertEqual(changed, {})
+        self.assertEqual(version, self.values["version"])
+        self.assertEqual(get_settings_values()["version"], self.values["version"])
+
+    def test_changed_values_are_saved(self):
+        changed, version = update_settings({"glass_blur": self.new_blur}, version=self.values["version"])
+        self.assertEqual(changed, {"glass_blur": self.new_blur})
+        self.assertNotEqual(version, self.values["version"])
+
+        values = get_settings_values()
+        self.assertEqual(values["glass_blur"], self.new_blur)
+        self.assertEqual(values["version"], version)
+
+    def test_legacy_alias_writes_its_field(self):
+        header_blur = 5 if self.values["header_blur"] != 5 else 15
+        changed, _version = update_settings({"navbar_blur": header_blur})
+        self.assertEqual(changed, {"header_blur": header_blur})
+
+    def test_stale_version_conflicts(self):
+        with self.assertRaises(frappe.TimestampMismatchError):
+            update_settings({"glass_blur": self.new_blur}, version=self.values["version"] - 1)
+        self.assertEqual(get_settings_values()["glass_blur"], self.values["glass_blur"])
+
+    def test_without_version_last_write_wins(self):
+        update_settings({"glass_blur": self.new_blur})
+        self.assertEqual(get_settings_values()["glass_blur"], self.new_blur)
+
+    def test_invalid_fields_are_rejected(self):
+        with self.assertRaises(frappe.ValidationError):
+            update_settings({"not_a_field": 1})
+        with self.assertRaises(frappe.ValidationError):
+            update_settings({"custom_css": "body {}"}, allowed_fields=("glass_blur",))
@@ -0,0 +1,163 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Render AhmadCSS Settings into a small, content-hashed custom-properties stylesheet.
+
+The file is written under ``sites/assets/ahmadcss/css`` and linked in <head>, so
+the first paint is already themed without waiting for the settings API.
+"""
+
+import hashlib
+import os
+
+import frappe
+
+from ahmadcss.artifacts import get_artifact
+from ahmadcss.cache import get_versioned_value, register_theme_cache_key
+from ahmadcss.fonts import render_font_css
+from ahmadcss.palette import get_palette_tokens
+from ahmadcss.settings import get_settings_values
+
+THEME_CSS_KEY = register_theme_cache_key("ahmadcss:theme_css")
+
+# Light-only tokens, so the dark mode blocks in components.css keep overriding them
+SURFACE_TOKENS = ("--glass-white", "--gradient-bg")
+
+ANIMATION_SPEED_FACTOR = {"Slow": 1.5, "Normal": 1, "Fast": 0.6}
+
+# Base durations (ms) of the transition tokens in _variables.scss
+TRANSITIONS = {
+    "--transition-fast": (150, "ease"),
+    "--transition-base": (250, "cubic-bezier(0.4, 0, 0.2, 1)"),
+    "--transition-slow": (350, "cubic-bezier(0.4, 0, 0.2, 1)"),
+    "--transition-spring": (500, "cubic-bezier(0.175, 0.885, 0.32, 1.275)"),
+}
+
+FONT_FALLBACK = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif"
+
+
+def get_theme_css_url(values=None):
+    """Return the URL of the theme stylesheet for the current settings, generating it if needed"""
+    return get_versioned_value(THEME_CSS_KEY, lambda: generate_theme_css(values))
+
+
+def generate_theme_css(values=None):
+    """Return the URL of the theme stylesheet for a settings dict (default: the current settings).
+
+    A stylesheet any site of the bench rendered from the same settings is reused.
+    """
+    values = values or get_settings_values()
+    return get_artifact("theme_css", values, lambda: write_theme_css(values))
+
+
+def write_theme_css(values):
+    """Render and write the theme stylesheet for a settings dict; return its URL"""
+    css = render_theme_css(values)
+    filename = f"theme-{hashlib.sha256(css.encode()).hexdigest()[:16]}.css"
+    write_asset(filename, css)
+    return f"/assets/ahmadcss/css/{filename}"
+
+
+def write_asset(filename, content, folder="css"):
+    """Atomically write a content-hashed file (text or bytes) to sites/assets/ahmadcss/<folder>"""
+    folder = os.path.join(frappe.local.sites_path, "assets", "ahmadcss", folder)
+    path = os.path.join(folder, filename)
+    if os.path.exists(path):
+        # Content-hashed names never change content, so an existing file is current
+        return path
+
+    os.makedirs(folder, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb" if isinstance(content, bytes) else "w") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return path
+
+
+def render_theme_css(settings):
+    """Return the custom-properties stylesheet for a settings dict.
+
+    ``:root:root`` outranks the ``:root`` block of the theme sheets loaded later,
+    while the light-only surface tokens leave dark mode overrides in charge and
+    the dark mode palette outranks both. The @font-face rules of the selected
+    fonts come first.
+    """
+    tokens = get_theme_tokens(settings)
+    surface_tokens = {token: tokens.pop(token) for token in SURFACE_TOKENS if token in tokens}
+    font_imports, font_faces = render_font_css(settings)
+    return "\n".join(
+        [
+            *font_imports,
+            *font_faces,
+            format_rule(":root:root", tokens),
+            format_rule(':root:not([data-dark-mode="dark"])', surface_tokens),
+            format_rule(':root:root[data-dark-mode="dark"]', get_palette_tokens(settings)[1]),
+            "",
+        ]
+    )
+
+
+def get_theme_tokens(settings):
+    """Map settings to the CSS custom properties used by the AhmadCSS stylesheets"""
+    glass = settings.get("enable_glassmorphism")
+    opacity = (settings.get("glass_opacity") or 72) / 100
+
+    tokens = {
+        "--primary-600": settings.get("primary_color"),
+        "--secondary-500": settings.get("secondary_color"),
+        "--success": settings.get("success_color"),
+        "--warning": settings.get("warning_color"),
+        "--error": settings.get("error_color"),
+        "--glass-blur": f"{settings.get('glass_blur') if glass else 0}px",
+        "--header-blur": f"{settings.get('header_blur') or 0}px",
+        "--sidebar-blur": f"{settings.get('sidebar_blur') or 0}px",
+        "--footer-blur": f"{settings.get('footer_blur') or 0}px",
+        "--sidebar-width": f"{settings.get('sidebar_width')}px",
+        "--gradient-navbar": linear_gradient(
+            settings.get("header_gradient_start"), settings.get("header_gradient_end")
+        ),
+        "--gradient-sidebar": linear_gradient(
+            settings.get("sidebar_gradient_start"), settings.get("sidebar_gradient_end")
+        ),
+        "--gradient-footer": linear_gradient(
+            settings.get("footer_gradient_start"), settings.get("footer_gradient_end")
+        ),
+        "--glass-white": f"rgba(255, 255, 255, {round(opacity, 2)})",
+        "--gradient-bg": linear_gradient(
+            settings.get("body_gradient_start"),
+            settings.get("body_gradient_middle"),
+            settings.get("body_gradient_end"),
+        ),
+    }
+
+    # Scales, state variants and readable text colours of the configured colours
+    tokens.update(get_palette_tokens(settings)[0])
+
+    if settings.get("enable_custom_fonts"):
+        fonts = dict.fromkeys(f for f in (settings.get("font_family"), settings.get("arabic_font")) if f)
+        tokens["--font-sans"] = ", ".join([*(f"'{font}'" for font in fonts), FONT_FALLBACK])
+    if settings.get("font_size_base"):
+        tokens["--font-size-base"] = f"{settings.get('font_size_base')}px"
+
+    factor = ANIMATION_SPEED_FACTOR.get(settings.get("animation_speed"), 1)
+    if not settings.get("enable_animations"):
+        factor = 0
+    for token, (duration, easing) in TRANSITIONS.items():
+        tokens[token] = f"{round(duration * factor)}ms {easing}"
+
+    return {token: value for token, value in tokens.items() if value is not None}
+
+
+def linear_gradient(*stops):
+    stops = [stop for stop in stops if stop]
+    if len(stops) < 2:
+        return stops[0] if stops else None
+
+    last = len(stops) - 1
+    stops = ", ".join(f"{stop} {round(i * 100 / last)}%" for i, stop in enumerate(stops))
+    return f"linear-gradient(135deg, {stops})"
+
+
+def format_rule(selector, tokens):
+    declarations = ";".join(f"{token}:{value}" for token, value in tokens.items())
+    return f"{selector}{{{declarations}}}"
@@ -0,0 +1,26 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from ahmadcss.api import get_theme_payload
+from ahmadcss.theme_css import get_theme_css_url
+
+
+def update_website_context(context):
+    """Link the generated theme stylesheet and the custom CSS on website pages and the desk (/app)"""
+    try:
+        stylesheets = [get_theme_css_url()]
+        custom_css = get_theme_payload()["settings"].get("custom_css_url")
+    except Exception:
+        frappe.log_error(title="AhmadCSS Theme CSS Error")
+        return
+
+    # After the theme, so the custom rules win over it
+    if custom_css:
+        stylesheets.append(custom_css)
+
+    # Copy the lists: they come straight from the cached hooks
+    context.web_include_css = [*(context.get("web_include_css") or []), *stylesheets]
+    if context.get("include_css") is not None:
+        context.include_css = [*context.include_css, *stylesheets]
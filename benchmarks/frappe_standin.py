@@ -0,0 +1,514 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Lightweight in-process stand-in for the parts of Frappe the theme hot paths use.
+
+``install()`` registers fake ``frappe`` modules in ``sys.modules`` so the app
+can be imported and benchmarked offline: single doctypes live in a dict (like
+``tabSingles``), the cache is an in-memory Redis look-alike and ``after_commit``
+callbacks run when a simulated request ends. ``redis`` and ``werkzeug`` are only
+faked when they are not installed.
+
+This is for benchmarking relative changes, not for testing behaviour against
+real Frappe.
+"""
+
+import html
+import json
+import os
+import sys
+import tempfile
+import threading
+import types
+from collections import deque
+from datetime import datetime
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ahmadcss")
+
+
+class ValidationError(Exception):
+    pass
+
+
+class TimestampMismatchError(ValidationError):
+    pass
+
+
+class PermissionError(Exception):
+    pass
+
+
+class _dict(dict):
+    """Attribute-access dict, like frappe._dict"""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+class FakeLock:
+    def __init__(self, cache, name):
+        self.cache = cache
+        self.name = name
+
+    def acquire(self, blocking=True, blocking_timeout=None):
+        return self.cache._locks[self.name].acquire(timeout=blocking_timeout or -1)
+
+    def release(self):
+        self.cache._locks[self.name].release()
+
+
+class FakePipeline:
+    """Queues raw (already prefixed) Redis commands, like redis-py's Pipeline"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.commands = []
+
+    def __getattr__(self, command):
+        def queue(*args):
+            self.commands.append((command, args))
+            return self
+
+        return queue
+
+    def execute(self):
+        results = [getattr(self.cache, f"_raw_{command}")(*args) for command, args in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeCache:
+    """The subset of frappe.cache() (RedisWrapper) used by the app, kept in memory.
+
+    Values are stored JSON-encoded so each read pays a (de)serialisation cost
+    comparable to Redis' pickling.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._hashes = {}
+        self._raw = {}
+        self._locks = {}
+
+    def make_key(self, key, shared=False):
+        return key if shared else f"{local.site}|{key}"
+
+    def get_value(self, key):
+        value = self._data.get(self.make_key(key))
+        return None if value is None else json.loads(value)
+
+    def set_value(self, key, value, expires_in_sec=None):
+        self._data[self.make_key(key)] = json.dumps(value, default=str)
+
+    def delete_value(self, keys):
+        if isinstance(keys, str):
+            keys = [keys]
+        for key in keys:
+            self._data.pop(self.make_key(key), None)
+            self._hashes.pop(self.make_key(key), None)
+            self._raw.pop(self.make_key(key), None)
+
+    def hget(self, name, key):
+        value = self._hashes.get(self.make_key(name), {}).get(key)
+        return None if value is None else json.loads(value)
+
+    def hset(self, name, key, value):
+        self._hashes.setdefault(self.make_key(name), {})[key] = json.dumps(value, default=str)
+
+    def hdel(self, name, key):
+        self._hashes.get(self.make_key(name), {}).pop(key, None)
+
+    def lock(self, name, timeout=None):
+        self._locks.setdefault(name, threading.Lock())
+        return FakeLock(self, name)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def _raw_hincrby(self, name, key, amount=1):
+        data = self._raw.setdefault(name, {})
+        data[key.encode()] = int(data.get(key.encode(), 0)) + amount
+        return data[key.encode()]
+
+    def _raw_hget(self, name, key):
+        return self._raw.get(name, {}).get(key.encode())
+
+    def _raw_hset(self, name, key, value):
+        self._raw.setdefault(name, {})[key.encode()] = str(value).encode()
+
+    def _raw_hdel(self, name, key):
+        self._raw.get(name, {}).pop(key if isinstance(key, bytes) else key.encode(), None)
+
+    def _raw_hgetall(self, name):
+        return dict(self._raw.get(name, {}))
+
+    def _raw_lpush(self, name, value):
+        self._raw.setdefault(name, []).insert(0, str(value).encode())
+
+    def _raw_ltrim(self, name, start, end):
+        self._raw[name] = self._raw.get(name, [])[start : end + 1]
+
+    def _raw_lrange(self, name, start, end):
+        values = self._raw.get(name, [])
+        return values[start:] if end == -1 else values[start : end + 1]
+
+    def flushall(self):
+        self._data.clear()
+        self._hashes.clear()
+        self._raw.clear()
+
+
+class CallbackManager(list):
+    def add(self, fn):
+        self.append(fn)
+
+    def run(self):
+        while self:
+            self.pop(0)()
+
+
+class FakeDB:
+    """Single doctypes kept as {doctype: {field: value}}, like tabSingles"""
+
+    def __init__(self):
+        self.singles = {}
+        self.after_commit = CallbackManager()
+        self.queries = 0
+
+    def get_singles_dict(self, doctype, debug=False, *, for_update=False, cast=False):
+        self.queries += 1
+        return _dict(self.singles.get(doctype, {}))
+
+    def set_single(self, doctype, values):
+        # tabSingles stores every value as text
+        self.queries += 1
+        self.singles.setdefault(doctype, {}).update(
+            {key: None if value is None else str(value) for key, value in values.items()}
+        )
+
+    def exists(self, doctype, name=None):
+        return True
+
+    def commit(self):
+        self.after_commit.run()
+
+    def rollback(self):
+        self.after_commit.clear()
+
+
+class Document:
+    """Minimal BaseDocument: fields as attributes, save runs the controller hooks"""
+
+    doctype = None
+
+    def __init__(self, values=None):
+        self.__dict__.update(values or {})
+        self.flags = _dict()
+
+    def get(self, key, default=None):
+        return self.__dict__.get(key, default)
+
+    def set(self, key, value):
+        setattr(self, key, value)
+
+    def update(self, values):
+        self.__dict__.update(values)
+        return self
+
+    def save(self):
+        self.validate()
+        previous = db.singles.get(self.doctype, {}).get("modified")
+        self.modified = _next_modified(previous)
+        values = {key: value for key, value in self.__dict__.items() if not key.startswith("_") and key != "flags"}
+        db.set_single(self.doctype, values)
+        self.on_update()
+        return self
+
+    def validate(self):
+        pass
+
+    def on_update(self):
+        pass
+
+
+def _next_modified(previous):
+    modified = datetime.now()
+    if previous and str(modified) <= str(previous):
+        modified = datetime.fromtimestamp(get_datetime(previous).timestamp() + 0.000001)
+    return str(modified)
+
+
+CONTROLLERS = {}
+
+
+def get_single(doctype):
+    if doctype not in CONTROLLERS:
+        from ahmadcss.ahmadcss.doctype.ahmadcss_settings.ahmadcss_settings import AhmadCSSSettings
+
+        CONTROLLERS["AhmadCSS Settings"] = AhmadCSSSettings
+
+    # Like Document.__init__, load values cast to their fieldtype
+    from ahmadcss.settings import FIELDTYPES, cast_value
+
+    stored = db.singles.get(doctype, {})
+    doc = CONTROLLERS[doctype]({key: cast_value(FIELDTYPES.get(key), value) for key, value in stored.items()})
+    doc.doctype = doctype
+    return doc
+
+
+def cint(value, default=0):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def flt(value, precision=None):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return round(value, precision) if precision is not None else value
+
+
+def get_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def whitelist(allow_guest=False, methods=None, xss_safe=False):
+    def decorator(fn):
+        return fn
+
+    return decorator
+
+
+def throw(msg, exc=ValidationError, title=None):
+    raise exc(msg)
+
+
+def parse_json(value):
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def as_json(obj, indent=1, separators=None):
+    return json.dumps(obj, indent=indent, separators=separators, default=str, sort_keys=True)
+
+
+def log_error(title=None, message=None, **kwargs):
+    pass
+
+
+def enqueue(method, **kwargs):
+    enqueued.append((method, kwargs))
+
+
+def publish_realtime(event=None, message=None, **kwargs):
+    """Stand-in for the socket.io server: keep what would be pushed to browsers"""
+    published.append((event, message))
+
+
+def get_app_path(app, *parts):
+    return os.path.join(APP_PATH, *parts)
+
+
+def only_for(roles, message=False):
+    if session.user != "Administrator":
+        raise PermissionError
+
+
+def get_site_path(*path):
+    return os.path.join(local.sites_path, local.site, *path)
+
+
+def get_sites(sites_path=None):
+    return [local.site]
+
+
+def safe_decode(value, encoding="utf-8"):
+    return value.decode(encoding) if isinstance(value, bytes) else value
+
+
+def _(text):
+    return text
+
+
+def _cache():
+    return cache
+
+
+# Frappe's User Settings, cached in a Redis hash per doctype and user
+def get_user_settings(doctype, for_update=False):
+    return cache.hget("_user_settings", f"{doctype}::{session.user}") or "{}"
+
+
+def update_user_settings(doctype, user_settings, for_update=False):
+    current = json.loads(get_user_settings(doctype))
+    current.update(user_settings)
+    cache.hset("_user_settings", f"{doctype}::{session.user}", json.dumps(current))
+
+
+class IfNoneMatch:
+    def __init__(self, etags=()):
+        self.etags = set(etags)
+
+    def contains_weak(self, etag):
+        return etag in self.etags
+
+
+class FakeRequest:
+    def __init__(self, if_none_match=()):
+        self.if_none_match = IfNoneMatch(if_none_match)
+
+
+class Headers(dict):
+    pass
+
+
+class Response:
+    """Enough of werkzeug's Response for the conditional theme endpoint"""
+
+    def __init__(self, response=None, status=200, content_type=None):
+        self.data = (response or "").encode() if isinstance(response, str) else response or b""
+        self.status_code = status
+        self.headers = Headers({"Content-Type": content_type} if content_type else {})
+
+    def get_data(self):
+        return self.data
+
+    def set_etag(self, etag, weak=False):
+        self.headers["ETag"] = f'{"W/" if weak else ""}"{etag}"'
+
+
+cache = FakeCache()
+db = FakeDB()
+local = _dict(site="bench.local", sites_path=None, request=None)
+conf = _dict()
+session = _dict(user="Administrator")
+enqueued = []
+published = deque(maxlen=100)
+
+
+def start_request(request=None, user="Administrator"):
+    """Begin a simulated request: set the user and (optionally) the HTTP request"""
+    local.request = request
+    session.user = user
+    db.after_commit.clear()
+
+
+def end_request():
+    """Commit the simulated request, running after_commit callbacks"""
+    db.commit()
+    local.request = None
+
+
+def reset():
+    """Forget all data, as on a fresh site"""
+    cache.flushall()
+    db.singles.clear()
+    db.after_commit.clear()
+    db.queries = 0
+    enqueued.clear()
+    published.clear()
+
+
+def install():
+    """Register the stand-in as ``frappe`` and return the module"""
+    if "frappe" in sys.modules and getattr(sys.modules["frappe"], "IS_STANDIN", False):
+        return sys.modules["frappe"]
+
+    local.sites_path = tempfile.mkdtemp(prefix="ahmadcss-bench-")
+
+    frappe = types.ModuleType("frappe")
+    frappe.IS_STANDIN = True
+    frappe.__path__ = []
+    for name, value in {
+        "ValidationError": ValidationError,
+        "TimestampMismatchError": TimestampMismatchError,
+        "PermissionError": PermissionError,
+        "_dict": _dict,
+        "_": _,
+        "cache": _cache,
+        "db": db,
+        "local": local,
+        "session": session,
+        "get_single": get_single,
+        "whitelist": whitelist,
+        "throw": throw,
+        "parse_json": parse_json,
+        "as_json": as_json,
+        "log_error": log_error,
+        "enqueue": enqueue,
+        "publish_realtime": publish_realtime,
+        "get_app_path": get_app_path,
+        "get_site_path": get_site_path,
+        "only_for": only_for,
+        "safe_decode": safe_decode,
+        "conf": conf,
+    }.items():
+        setattr(frappe, name, value)
+
+    # frappe.request is a proxy to frappe.local.request
+    frappe.__class__ = type("FrappeModule", (types.ModuleType,), {"request": property(lambda self: local.request)})
+
+    utils = types.ModuleType("frappe.utils")
+    utils.cint, utils.flt, utils.get_datetime = cint, flt, get_datetime
+    utils.escape_html = html.escape
+    utils.get_sites = get_sites
+    model = types.ModuleType("frappe.model")
+    model.__path__ = []
+    document = types.ModuleType("frappe.model.document")
+    document.Document = Document
+    model_utils = types.ModuleType("frappe.model.utils")
+    model_utils.__path__ = []
+    user_settings = types.ModuleType("frappe.model.utils.user_settings")
+    user_settings.get_user_settings = get_user_settings
+    user_settings.update_user_settings = update_user_settings
+
+    frappe.utils, frappe.model = utils, model
+    model.document, model.utils = document, model_utils
+    model_utils.user_settings = user_settings
+    sys.modules.update(
+        {
+            "frappe": frappe,
+            "frappe.utils": utils,
+            "frappe.model": model,
+            "frappe.model.document": document,
+            "frappe.model.utils": model_utils,
+            "frappe.model.utils.user_settings": user_settings,
+        }
+    )
+
+    _install_if_missing("redis", {"exceptions": {"LockError": type("LockError", (Exception,), {})}})
+    _install_if_missing("werkzeug", {"wrappers": {"Response": Response}})
+    return frappe
+
+
+def _install_if_missing(package, submodules):
+    try:
+        __import__(package)
+        return
+    except ImportError:
+        pass
+
+    module = types.ModuleType(package)
+    module.__path__ = []
+    sys.modules[package] = module
+    for name, attributes in submodules.items():
+        submodule = types.ModuleType(f"{package}.{name}")
+        for attribute, value in attributes.items():
+            setattr(submodule, attribute, value)
+        setattr(module, name, submodule)
+        sys.modules[f"{package}.{name}"] = submodule
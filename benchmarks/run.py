@@ -0,0 +1,262 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Micro-benchmarks for the theme server hot paths.
+
+Runs offline against the in-process Frappe stand-in in ``frappe_standin.py``:
+
+    python benchmarks/run.py                      # compare with baseline.json
+    python benchmarks/run.py --update-baseline    # record new baseline numbers
+    python benchmarks/run.py -k boot --threshold 0.4
+
+For every case it reports operations per second, the peak memory allocated by
+one call, the memory blocks a call leaves allocated (its result included), and
+the number of settings queries per call. Speed is compared as a
+ratio to a fixed calibration loop timed in the same process right before the
+case, so the baseline holds on machines faster or slower than the one that
+recorded it. The run fails (exit code 1) when a case's relative speed drops,
+or its peak memory or allocated blocks grow, by more than ``--threshold``, or
+when it makes more queries than the baseline.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import frappe_standin
+
+frappe = frappe_standin.install()
+
+from ahmadcss import api
+from ahmadcss.ahmadcss.doctype.ahmadcss_settings import ahmadcss_settings
+from ahmadcss.cache import invalidate_theme_cache, local_cache
+from ahmadcss.settings import DEFAULTS, DOCTYPE
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.3
+BASELINE_KEYS = ("relative_speed", "peak_bytes", "blocks", "queries")
+ROUND_SECONDS = 0.2
+ROUNDS = 5
+
+# tracemalloc's own snapshots are not the case's allocations
+SNAPSHOT_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+# Interpreter work like the cases' own (dict copies, JSON, hashing), independent of the app code
+CALIBRATION_VALUES = {f"field_{i}": "#0f766e" if i % 3 else i for i in range(80)}
+
+
+def reset_site():
+    frappe_standin.reset()
+    local_cache.clear()
+    request(lambda: frappe.get_single(DOCTYPE).update(DEFAULTS).save())
+
+
+def request(fn, *args, http_request=None, **kwargs):
+    """Run fn like a web request: fresh request state, commit at the end"""
+    frappe_standin.start_request(http_request)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        frappe_standin.end_request()
+
+
+def alternating(*values):
+    state = {"i": 0}
+
+    def next_value():
+        state["i"] += 1
+        return values[state["i"] % len(values)]
+
+    return next_value
+
+
+def get_cases():
+    """Return {name: callable}; each callable performs one operation"""
+    next_blur = alternating(18, 22)
+    next_color = alternating("#0f766e", "#115e59")
+    etag_request = {}
+
+    def conditional_request():
+        if "request" not in etag_request:
+            etag = api.with_css_assets(api.get_theme_payload())["hash"]
+            etag_request["request"] = frappe_standin.FakeRequest([etag])
+        return request(api.get_theme_settings, http_request=etag_request["request"])
+
+    def cold_theme_settings():
+        invalidate_theme_cache()
+        return request(api.get_theme_settings)
+
+    def boot():
+        bootinfo = frappe._dict()
+        request(api.get_boot_info, bootinfo)
+        return bootinfo
+
+    return {
+        "get_theme_settings": lambda: request(api.get_theme_settings),
+        "get_theme_settings_304": conditional_request,
+        "get_theme_settings_cold": cold_theme_settings,
+        "get_boot_info": boot,
+        "get_settings": lambda: request(ahmadcss_settings.AhmadCSSSettings.get_settings),
+        "save_theme_settings_unchanged": lambda: request(
+            api.save_theme_settings, json.dumps({"color_theme": "Silver", "glass_blur": 20})
+        ),
+        "save_theme_settings": lambda: request(api.save_theme_settings, json.dumps({"glass_blur": next_blur()})),
+        "update_setting": lambda: request(ahmadcss_settings.update_setting, "primary_color", next_color()),
+        "patch_theme_settings": lambda: request(
+            api.patch_theme_settings, json.dumps({"glass_blur": next_blur(), "primary_color": next_color()})
+        ),
+    }
+
+
+def check_realtime():
+    """Saving the settings must push one event carrying the new settings version"""
+    reset_site()
+    frappe_standin.published.clear()
+    request(api.patch_theme_settings, json.dumps({"glass_blur": 31}))
+
+    expected = api.get_theme_payload()["settings"]["version"]
+    events = [message for event, message in frappe_standin.published if event == api.THEME_CHANGED_EVENT]
+    if events != [{"version": expected}]:
+        return [f"realtime: expected one {api.THEME_CHANGED_EVENT} for version {expected}, got {events}"]
+    return []
+
+
+def calibrate():
+    values = dict(CALIBRATION_VALUES)
+    text = json.dumps(values, sort_keys=True)
+    hashlib.sha256(text.encode()).hexdigest()
+    return json.loads(text)
+
+
+def measure_rates(fn):
+    """Return ops/sec of each of ROUNDS timed rounds"""
+    fn()  # warm up caches and imports
+
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= ROUND_SECONDS / 4:
+            break
+        iterations *= 2
+    iterations = max(1, int(iterations * ROUND_SECONDS / elapsed))
+
+    rates = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        rates.append(iterations / (time.perf_counter() - start))
+    return rates
+
+
+def count_blocks(snapshot):
+    """Number of allocated memory blocks in a tracemalloc snapshot"""
+    return sum(stat.count for stat in snapshot.filter_traces(SNAPSHOT_FILTERS).statistics("filename"))
+
+
+def measure(fn):
+    """Return ops/sec (best of ROUNDS), speed relative to calibrate(), peak bytes, blocks and queries per call"""
+    calibration = max(measure_rates(calibrate))
+    rates = measure_rates(fn)
+
+    queries_before = frappe.db.queries
+    calls = 20
+    peaks, blocks = [], []
+    tracemalloc.start()
+    for _ in range(calls):
+        before = count_blocks(tracemalloc.take_snapshot())
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        blocks.append(count_blocks(tracemalloc.take_snapshot()) - before)
+        del result
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(max(rates), 1),
+        "ops_per_sec_median": round(statistics.median(rates), 1),
+        "relative_speed": round(max(rates) / calibration, 4),
+        "peak_bytes": int(statistics.median(peaks)),
+        "blocks": max(0, int(statistics.median(blocks))),
+        "queries": round((frappe.db.queries - queries_before) / calls, 2),
+    }
+
+
+def compare(name, result, baseline, threshold):
+    """Return a list of regression messages for one case"""
+    if not baseline:
+        return []
+
+    problems = []
+    if result["relative_speed"] < baseline["relative_speed"] * (1 - threshold):
+        problems.append(f"{name}: {result['relative_speed']} relative speed, baseline {baseline['relative_speed']}")
+    if result["peak_bytes"] > baseline["peak_bytes"] * (1 + threshold):
+        problems.append(f"{name}: {result['peak_bytes']} peak bytes, baseline {baseline['peak_bytes']}")
+    # Baselines recorded before blocks were counted have none
+    if "blocks" in baseline and result["blocks"] > baseline["blocks"] * (1 + threshold):
+        problems.append(f"{name}: {result['blocks']} blocks, baseline {baseline['blocks']}")
+    if result["queries"] > baseline["queries"]:
+        problems.append(f"{name}: {result['queries']} queries/op, baseline {baseline['queries']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", help="only run cases whose name contains this")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed regression ratio")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to baseline.json")
+    args = parser.parse_args()
+
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baselines = json.load(f)
+
+    results, problems = {}, []
+    print(f"{'case':32} {'ops/s':>12} {'median':>12} {'relative':>9} {'peak B':>10} {'blocks':>7} {'queries':>8}")
+    for name, fn in get_cases().items():
+        if args.pattern and args.pattern not in name:
+            continue
+
+        reset_site()
+        result = results[name] = measure(fn)
+        print(
+            f"{name:32} {result['ops_per_sec']:>12,.1f} {result['ops_per_sec_median']:>12,.1f} "
+            f"{result['relative_speed']:>9.4f} {result['peak_bytes']:>10,} {result['blocks']:>7,} {result['queries']:>8}"
+        )
+        problems += compare(name, result, baselines.get(name), args.threshold)
+
+    if not args.pattern:
+        problems += check_realtime()
+
+    if args.update_baseline:
+        # Absolute rates only describe the recording machine
+        baselines.update(
+            {name: {key: result[key] for key in BASELINE_KEYS} for name, result in results.items()}
+        )
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {os.path.relpath(BASELINE_PATH)}")
+        return 0
+
+    if problems:
+        print("\nRegressions:")
+        print("\n".join(f"  {problem}" for problem in problems))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - CSS asset build
+
+   Run by `bench build` (through the "build" script in package.json).
+   Copies the stylesheets in public/css to public/dist/css under content-hashed
+   names, writes .gz and .br siblings for static precompressed serving and a
+   manifest.json mapping each source name to its hashed URL. hooks.py and the
+   theme payload read the manifest, so the files can be cached as immutable.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const PUBLIC_PATH = path.join(__dirname, '..', 'ahmadcss', 'public');
+const SOURCE_PATH = path.join(PUBLIC_PATH, 'css');
+const OUTPUT_PATH = path.join(PUBLIC_PATH, 'dist', 'css');
+const MANIFEST_PATH = path.join(OUTPUT_PATH, 'manifest.json');
+const URL_PREFIX = '/assets/ahmadcss/dist/css/';
+
+const SOURCES = [
+    'components.css',
+    'glass-base.css',
+    'glass-silver-delta.css',
+    'glass-silver-lite.css',
+    'glass-ultimate-delta.css',
+    'glass-ultimate-lite.css',
+    'main-lite.css',
+    'main.css'
+];
+
+// Builds kept per stylesheet, so pages rendered before a deploy keep working
+const KEEP_BUILDS = 3;
+
+function hashContent(content) {
+    return crypto.createHash('sha256').update(content).digest('hex').slice(0, 12);
+}
+
+function writeAtomic(filePath, content) {
+    const tmpPath = `${filePath}.${process.pid}.tmp`;
+    fs.writeFileSync(tmpPath, content);
+    fs.renameSync(tmpPath, filePath);
+}
+
+function compress(filePath, content) {
+    writeAtomic(`${filePath}.gz`, zlib.gzipSync(content, { level: zlib.constants.Z_BEST_COMPRESSION }));
+    writeAtomic(`${filePath}.br`, zlib.brotliCompressSync(content, {
+        params: {
+            [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+            [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+            [zlib.constants.BROTLI_PARAM_SIZE_HINT]: content.length
+        }
+    }));
+}
+
+function buildFile(source) {
+    // Source maps sit next to the sources, not the hashed copies
+    const content = Buffer.from(
+        fs.readFileSync(path.join(SOURCE_PATH, source), 'utf8').replace(/\/\*# sourceMappingURL=.*?\*\/\s*$/, '')
+    );
+    const name = path.basename(source, '.css');
+    const filename = `${name}.${hashContent(content)}.css`;
+    const filePath = path.join(OUTPUT_PATH, filename);
+
+    if (!fs.existsSync(filePath)) {
+        writeAtomic(filePath, content);
+        compress(filePath, content);
+    }
+    return { filename, size: content.length };
+}
+
+function pruneOldBuilds(source, current) {
+    const name = path.basename(source, '.css');
+    const pattern = new RegExp(`^${name.replace(/[.-]/g, '\\$&')}\\.[0-9a-f]{12}\\.css$`);
+
+    const builds = fs.readdirSync(OUTPUT_PATH)
+        .filter(file => pattern.test(file) && file !== current)
+        .map(file => ({ file, mtime: fs.statSync(path.join(OUTPUT_PATH, file)).mtimeMs }))
+        .sort((a, b) => b.mtime - a.mtime);
+
+    builds.slice(KEEP_BUILDS - 1).forEach(({ file }) => {
+        ['', '.gz', '.br'].forEach(suffix => fs.rmSync(path.join(OUTPUT_PATH, file + suffix), { force: true }));
+    });
+}
+
+function build() {
+    fs.mkdirSync(OUTPUT_PATH, { recursive: true });
+
+    const manifest = {};
+    SOURCES.forEach(source => {
+        const { filename, size } = buildFile(source);
+        manifest[source] = URL_PREFIX + filename;
+        pruneOldBuilds(source, filename);
+        console.log(`  ${source.padEnd(24)} → ${filename} (${(size / 1024).toFixed(1)} KB)`);
+    });
+
+    writeAtomic(MANIFEST_PATH, JSON.stringify(manifest, null, 2) + '\n');
+}
+
+build();
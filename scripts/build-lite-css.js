@@ -0,0 +1,182 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Generate the lite stylesheets for weak devices
+
+   A lite sheet overrides the glass effects of one set of stylesheets: each
+   color theme (components + base + delta) and the compiled main.css. The
+   client links the one matching the theme when the performance tier is
+   "lite" or "off" and sets data-ahmadcss-perf on <html>. Every rule is scoped
+   to that attribute, so it wins over the theme sheets whatever order they
+   were linked in.
+
+   Overrides, per rule of the sources:
+     - backdrop-filter          -> none
+     - translucent backgrounds  -> opaque, on the blurred surfaces and in the
+       --glass-white* tokens (tints under LITE_MIN_ALPHA stay translucent:
+       overlays and search fields need them)
+     - box-shadow               -> its first outer layer only
+     - infinite animations      -> none
+   When any rule of an element changes a property, every rule setting that
+   property on that element is repeated, so :hover, :focus and dark mode still
+   override the base rule as they did. The "off" tier also drops every
+   animation and transition.
+
+   Usage: node scripts/build-lite-css.js [--check]
+     --check  only verify that the committed files are up to date
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+
+const { declarations, parseUnits, serialize, splitTopLevel } = require('./lib/css');
+
+const CSS_PATH = path.join(__dirname, '..', 'ahmadcss', 'public', 'css');
+const OUTPUTS = {
+    'glass-silver-lite.css': ['components.css', 'glass-base.css', 'glass-silver-delta.css'],
+    'glass-ultimate-lite.css': ['components.css', 'glass-base.css', 'glass-ultimate-delta.css'],
+    'main-lite.css': ['components.css', 'main.css']
+};
+
+const SCOPE = 'data-ahmadcss-perf';
+const LITE_MIN_ALPHA = 0.5;
+
+// Set by theme_css.py from the settings, not by the sources
+const BLUR_TOKENS = ['--glass-blur', '--header-blur', '--sidebar-blur', '--footer-blur'];
+
+// ─── Declarations ───────────────────────────────────────────────────────────
+
+// rgba()/hsla() with an alpha of at least LITE_MIN_ALPHA become opaque
+function opaque(value) {
+    return value.replace(/\b(rgb|hsl)a?\(([^()]*)\)/gi, (match, fn, args) => {
+        const parts = args.includes(',') ? args.split(',') : args.split(/\s*\/\s*|\s+/);
+        if (parts.length !== 4) return match;
+        const alpha = parts[3].trim();
+        const number = alpha.endsWith('%') ? parseFloat(alpha) / 100 : parseFloat(alpha);
+        if (!(number >= LITE_MIN_ALPHA) || number >= 1) return match;
+        return `${fn.toLowerCase()}(${parts.slice(0, 3).map(part => part.trim()).join(',')})`;
+    });
+}
+
+function firstOuterShadow(value) {
+    if (!value.includes(',')) return value;
+    const layers = splitTopLevel(value, ',');
+    return layers.find(layer => !/\binset\b/.test(layer)) || layers[0];
+}
+
+function isBlurred(decls) {
+    return decls.some(d => /^(-webkit-)?backdrop-filter$/.test(d.property) && d.value !== 'none');
+}
+
+// The lite value of a declaration, or null if its property is left alone
+function liteValue({ property, value }, glass) {
+    if (/^(-webkit-)?backdrop-filter$/.test(property)) return 'none';
+    if (glass && /^background(-color)?$/.test(property)) return opaque(value);
+    if (property.startsWith('--glass-white')) return opaque(value);
+    if (property === 'box-shadow' || (property.startsWith('--') && property.includes('shadow'))) {
+        return firstOuterShadow(value);
+    }
+    if (/^animation(-iteration-count)?$/.test(property)) {
+        if (!/\binfinite\b/.test(value)) return value;
+        return property === 'animation' ? 'none' : '1';
+    }
+    return null;
+}
+
+// ─── Selectors ──────────────────────────────────────────────────────────────
+
+// The last compound selector, e.g. ".frappe-card" of "body .frappe-card:hover"
+function subject(selector) {
+    const last = selector.split(/\s*[\s>+~]\s*/).pop();
+    return last.replace(/::?[a-z-]+(\([^)]*\))?/gi, '');
+}
+
+// Scope a selector to <html data-ahmadcss-perf>
+function scope(selector) {
+    const attribute = `[${SCOPE}]`;
+    const root = selector.match(/^(html|:root)(?![\w-])/);
+    if (root) return root[1] + attribute + selector.slice(root[1].length);
+    // Attribute and state selectors at the start may sit on <html> itself
+    if (/^[[:]/.test(selector)) return `html${attribute}${selector},html${attribute} ${selector}`;
+    return `html${attribute} ${selector}`;
+}
+
+// ─── Output ─────────────────────────────────────────────────────────────────
+
+// Custom properties cascade on whatever element sets them; the rest per subject
+function cascadeKey(selector, property) {
+    return property.startsWith('--') ? property : `${subject(selector)}\u0000${property}`;
+}
+
+function liteUnits(units) {
+    const rules = units
+        .filter(unit => !unit.context.startsWith('@media print'))
+        .map(unit => ({ context: unit.context, decls: declarations(unit) }))
+        .filter(rule => rule.decls.length);
+
+    const glassSubjects = new Set();
+    rules.forEach(rule => {
+        if (isBlurred(rule.decls)) rule.decls.forEach(d => glassSubjects.add(subject(d.selector)));
+    });
+
+    const changed = new Set();
+    rules.forEach(rule => rule.decls.forEach(d => {
+        d.lite = liteValue(d, glassSubjects.has(subject(d.selector)));
+        if (d.lite !== null && d.lite !== d.value) changed.add(cascadeKey(d.selector, d.property));
+    }));
+
+    const result = [];
+    rules.forEach(rule => {
+        // Selectors of the rule that share the same overrides stay together
+        const bodies = new Map();
+        rule.decls.forEach(d => {
+            if (!changed.has(cascadeKey(d.selector, d.property))) return;
+            if (!bodies.has(d.selector)) bodies.set(d.selector, []);
+            bodies.get(d.selector).push(`${d.property}:${d.lite}!important`);
+        });
+
+        const groups = new Map();
+        bodies.forEach((body, selector) => {
+            const css = [...new Set(body)].join(';');
+            if (!groups.has(css)) groups.set(css, []);
+            groups.get(css).push(scope(selector));
+        });
+        groups.forEach((selectors, body) => {
+            result.push({ context: rule.context, css: `${selectors.join(',')}{${body}}` });
+        });
+    });
+    return result;
+}
+
+function render(sources) {
+    const units = sources.flatMap(file => parseUnits(fs.readFileSync(path.join(CSS_PATH, file), 'utf8')));
+    const tokens = BLUR_TOKENS.map(token => `${token}:0px!important`).join(';');
+    const off = ['*', '*::before', '*::after'].map(part => `html[${SCOPE}="off"] ${part}`).join(',');
+
+    return `/* Glass effects off over ${sources.join(' + ')}, for the "lite" and "off" performance tiers\n` +
+        '   Generated by scripts/build-lite-css.js - do not edit */\n' +
+        `:root[${SCOPE}]{${tokens}}\n` +
+        serialize(liteUnits(units)) +
+        `${off}{animation:none!important;transition:none!important}\n`;
+}
+
+function main() {
+    const check = process.argv.includes('--check');
+    let stale = false;
+    Object.entries(OUTPUTS).forEach(([file, sources]) => {
+        const css = render(sources);
+        const filePath = path.join(CSS_PATH, file);
+        const current = fs.existsSync(filePath) ? fs.readFileSync(filePath, 'utf8') : null;
+        if (current === css) return;
+        if (check) {
+            console.error(`${file} is out of date; run node scripts/build-lite-css.js`);
+            stale = true;
+        } else {
+            fs.writeFileSync(filePath, css);
+        }
+        console.log(`  ${file.padEnd(26)} ${(Buffer.byteLength(css) / 1024).toFixed(1)} KB`);
+    });
+    if (stale) process.exit(1);
+}
+
+main();
@@ -0,0 +1,161 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Size budgets for the JavaScript bundles
+
+   ahmadcss.bundle.js is loaded on every desk page, before the first paint;
+   everything else (sidebar, admin controls, toast, skeleton, effects,
+   customizer, performance probe, theme updates, charts, offline cache, custom
+   code, logo) is a chunk it loads with frappe.require when a page needs it.
+   Each bundle in public/js is built the way bench builds it for production
+   (esbuild, bundled and minified) and checked against
+   scripts/bundle-budgets.json, so a feature added to the core instead of a
+   chunk fails the build. npm packages the bundles import (ECharts) are left
+   out: the budgets cover this app's own code.
+
+   Needs esbuild: this app's node_modules, or the one Frappe builds with.
+
+   Usage: node scripts/check-bundle-size.js [--json] [--update]
+     --json    print the measurements as JSON instead of a table
+     --update  record the current measurements as the new budgets
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const APP_PATH = path.join(__dirname, '..');
+const JS_PATH = path.join(APP_PATH, 'ahmadcss', 'public', 'js');
+const BUDGETS_PATH = path.join(__dirname, 'bundle-budgets.json');
+// bench's apps/frappe, next to this app
+const FRAPPE_PATH = path.join(APP_PATH, '..', 'frappe');
+
+// Written per site by the server (sites/assets/ahmadcss is this folder under bench)
+const GENERATED_FILE = /^custom-[0-9a-f]+\.js$/;
+
+// Slack --update leaves, so small fixes fit; a moved-in feature does not
+const HEADROOM = 0.03;
+
+function sizes(content) {
+    return { bytes: Buffer.byteLength(content), gzip_bytes: zlib.gzipSync(content, { level: 9 }).length };
+}
+
+function loadEsbuild() {
+    for (const root of [APP_PATH, FRAPPE_PATH]) {
+        try {
+            return require(require.resolve('esbuild', { paths: [root] }));
+        } catch (e) {
+            // Not installed there
+        }
+    }
+    return null;
+}
+
+// The npm packages of package.json, kept as imports
+function externalPackages() {
+    const pkg = JSON.parse(fs.readFileSync(path.join(APP_PATH, 'package.json'), 'utf8'));
+    return Object.keys(pkg.dependencies || {}).flatMap(name => [name, `${name}/*`]);
+}
+
+// What `bench build --production` serves for this bundle
+function build(esbuild, file) {
+    const result = esbuild.buildSync({
+        entryPoints: [path.join(JS_PATH, file)],
+        bundle: true,
+        minify: true,
+        format: 'iife',
+        external: externalPackages(),
+        write: false,
+        logLevel: 'silent'
+    });
+    return Buffer.from(result.outputFiles[0].contents);
+}
+
+function bundleFiles() {
+    return fs.readdirSync(JS_PATH)
+        .filter(file => file.endsWith('.bundle.js') && !GENERATED_FILE.test(file))
+        .sort();
+}
+
+function measureAll(esbuild) {
+    const report = {};
+    bundleFiles().forEach(file => {
+        report[file] = sizes(build(esbuild, file));
+    });
+    return report;
+}
+
+function toBudgets(report) {
+    const budgets = {};
+    Object.entries(report).forEach(([file, metrics]) => {
+        budgets[file] = {};
+        Object.entries(metrics).forEach(([metric, value]) => {
+            budgets[file][metric] = Math.ceil(value * (1 + HEADROOM));
+        });
+    });
+    return budgets;
+}
+
+// [{file, metric, value, budget}] over budget, and bundles without a budget
+function check(report, budgets) {
+    const failures = [];
+    const unbudgeted = [];
+    Object.entries(report).forEach(([file, metrics]) => {
+        const budget = budgets[file];
+        if (!budget) {
+            unbudgeted.push(file);
+            return;
+        }
+        Object.entries(metrics).forEach(([metric, value]) => {
+            if (budget[metric] !== undefined && value > budget[metric]) {
+                failures.push({ file, metric, value, budget: budget[metric] });
+            }
+        });
+    });
+    return { failures, unbudgeted };
+}
+
+function printTable(report, budgets) {
+    const width = Math.max(...Object.keys(report).map(file => file.length));
+    console.log(['bundle'.padEnd(width), 'bytes', 'budget', 'gzip', 'budget'].map((c, i) => i ? c.padStart(8) : c).join(' '));
+    Object.entries(report).forEach(([file, metrics]) => {
+        const budget = budgets[file] || {};
+        const cells = [metrics.bytes, budget.bytes, metrics.gzip_bytes, budget.gzip_bytes]
+            .map(value => (value === undefined ? '-' : String(value)).padStart(8));
+        console.log([file.padEnd(width), ...cells].join(' '));
+    });
+}
+
+function main() {
+    const args = process.argv.slice(2);
+    const esbuild = loadEsbuild();
+    if (!esbuild) {
+        // Source sizes say little about what is served; don't pass on them
+        console.error('esbuild not found: run this on a bench (apps/frappe/node_modules), or `yarn add --dev esbuild`');
+        process.exit(1);
+    }
+    const report = measureAll(esbuild);
+
+    if (args.includes('--update')) {
+        fs.writeFileSync(BUDGETS_PATH, JSON.stringify(toBudgets(report), null, 2) + '\n');
+        console.log(`Recorded budgets for ${Object.keys(report).length} bundles`);
+        return;
+    }
+
+    const budgets = fs.existsSync(BUDGETS_PATH) ? JSON.parse(fs.readFileSync(BUDGETS_PATH, 'utf8')) : {};
+    if (args.includes('--json')) console.log(JSON.stringify(report, null, 2));
+    else printTable(report, budgets);
+
+    const { failures, unbudgeted } = check(report, budgets);
+    if (unbudgeted.length) {
+        // A new bundle is a deliberate choice; record it with --update
+        unbudgeted.forEach(file => console.error(`No budget for ${file} (record one with --update)`));
+    }
+    if (failures.length) {
+        console.error('Over budget:');
+        failures.forEach(f => console.error(`  ${f.file}: ${f.metric} ${f.value}, budget ${f.budget}`));
+    }
+    if (failures.length || unbudgeted.length) process.exit(1);
+}
+
+main();
@@ -0,0 +1,398 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Render-cost budgets for the stylesheets
+
+   Measures every shipped sheet in public/css and every SCSS partial in
+   public/scss: size, selector complexity (compound selectors per selector,
+   descendant and universal selectors), !important, backdrop-filter,
+   box-shadow and animation use, and declarations repeated verbatim. Each
+   metric is checked against scripts/css-budgets.json, so a change that makes
+   the theme more expensive to render fails before it is released.
+
+   Usage: node scripts/css-budget.js [--json] [--update]
+     --json    print the measurements as JSON instead of a table
+     --update  record the current measurements as the new budgets
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const { declarations, parseUnits, splitTopLevel } = require('./lib/css');
+
+const PUBLIC_PATH = path.join(__dirname, '..', 'ahmadcss', 'public');
+const CSS_PATH = path.join(PUBLIC_PATH, 'css');
+const SCSS_PATH = path.join(PUBLIC_PATH, 'scss');
+const BUDGETS_PATH = path.join(__dirname, 'css-budgets.json');
+
+// Written per site by the server (sites/assets/ahmadcss is this folder under bench)
+const GENERATED_FILE = /^(theme|main|custom)-[0-9a-f]+\.css$/;
+
+// Selectors with more compound selectors than this count as deep
+const DEEP_SELECTOR = 3;
+
+// Slack --update leaves on volume metrics, so ordinary additions fit; the
+// expensive features (depth, universal selectors, blur, shadows, ...) are recorded exactly
+const HEADROOM = 0.05;
+const VOLUME_METRICS = ['bytes', 'gzip_bytes', 'rules', 'selectors', 'descendant_selectors', 'important'];
+
+const METRICS = [
+    'bytes',
+    'gzip_bytes',
+    'rules',
+    'selectors',
+    'max_selector_depth',
+    'deep_selectors',
+    'descendant_selectors',
+    'universal_selectors',
+    'important',
+    'backdrop_filter',
+    'box_shadow',
+    'animations',
+    'duplicate_declarations'
+];
+
+// ─── Selectors ──────────────────────────────────────────────────────────────
+
+// Compound selectors of a complex selector, with the combinator before each
+function compounds(selector) {
+    const parts = [];
+    let depth = 0;
+    let current = '';
+    let combinator = null;
+
+    const push = () => {
+        if (!current) return;
+        parts.push({ combinator: parts.length ? (combinator || ' ') : null, text: current });
+        current = '';
+        combinator = null;
+    };
+
+    for (const char of selector.trim()) {
+        if (char === '(' || char === '[') depth++;
+        else if (char === ')' || char === ']') depth--;
+        if (depth === 0 && /[\s>+~]/.test(char)) {
+            push();
+            if (!/\s/.test(char)) combinator = char;
+            continue;
+        }
+        current += char;
+    }
+    push();
+    return parts;
+}
+
+function measureSelector(selector) {
+    const parts = compounds(selector);
+    return {
+        depth: parts.length,
+        descendant: parts.some(part => part.combinator === ' '),
+        universal: parts.some(part => part.text.startsWith('*'))
+    };
+}
+
+// ─── Metrics ────────────────────────────────────────────────────────────────
+
+function isNone(value) {
+    return /^(none|0|unset|initial)$/i.test(value.trim());
+}
+
+// Metrics of a list of {context, selector, property, value, important}
+function measureDeclarations(items, rules) {
+    const metrics = {
+        rules,
+        selectors: 0,
+        max_selector_depth: 0,
+        deep_selectors: 0,
+        descendant_selectors: 0,
+        universal_selectors: 0,
+        important: 0,
+        backdrop_filter: 0,
+        box_shadow: 0,
+        animations: 0,
+        duplicate_declarations: 0
+    };
+
+    const selectors = new Set();
+    const seen = new Set();
+    items.forEach(item => {
+        if (item.selector && !selectors.has(item.selector)) {
+            selectors.add(item.selector);
+            const selector = measureSelector(item.selector);
+            metrics.max_selector_depth = Math.max(metrics.max_selector_depth, selector.depth);
+            if (selector.depth > DEEP_SELECTOR) metrics.deep_selectors++;
+            if (selector.descendant) metrics.descendant_selectors++;
+            if (selector.universal) metrics.universal_selectors++;
+        }
+
+        if (item.important) metrics.important++;
+        if (/^(-webkit-)?backdrop-filter$/.test(item.property) && !isNone(item.value)) metrics.backdrop_filter++;
+        if (item.property === 'box-shadow' && !isNone(item.value)) metrics.box_shadow++;
+        if (/^(animation|animation-name)$/.test(item.property) && !isNone(item.value)) metrics.animations++;
+
+        // The same declaration again for the same selector: pure weight
+        const key = [item.context, item.selector, item.property, item.value, item.important].join('\u0000');
+        if (seen.has(key)) metrics.duplicate_declarations++;
+        seen.add(key);
+    });
+    metrics.selectors = selectors.size;
+    return metrics;
+}
+
+function measureCss(css) {
+    const units = parseUnits(css);
+    const items = [];
+    let rules = 0;
+    units.forEach(unit => {
+        const unitDeclarations = declarations(unit);
+        if (unitDeclarations.length) rules++;
+        unitDeclarations.forEach(item => items.push({ context: unit.context, ...item }));
+    });
+    return measureDeclarations(items, rules);
+}
+
+// ─── SCSS ───────────────────────────────────────────────────────────────────
+
+// Drop comments and replace #{...} interpolations with a placeholder, leaving strings alone
+function stripScss(source) {
+    let result = '';
+    let quote = null;
+    let parens = 0;
+    for (let i = 0; i < source.length; i++) {
+        const char = source[i];
+        if (quote) {
+            result += char;
+            if (char === '\\') result += source[++i] || '';
+            else if (char === quote) quote = null;
+        } else if (char === '"' || char === "'") {
+            quote = char;
+            result += char;
+        } else if (char === '/' && source[i + 1] === '*') {
+            const end = source.indexOf('*/', i + 2);
+            i = end === -1 ? source.length : end + 1;
+        } else if (char === '/' && source[i + 1] === '/' && parens === 0) {
+            const end = source.indexOf('\n', i);
+            i = end === -1 ? source.length : end - 1;
+        } else if (char === '#' && source[i + 1] === '{') {
+            let depth = 0;
+            for (i++; i < source.length; i++) {
+                if (source[i] === '{') depth++;
+                else if (source[i] === '}' && --depth === 0) break;
+            }
+            result += 'x';
+        } else {
+            if (char === '(') parens++;
+            if (char === ')') parens = Math.max(0, parens - 1);
+            result += char;
+        }
+    }
+    return result;
+}
+
+// Tree of {prelude, children} blocks and declaration strings
+function parseScss(source) {
+    const root = { prelude: '', children: [] };
+    const stack = [root];
+    let start = 0;
+    let quote = null;
+    let parens = 0;
+
+    for (let i = 0; i < source.length; i++) {
+        const char = source[i];
+        if (quote) {
+            if (char === '\\') i++;
+            else if (char === quote) quote = null;
+        } else if (char === '"' || char === "'") {
+            quote = char;
+        } else if (char === '(') {
+            parens++;
+        } else if (char === ')') {
+            parens = Math.max(0, parens - 1);
+        } else if (parens) {
+            continue;
+        } else if (char === '{') {
+            const block = { prelude: source.slice(start, i).trim().replace(/\s+/g, ' '), children: [] };
+            stack[stack.length - 1].children.push(block);
+            stack.push(block);
+            start = i + 1;
+        } else if (char === ';' || char === '}') {
+            const statement = source.slice(start, i).trim();
+            if (statement) stack[stack.length - 1].children.push(statement);
+            if (char === '}' && stack.length > 1) stack.pop();
+            start = i + 1;
+        }
+    }
+    return root;
+}
+
+function resolveSelectors(parents, prelude) {
+    const resolved = [];
+    splitTopLevel(prelude, ',').forEach(child => {
+        parents.forEach(parent => {
+            if (child.includes('&')) resolved.push(child.replace(/&/g, parent).trim());
+            else resolved.push(parent ? `${parent} ${child}` : child);
+        });
+    });
+    return resolved;
+}
+
+// Flatten an SCSS tree into declarations with their resolved selectors
+function flattenScss(block, parents, context, items, stats, depth) {
+    stats.maxNesting = Math.max(stats.maxNesting, depth);
+    block.children.forEach(child => {
+        if (typeof child === 'string') {
+            const colon = child.indexOf(':');
+            if (colon === -1 || /^[@$%]/.test(child)) return;
+            const property = child.slice(0, colon).trim().toLowerCase();
+            let value = child.slice(colon + 1).trim();
+            const important = /!\s*important$/i.test(value);
+            value = value.replace(/!\s*important$/i, '').trim();
+            (parents.length ? parents : [null]).forEach(selector => {
+                items.push({ context, selector, property, value, important });
+            });
+            return;
+        }
+
+        const prelude = child.prelude;
+        if (/^@(-webkit-)?keyframes\b|^@(font-face|function)\b/.test(prelude)) {
+            // Frames and descriptors, not rules
+            return;
+        } else if (/^@mixin\b/.test(prelude)) {
+            flattenScss(child, [''], prelude, items, stats, depth + 1);
+        } else if (prelude.startsWith('@')) {
+            // @media, @supports, @include with content, @if/@each: same selectors inside
+            const nested = /^@(media|supports)\b/.test(prelude) ? `${context} ${prelude}`.trim() : context;
+            flattenScss(child, parents, nested, items, stats, depth + 1);
+        } else {
+            stats.rules++;
+            const selectors = resolveSelectors(parents.length ? parents : [''], prelude);
+            flattenScss(child, selectors, context, items, stats, depth + 1);
+        }
+    });
+}
+
+function measureScss(source) {
+    const items = [];
+    const stats = { rules: 0, maxNesting: 0 };
+    flattenScss(parseScss(stripScss(source)), [], '', items, stats, 0);
+    return { ...measureDeclarations(items, stats.rules), max_nesting: stats.maxNesting };
+}
+
+// ─── Files ──────────────────────────────────────────────────────────────────
+
+function sizes(content) {
+    return { bytes: Buffer.byteLength(content), gzip_bytes: zlib.gzipSync(content, { level: 9 }).length };
+}
+
+function cssFiles() {
+    return fs.readdirSync(CSS_PATH)
+        .filter(file => file.endsWith('.css') && !GENERATED_FILE.test(file))
+        .sort();
+}
+
+function scssFiles(dir = SCSS_PATH) {
+    const files = [];
+    fs.readdirSync(dir, { withFileTypes: true }).forEach(entry => {
+        const file = path.join(dir, entry.name);
+        if (entry.isDirectory()) files.push(...scssFiles(file));
+        else if (entry.name.endsWith('.scss')) files.push(path.relative(SCSS_PATH, file));
+    });
+    return files.sort();
+}
+
+function measureAll() {
+    const report = { css: {}, scss: {} };
+    cssFiles().forEach(file => {
+        const css = fs.readFileSync(path.join(CSS_PATH, file), 'utf8');
+        report.css[file] = { ...sizes(css), ...measureCss(css) };
+    });
+    scssFiles().forEach(file => {
+        const scss = fs.readFileSync(path.join(SCSS_PATH, file), 'utf8');
+        report.scss[file] = { ...sizes(scss), ...measureScss(scss) };
+    });
+    return report;
+}
+
+// ─── Budgets ────────────────────────────────────────────────────────────────
+
+function toBudgets(report) {
+    const budgets = {};
+    Object.entries(report).forEach(([kind, files]) => {
+        budgets[kind] = {};
+        Object.entries(files).forEach(([file, metrics]) => {
+            budgets[kind][file] = {};
+            Object.entries(metrics).forEach(([metric, value]) => {
+                budgets[kind][file][metric] = VOLUME_METRICS.includes(metric)
+                    ? Math.ceil(value * (1 + HEADROOM))
+                    : value;
+            });
+        });
+    });
+    return budgets;
+}
+
+// [{kind, file, metric, value, budget}] over budget, and files without a budget
+function check(report, budgets) {
+    const failures = [];
+    const unbudgeted = [];
+    Object.entries(report).forEach(([kind, files]) => {
+        Object.entries(files).forEach(([file, metrics]) => {
+            const budget = (budgets[kind] || {})[file];
+            if (!budget) {
+                unbudgeted.push(`${kind}/${file}`);
+                return;
+            }
+            Object.entries(metrics).forEach(([metric, value]) => {
+                if (budget[metric] !== undefined && value > budget[metric]) {
+                    failures.push({ kind, file, metric, value, budget: budget[metric] });
+                }
+            });
+        });
+    });
+    return { failures, unbudgeted };
+}
+
+function printTable(report) {
+    const columns = [...METRICS, 'max_nesting'];
+    const short = {
+        bytes: 'bytes', gzip_bytes: 'gzip', rules: 'rules', selectors: 'sel',
+        max_selector_depth: 'depth', deep_selectors: 'deep', descendant_selectors: 'desc',
+        universal_selectors: 'univ', important: '!imp', backdrop_filter: 'blur',
+        box_shadow: 'shadow', animations: 'anim', duplicate_declarations: 'dupes', max_nesting: 'nest'
+    };
+    Object.entries(report).forEach(([kind, files]) => {
+        const width = Math.max(...Object.keys(files).map(file => file.length), kind.length);
+        console.log(['', kind.padEnd(width), ...columns.map(c => short[c].padStart(7))].join(' ').trimStart());
+        Object.entries(files).forEach(([file, metrics]) => {
+            const cells = columns.map(c => (metrics[c] === undefined ? '-' : String(metrics[c])).padStart(7));
+            console.log([file.padEnd(width), ...cells].join(' '));
+        });
+        console.log('');
+    });
+}
+
+function main() {
+    const args = process.argv.slice(2);
+    const report = measureAll();
+
+    if (args.includes('--update')) {
+        fs.writeFileSync(BUDGETS_PATH, JSON.stringify(toBudgets(report), null, 2) + '\n');
+        console.log(`Recorded budgets for ${Object.keys(report.css).length} sheets and ${Object.keys(report.scss).length} partials`);
+        return;
+    }
+
+    if (args.includes('--json')) console.log(JSON.stringify(report, null, 2));
+    else printTable(report);
+
+    const budgets = fs.existsSync(BUDGETS_PATH) ? JSON.parse(fs.readFileSync(BUDGETS_PATH, 'utf8')) : {};
+    const { failures, unbudgeted } = check(report, budgets);
+    unbudgeted.forEach(file => console.warn(`No budget for ${file} (record one with --update)`));
+    if (failures.length) {
+        console.error('Over budget:');
+        failures.forEach(f => console.error(`  ${f.kind}/${f.file}: ${f.metric} ${f.value}, budget ${f.budget}`));
+        process.exit(1);
+    }
+}
+
+main();
@@ -0,0 +1,128 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Minimal CSS parsing shared by the build scripts
+
+   Enough for the minified sheets in public/css: top-level statements, rules
+   inside @media/@supports flattened into units with a context, and the
+   declarations of a style rule.
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+// At-rules whose rules are split individually; the rest stay whole
+const GROUPING_AT_RULES = /^@(media|supports)\b/;
+
+// Split CSS into top-level statements ("a{...}", "@media ...{...}", "@import ...;")
+function splitStatements(css) {
+    const statements = [];
+    let depth = 0;
+    let start = 0;
+    let quote = null;
+
+    for (let i = 0; i < css.length; i++) {
+        const char = css[i];
+        if (quote) {
+            if (char === '\\') i++;
+            else if (char === quote) quote = null;
+        } else if (char === '"' || char === "'") {
+            quote = char;
+        } else if (char === '/' && css[i + 1] === '*') {
+            i = css.indexOf('*/', i + 2) + 1 || css.length;
+        } else if (char === '{') {
+            depth++;
+        } else if (char === '}') {
+            depth--;
+            if (depth === 0) {
+                statements.push(css.slice(start, i + 1).trim());
+                start = i + 1;
+            }
+        } else if (char === ';' && depth === 0) {
+            statements.push(css.slice(start, i + 1).trim());
+            start = i + 1;
+        }
+    }
+    return statements.filter(Boolean).map(stripComments).filter(Boolean);
+}
+
+function stripComments(css) {
+    return css.replace(/\/\*[\s\S]*?\*\//g, '').trim();
+}
+
+// Flatten @media/@supports so each rule inside is its own unit with a context
+function parseUnits(css) {
+    const units = [];
+    splitStatements(css).forEach(statement => {
+        const open = statement.indexOf('{');
+        const prelude = open === -1 ? statement : statement.slice(0, open).trim();
+        if (open !== -1 && GROUPING_AT_RULES.test(prelude)) {
+            splitStatements(statement.slice(open + 1, -1)).forEach(rule => {
+                units.push({ context: prelude, css: rule });
+            });
+        } else {
+            units.push({ context: '', css: statement });
+        }
+    });
+    units.forEach(unit => { unit.key = `${unit.context}\u0000${unit.css}`; });
+    return units;
+}
+
+// [{selector, property, value, important}] for a plain style rule
+function declarations(unit) {
+    const open = unit.css.indexOf('{');
+    if (open === -1 || unit.css.startsWith('@')) return [];
+
+    const selectors = splitTopLevel(unit.css.slice(0, open), ',').map(s => s.trim().replace(/\s+/g, ' '));
+    const result = [];
+    splitTopLevel(unit.css.slice(open + 1, -1), ';').forEach(declaration => {
+        const colon = declaration.indexOf(':');
+        if (colon === -1) return;
+        const property = declaration.slice(0, colon).trim().toLowerCase();
+        let value = declaration.slice(colon + 1).trim();
+        const important = /!\s*important$/i.test(value);
+        value = value.replace(/!\s*important$/i, '').trim();
+        selectors.forEach(selector => result.push({ selector, property, value, important }));
+    });
+    return result;
+}
+
+function splitTopLevel(text, separator) {
+    const parts = [];
+    let depth = 0;
+    let quote = null;
+    let start = 0;
+    for (let i = 0; i < text.length; i++) {
+        const char = text[i];
+        if (quote) {
+            if (char === '\\') i++;
+            else if (char === quote) quote = null;
+        } else if (char === '"' || char === "'") {
+            quote = char;
+        } else if (char === '(' || char === '[') {
+            depth++;
+        } else if (char === ')' || char === ']') {
+            depth--;
+        } else if (char === separator && depth === 0) {
+            parts.push(text.slice(start, i));
+            start = i + 1;
+        }
+    }
+    parts.push(text.slice(start));
+    return parts.map(part => part.trim()).filter(Boolean);
+}
+
+// Serialise units, re-wrapping consecutive units of the same @media/@supports
+function serialize(units) {
+    let css = '';
+    let context = '';
+    units.forEach(unit => {
+        if (unit.context !== context) {
+            if (context) css += '}';
+            if (unit.context) css += `${unit.context}{`;
+            context = unit.context;
+        }
+        css += unit.css;
+    });
+    if (context) css += '}';
+    return css + '\n';
+}
+
+module.exports = { declarations, parseUnits, serialize, splitStatements, splitTopLevel };
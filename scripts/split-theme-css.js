@@ -0,0 +1,204 @@
+/* ═══════════════════════════════════════════════════════════════════════════
+   AhmadCSS - Split the theme stylesheets into a shared base and small deltas
+
+   glass-silver.css and glass-ultimate.css are almost identical. This writes
+   glass-base.css with the rules they share (in order) and one
+   glass-<theme>-delta.css per theme with the rest. The loader links the base
+   once and swaps only the delta on a theme switch.
+
+   Before writing, it checks that base + delta cascades like the original:
+     - every (media, selector, property) resolves to the same value, and
+     - no rule moved into a delta is overtaken by a later base rule that has
+       the same specificity, may match the same elements and sets the same
+       property (in the original it would have come after that rule).
+
+   Usage: node scripts/split-theme-css.js [--check]
+     --check  only verify that the committed files are up to date
+   ═══════════════════════════════════════════════════════════════════════════ */
+
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+
+const { declarations, parseUnits, serialize } = require('./lib/css');
+
+const CSS_PATH = path.join(__dirname, '..', 'ahmadcss', 'public', 'css');
+const BASE_FILE = 'glass-base.css';
+const THEMES = {
+    'glass-silver.css': 'glass-silver-delta.css',
+    'glass-ultimate.css': 'glass-ultimate-delta.css'
+};
+
+// ─── Diffing ────────────────────────────────────────────────────────────────
+
+// Longest common subsequence of two unit lists, by key
+function commonUnits(a, b) {
+    const table = Array.from({ length: a.length + 1 }, () => new Uint16Array(b.length + 1));
+    for (let i = a.length - 1; i >= 0; i--) {
+        for (let j = b.length - 1; j >= 0; j--) {
+            table[i][j] = a[i].key === b[j].key
+                ? table[i + 1][j + 1] + 1
+                : Math.max(table[i + 1][j], table[i][j + 1]);
+        }
+    }
+
+    const common = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i].key === b[j].key) {
+            common.push(a[i]);
+            i++;
+            j++;
+        } else if (table[i + 1][j] >= table[i][j + 1]) {
+            i++;
+        } else {
+            j++;
+        }
+    }
+    return common;
+}
+
+// Units of `units` that are not part of `base` (matched in order)
+function deltaUnits(units, base) {
+    const delta = [];
+    let b = 0;
+    units.forEach(unit => {
+        if (b < base.length && base[b].key === unit.key) b++;
+        else delta.push(unit);
+    });
+    return delta;
+}
+
+// ─── Cascade verification ───────────────────────────────────────────────────
+
+// Winning value per (context, selector, property), with the usual !important rule
+function cascade(units) {
+    const result = new Map();
+    units.forEach(unit => {
+        declarations(unit).forEach(({ selector, property, value, important }) => {
+            const key = `${unit.context}\u0000${selector}\u0000${property}`;
+            const current = result.get(key);
+            if (!current || important || !current.important) {
+                result.set(key, { value, important });
+            }
+        });
+    });
+    return result;
+}
+
+function specificity(selector) {
+    const cleaned = selector
+        .replace(/\\./g, '')
+        .replace(/:(not|is|has)\(/g, '(')
+        .replace(/:where\([^)]*\)/g, '')
+        .replace(/"[^"]*"|'[^']*'/g, '');
+    const ids = (cleaned.match(/#[\w-]+/g) || []).length;
+    const classes = (cleaned.match(/\.[\w-]+|\[[^\]]*\]|:(?!:)[\w-]+/g) || []).length;
+    const types = (cleaned.match(/(^|[\s>+~(])[a-zA-Z][\w-]*|::[\w-]+/g) || []).length;
+    return `${ids},${classes},${types}`;
+}
+
+// Class, id and type tokens of the subject (last compound) of a selector
+function subjectTokens(selector) {
+    const compounds = selector.split(/\s*[\s>+~]\s*/).filter(Boolean);
+    const subject = compounds[compounds.length - 1] || '';
+    return new Set(subject.match(/[.#]?[\w-]+/g) || []);
+}
+
+function mayMatchSameElement(a, b) {
+    const tokensA = subjectTokens(a);
+    const tokensB = subjectTokens(b);
+    if (!tokensA.size || !tokensB.size || tokensA.has('*') || tokensB.has('*')) return true;
+    return [...tokensA].some(token => tokensB.has(token));
+}
+
+// Problems caused by moving `delta` after the base rules that followed it in `original`
+function reorderConflicts(original, base, delta) {
+    const deltaKeys = new Set(delta.map(unit => unit.key));
+    const conflicts = [];
+
+    original.forEach((unit, index) => {
+        if (!deltaKeys.has(unit.key)) return;
+        const later = original.slice(index + 1).filter(other => !deltaKeys.has(other.key));
+
+        declarations(unit).forEach(moved => {
+            later.forEach(other => {
+                if (other.context !== unit.context) return;
+                declarations(other).forEach(overtaken => {
+                    if (overtaken.property === moved.property &&
+                        overtaken.important === moved.important &&
+                        specificity(overtaken.selector) === specificity(moved.selector) &&
+                        mayMatchSameElement(overtaken.selector, moved.selector)) {
+                        conflicts.push(`${moved.selector} { ${moved.property} } now overrides ` +
+                                       `${overtaken.selector} { ${overtaken.property} }`);
+                    }
+                });
+            });
+        });
+    });
+    return conflicts;
+}
+
+function verify(name, original, split) {
+    const problems = [];
+    const before = cascade(original);
+    const after = cascade(split);
+
+    new Set([...before.keys(), ...after.keys()]).forEach(key => {
+        const a = before.get(key);
+        const b = after.get(key);
+        if (!a || !b || a.value !== b.value || a.important !== b.important) {
+            problems.push(`${key.replace(/\u0000/g, ' | ')}: ${a && a.value} → ${b && b.value}`);
+        }
+    });
+    return problems.map(problem => `${name}: ${problem}`);
+}
+
+// ─── Output ─────────────────────────────────────────────────────────────────
+
+function header(description) {
+    return `/* ${description}\n   Generated by scripts/split-theme-css.js - do not edit */\n`;
+}
+
+function main() {
+    const check = process.argv.includes('--check');
+    const sources = Object.keys(THEMES).map(file => ({
+        file,
+        units: parseUnits(fs.readFileSync(path.join(CSS_PATH, file), 'utf8'))
+    }));
+
+    const base = sources.slice(1).reduce((common, source) => commonUnits(common, source.units), sources[0].units);
+    const outputs = { [BASE_FILE]: header('Rules shared by every AhmadCSS color theme') + serialize(base) };
+
+    const problems = [];
+    sources.forEach(({ file, units }) => {
+        const delta = deltaUnits(units, base);
+        problems.push(...verify(file, units, [...base, ...delta]));
+        problems.push(...reorderConflicts(units, base, delta).map(conflict => `${file}: ${conflict}`));
+        outputs[THEMES[file]] = header(`Rules of ${file} not in ${BASE_FILE}; load after it`) + serialize(delta);
+    });
+
+    if (problems.length) {
+        console.error('Splitting would change the cascade:\n  ' + problems.join('\n  '));
+        process.exit(1);
+    }
+
+    let stale = false;
+    Object.entries(outputs).forEach(([file, css]) => {
+        const filePath = path.join(CSS_PATH, file);
+        const current = fs.existsSync(filePath) ? fs.readFileSync(filePath, 'utf8') : null;
+        if (current === css) return;
+        if (check) {
+            console.error(`${file} is out of date; run node scripts/split-theme-css.js`);
+            stale = true;
+        } else {
+            fs.writeFileSync(filePath, css);
+        }
+        console.log(`  ${file.padEnd(26)} ${(Buffer.byteLength(css) / 1024).toFixed(1)} KB`);
+    });
+    if (stale) process.exit(1);
+}
+
+main();
@@ -0,0 +1,147 @@
+# Copyright (c) 2026, ahmaddev and contributors
+# For license information, please see license.txt
+
+"""Vendor web fonts as WOFF2 subsets under ahmadcss/public/fonts.
+
+    python scripts/vendor_fonts.py --source ~/Downloads/fonts Cairo Inter
+
+``--source`` holds the family's TTF files as distributed by Google Fonts:
+static ones (``Cairo-SemiBold.ttf``) or a variable one (``Cairo[slnt,wght].ttf``).
+For every weight in ``FONT_WEIGHTS`` and every subset in ``UNICODE_RANGES``
+that the font covers, it writes ``<family>/<family>-<weight>-<subset>.woff2``
+and records it in ``fonts.json``, which ``ahmadcss/fonts.py`` reads.
+
+Needs fontTools with brotli: ``pip install fonttools brotli``.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:
+    sys.exit("fontTools is required: pip install fonttools brotli")
+
+FONTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ahmadcss", "public", "fonts")
+MANIFEST_PATH = os.path.join(FONTS_PATH, "fonts.json")
+
+# Keep in sync with ahmadcss/fonts.py, which cannot be imported without Frappe
+FONT_WEIGHTS = (400, 500, 600, 700)
+UNICODE_RANGES = {
+    "arabic": "U+0600-06FF,U+0750-077F,U+0870-088E,U+0890-0891,U+0898-08E1,U+08E3-08FF,"
+    "U+200C-200E,U+2010-2011,U+204F,U+2E41,U+FB50-FDFF,U+FE70-FE74,U+FE76-FEFC",
+    "latin": "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,U+0304,U+0308,"
+    "U+0329,U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD",
+}
+
+# A font covers a subset only if it has the subset's letters, not just the shared punctuation
+SUBSET_PROBES = {"arabic": 0x0627, "latin": 0x0041}
+
+STATIC_WEIGHTS = {"Regular": 400, "Medium": 500, "SemiBold": 600, "Bold": 700}
+
+
+def parse_ranges(ranges):
+    codepoints = set()
+    for part in ranges.split(","):
+        start, _, end = part.strip()[2:].partition("-")
+        codepoints.update(range(int(start, 16), int(end or start, 16) + 1))
+    return codepoints
+
+
+def slug(family):
+    return re.sub(r"[^a-z0-9]+", "-", family.lower()).strip("-")
+
+
+def find_sources(source, family):
+    """Return {weight: (path, is_variable)} for the TTF files of a family"""
+    prefix = family.replace(" ", "")
+    found = {}
+    for path in glob.glob(os.path.join(source, "**", f"{prefix}*.ttf"), recursive=True):
+        name = os.path.basename(path)
+        if "[" in name and "wght" in name:
+            for weight in FONT_WEIGHTS:
+                found.setdefault(weight, (path, True))
+            continue
+        style = name[len(prefix) :].lstrip("-").rsplit(".", 1)[0]
+        if style in STATIC_WEIGHTS:
+            # Static files win over a variable instance
+            found[STATIC_WEIGHTS[style]] = (path, False)
+    return found
+
+
+def build_subset(path, is_variable, weight, subset_name):
+    font = TTFont(path)
+    if is_variable:
+        # Pin every axis: the weight, and the defaults of the others (slant, width, ...)
+        limits = {axis.axisTag: axis.defaultValue for axis in font["fvar"].axes}
+        limits["wght"] = weight
+        font = instancer.instantiateVariableFont(font, limits)
+
+    available = set(font.getBestCmap())
+    if SUBSET_PROBES[subset_name] not in available:
+        return None
+
+    options = subset.Options()
+    # fontTools' default features (shaping, kerning, ligatures); stylistic sets and
+    # alternates would pull in glyphs the stylesheets never select
+    options.hinting = False
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=available & parse_ranges(UNICODE_RANGES[subset_name]))
+    subsetter.subset(font)
+    font.flavor = "woff2"
+    return font
+
+
+def vendor_family(source, family):
+    """Write the subsets of one family and return its manifest entry"""
+    sources = find_sources(source, family)
+    if not sources:
+        sys.exit(f"No TTF files for {family} in {source}")
+
+    directory = os.path.join(FONTS_PATH, slug(family))
+    os.makedirs(directory, exist_ok=True)
+
+    entry = {}
+    for weight, (path, is_variable) in sorted(sources.items()):
+        for subset_name in UNICODE_RANGES:
+            font = build_subset(path, is_variable, weight, subset_name)
+            if font is None:
+                continue
+            filename = f"{slug(family)}-{weight}-{subset_name}.woff2"
+            font.save(os.path.join(directory, filename))
+            entry.setdefault(str(weight), {})[subset_name] = f"{slug(family)}/{filename}"
+            print(f"  {family} {weight} {subset_name:7} {os.path.getsize(os.path.join(directory, filename)):>8,} B")
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", required=True, help="directory with the families' TTF files")
+    parser.add_argument("families", nargs="+", help="family names, as selected in AhmadCSS Settings")
+    args = parser.parse_args()
+
+    manifest = {}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+
+    for family in args.families:
+        manifest[family] = vendor_family(args.source, family)
+
+    os.makedirs(FONTS_PATH, exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Manifest written to {os.path.relpath(MANIFEST_PATH)}")
+
+
+if __name__ == "__main__":
+    main()